@@ -0,0 +1,131 @@
+"""
+Validators, containers, records, writers and mappings benchmarks
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_core.py
+"""
+import io
+import datetime
+import timeit
+from fractions import Fraction
+
+from fusebox.core.containers import FieldContainer
+from fusebox.core.fields import IntegerField, StringField
+from fusebox.core.mappings import MappingIndex
+from fusebox.core.records import make_record_class
+from fusebox.core.utils import iter_chunks
+from fusebox.core.validators import (
+    MinLengthValidator, MaxLengthValidator, CompareValidator,
+    RangeValidator, RegexValidator, ValidatorChain
+)
+from fusebox.core.writers import JsonWriter, ValueEncoder
+from fusebox.orm.errors import ErrorTable
+
+import datasets
+
+
+def run_validators(number: int = 50000, repeat: int = 7) -> dict:
+    """ `validate` of passing values """
+    cases = {
+        'MinLengthValidator': (MinLengthValidator(100), 'short value'),
+        'MaxLengthValidator': (MaxLengthValidator(2), 'short value'),
+        'CompareValidator': (CompareValidator(10, '>=', '!='), 50),
+        'RangeValidator': (RangeValidator(0, 100), 50),
+        'RegexValidator': (RegexValidator(r'\w+@\w+\.com'), 'user@mail.com'),
+        'ValidatorChain (bounds)': (
+            ValidatorChain([RangeValidator(0, 100), CompareValidator(10, '>='), CompareValidator(90, '<')]),
+            50
+        ),
+    }
+
+    results = {}
+    for name, (validator, value) in cases.items():
+        validate = validator.validate
+        best = min(timeit.Timer(lambda: validate(value)).repeat(repeat=repeat, number=number))
+        results[f'{name} validate'] = best / number * 1e9
+
+    return results
+
+
+def run_containers(size: int = 10000, repeat: int = 5) -> dict:
+    """ `FieldContainer` and records building and conversion to dict """
+    fields = (StringField(name='name'), IntegerField(name='amount'))
+    names = datasets.make_strings(size, cardinality='low')
+    amounts = [int(i) for i in datasets.make_integers(size)]
+    record_class = make_record_class('Row', ('name', 'amount'))
+
+    def build_containers():
+        containers = []
+        for name, amount in zip(names, amounts):
+            container = FieldContainer()
+            container.add('name', fields[0], name)
+            container.add('amount', fields[1], amount)
+            containers.append(container)
+        return containers
+
+    containers = build_containers()
+    records = [record_class._make(i) for i in zip(names, amounts)]
+
+    results = {}
+    for name, func in (
+        ('FieldContainer add', build_containers),
+        ('FieldContainer as_dict', lambda: [i.as_dict() for i in containers]),
+        ('Record _make', lambda: [record_class._make(i) for i in zip(names, amounts)]),
+        ('Record as_dict', lambda: [i.as_dict() for i in records]),
+        ('Record get', lambda: [i['amount'] for i in records]),
+    ):
+        best = min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+        results[name] = best / size * 1e9
+
+    return results
+
+
+def run_writers(size: int = 20000, repeat: int = 5) -> dict:
+    """ Encoding of rows with dates and fractions """
+    rows = [
+        {'name': name, 'date': datetime.datetime(2020, 1, i % 28 + 1), 'share': Fraction(i % 7, 7)}
+        for (i, name) in enumerate(datasets.make_strings(size, cardinality='low'))
+    ]
+    encoder = ValueEncoder()
+
+    def write(output_format: str) -> None:
+        with JsonWriter(io.StringIO(), output_format=output_format) as writer:
+            writer.write_many(rows)
+
+    results = {}
+    for name, func in (
+        ('ValueEncoder datetime', lambda: [encoder(i['date']) for i in rows]),
+        ('JsonWriter ndjson', lambda: write('ndjson')),
+        ('JsonWriter json', lambda: write('json')),
+    ):
+        best = min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+        results[name] = best / size * 1e9
+
+    return results
+
+
+def run_misc(size: int = 50000, repeat: int = 5) -> dict:
+    """ Mappings index building, chunking and errors table """
+    keys = datasets.make_strings(size, cardinality='high')
+    mapping = {k: i for (i, k) in enumerate(keys)}
+
+    def add_errors():
+        table = ErrorTable(max_errors=1000)
+        for row, key in enumerate(keys):
+            table.add(row, 'name', 'error', 'message', key)
+
+    results = {}
+    for name, func in (
+        ('MappingIndex build (ignore_case)', lambda: MappingIndex(mapping, ignore_case=True)),
+        ('iter_chunks (100)', lambda: list(iter_chunks(keys, 100))),
+        ('ErrorTable add', add_errors),
+    ):
+        best = min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+        results[name] = best / size * 1e9
+
+    return results
+
+
+if __name__ == '__main__':
+    for case, ns in {**run_validators(), **run_containers(), **run_writers(), **run_misc()}.items():
+        print(f'{case:<40} {ns:>10.1f} ns/op')
@@ -0,0 +1,223 @@
+"""
+`Field.set` benchmarks
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_fields.py
+"""
+import timeit
+
+from fusebox.core.fields import (
+    Field, StringField, IntegerField,
+    FloatField, ArrayField, DateField
+)
+from fusebox.core.validators import RangeValidator, CompareValidator
+
+import datasets
+
+
+def profiled(field: Field) -> Field:
+    field.enable_profiling()
+    return field
+
+
+def get_cases() -> dict:
+    return {
+        'Field': (Field(name='field'), 'value'),
+        'Field (skip_values)': (Field(skip_values=[str(i) for i in range(50)]), 'value'),
+        'StringField': (StringField(max_length=100), 'some string value'),
+        'IntegerField': (IntegerField(), '12345'),
+        'IntegerField (profiled)': (profiled(IntegerField()), '12345'),
+        'IntegerField (validators)': (IntegerField(validators=[RangeValidator(0, 100000)]), '12345'),
+        'IntegerField (bounds chain)': (
+            IntegerField(validators=[
+                RangeValidator(0, 100000),
+                CompareValidator(10, '>='),
+                CompareValidator(50000, '<'),
+            ]),
+            '12345'
+        ),
+        'FloatField': (FloatField(), '12,5'),
+        'FloatField (fraction)': (FloatField(), '4 3/2'),
+        'DateField': (DateField(), '2020-04-05'),
+        'DateField (inferred format)': (DateField(), '04/05/2020'),
+        'DateField (fuzzy)': (DateField(infer_format=False), '04/05/2020'),
+        'ArrayField': (ArrayField(child_field=IntegerField()), '1,2,3,4'),
+    }
+
+
+def run(number: int = 20000, repeat: int = 7) -> dict:
+    results = {}
+    for name, (field, value) in get_cases().items():
+        timer = timeit.Timer(lambda: field.set(value))
+        best = min(timer.repeat(repeat=repeat, number=number))
+        results[name] = best / number * 1e9
+
+    return results
+
+
+def get_dataset_cases(size: int) -> dict:
+    """ Fields on datasets of different shapes (see `datasets`) """
+    return {
+        'StringField (short, low cardinality)': (
+            StringField(), datasets.make_strings(size, 'short', 'low')
+        ),
+        'StringField (short, high cardinality)': (
+            StringField(), datasets.make_strings(size, 'short', 'high')
+        ),
+        'StringField (long, high cardinality)': (
+            StringField(), datasets.make_strings(size, 'long', 'high')
+        ),
+        'IntegerField (clean)': (
+            IntegerField(raise_exception=False), datasets.make_integers(size)
+        ),
+        'IntegerField (10% dirty)': (
+            IntegerField(raise_exception=False), datasets.make_integers(size, dirty=0.1)
+        ),
+        'FloatField (clean)': (
+            FloatField(raise_exception=False), datasets.make_floats(size)
+        ),
+        'FloatField (10% dirty)': (
+            FloatField(raise_exception=False), datasets.make_floats(size, dirty=0.1)
+        ),
+        'DateField (ISO, low cardinality)': (
+            DateField(raise_exception=False), datasets.make_dates(size, cardinality='low')
+        ),
+        'DateField (ISO, high cardinality)': (
+            DateField(raise_exception=False), datasets.make_dates(size)
+        ),
+        'DateField (european, 10% dirty)': (
+            DateField(raise_exception=False), datasets.make_dates(size, '%d.%m.%Y', dirty=0.1)
+        ),
+        'ArrayField (clean)': (
+            ArrayField(child_field=IntegerField(), raise_exception=False), datasets.make_arrays(size)
+        ),
+        'ArrayField (10% dirty)': (
+            ArrayField(child_field=IntegerField(), raise_exception=False), datasets.make_arrays(size, dirty=0.1)
+        ),
+    }
+
+
+def run_datasets(size: int = 10000, repeat: int = 5) -> dict:
+    """ `Field.set` on datasets """
+    results = {}
+    for name, (field, values) in get_dataset_cases(size).items():
+        best = min(timeit.Timer(lambda: [field.set(v) for v in values]).repeat(repeat=repeat, number=1))
+        results[f'{name} set'] = best / size * 1e9
+
+    return results
+
+
+def run_batch(size: int = 100000, dirty: float = 0.1, repeat: int = 5) -> dict:
+    """ Compare `set` loop and `process_batch` on a dirty column """
+    step = int(1 / dirty)
+    values = ['abc' if i % step == 0 else str(i) for i in range(size)]
+    field = IntegerField(raise_exception=False, default=0)
+
+    def set_loop():
+        return [field.set(v) for v in values]
+
+    results = {}
+    for name, func in (('set loop', set_loop), ('process_batch', lambda: field.process_batch(values))):
+        best = min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+        results[f'IntegerField {name} ({dirty:.0%} dirty)'] = best / size * 1e9
+
+    return results
+
+
+def run_columns(size: int = 100000, repeat: int = 5) -> dict:
+    """ Compare `process_batch` and NumPy-backed `process_array` """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return {}
+
+    columns = (
+        ('IntegerField', IntegerField(), [str(i * 7 - size) for i in range(size)]),
+        ('FloatField', FloatField(), [f'{i},{i % 100}' for i in range(size)]),
+    )
+
+    results = {}
+    for name, field, values in columns:
+        for method in ('process_batch', 'process_array'):
+            func = getattr(field, method)
+            best = min(timeit.Timer(lambda: func(values)).repeat(repeat=repeat, number=1))
+            results[f'{name} {method}'] = best / size * 1e9
+
+    return results
+
+
+def run_arrays(length: int = 2000, number: int = 20, repeat: int = 5) -> dict:
+    """ `ArrayField` outputs and tokenizer on long arrays (ns per item) """
+    items = datasets.make_arrays(1, length=length)[0].split(',')
+    value = ','.join(items)
+
+    try:
+        import numpy  # noqa: F401
+        outputs = ('list', 'array', 'numpy', 'iter')
+    except ImportError:
+        outputs = ('list', 'array', 'iter')
+
+    # (field, input value, consume result)
+    cases = {
+        f'ArrayField {output} ({length} items)': (
+            ArrayField(child_field=IntegerField(), output=output), value, output == 'iter'
+        )
+        for output in outputs
+    }
+    cases.update({
+        f'ArrayField size limit exceeded ({length} items)': (
+            ArrayField(child_field=IntegerField(), size=10, raise_exception=False), value, False
+        ),
+        f'ArrayField multiple separators ({length} items)': (
+            ArrayField(child_field=IntegerField(), multiple_separators=True),
+            ''.join(i + '-,'[n % 2] for (n, i) in enumerate(items))[:-1], False
+        ),
+        # Groups of 10 items
+        f'ArrayField nested ({length} items)': (
+            ArrayField(child_field=IntegerField(), separators=(',',), nested_separators=(';',)),
+            ';'.join(','.join(items[i:i + 10]) for i in range(0, length, 10)), False
+        ),
+        f'ArrayField quoted ({length} items)': (
+            ArrayField(child_field=IntegerField(), separators=(',',), quote='"'),
+            ','.join(f'"{i}"' for i in items), False
+        ),
+    })
+
+    results = {}
+    for name, (field, case_value, consume) in cases.items():
+        if consume:
+            func = lambda: list(field.parse(case_value))  # noqa: E731
+        else:
+            func = lambda: field.parse(case_value)  # noqa: E731
+
+        best = min(timeit.Timer(func).repeat(repeat=repeat, number=number))
+        results[name] = best / number / length * 1e9
+
+    return results
+
+
+def run_floats(number: int = 20000, repeat: int = 7) -> dict:
+    """ `FloatField` by shape of input (ns per value) """
+    cases = {
+        'FloatField clean': (FloatField(), '1234.5'),
+        'FloatField decimal comma': (FloatField(), '1234,5'),
+        'FloatField en thousands': (FloatField(), '1,234,567.5'),
+        'FloatField fr spaces': (FloatField(), '1 234 567,5'),
+        'FloatField locale de': (FloatField(locale='de'), '1.234.567,5'),
+        'FloatField mixed fraction': (FloatField(), '3 1/2'),
+        'FloatField fraction': (FloatField(), '1/3'),
+        'FloatField garbage': (FloatField(raise_exception=False), '12a.5'),
+    }
+
+    results = {}
+    for name, (field, value) in cases.items():
+        best = min(timeit.Timer(lambda: field.parse(value)).repeat(repeat=repeat, number=number))
+        results[name] = best / number * 1e9
+
+    return results
+
+
+if __name__ == '__main__':
+    results = {**run(), **run_datasets(), **run_batch(), **run_columns(), **run_arrays(), **run_floats()}
+    for case, ns in results.items():
+        print(f'{case:<40} {ns:>10.1f} ns/op')
@@ -0,0 +1,73 @@
+"""
+Handlers benchmarks
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_handlers.py
+"""
+import os
+import random
+import tempfile
+import timeit
+
+from fusebox.core.etc import INDEX_ALL
+from fusebox.core.handlers import Mapper, Regex, RegexSet
+from fusebox.core.mappings import MappingIndex, MappedIndex
+
+
+def run_mapper(size: int = 200000, lookups: int = 10000, repeat: int = 5) -> dict:
+    mapping = {f'SKU-{i}': f'category-{i % 50}' for i in range(size)}
+    keys = [f'sku-{random.randrange(size)}' for _ in range(lookups)]
+
+    index = MappingIndex(mapping, ignore_case=True)
+    path = os.path.join(tempfile.mkdtemp(), 'mapping.idx')
+    index.save(path)
+
+    results = {}
+    with MappedIndex(path) as mapped_index:
+        for name, mapper in (('Mapper (dict)', Mapper(index)), ('Mapper (mmap)', Mapper(mapped_index))):
+            best = min(timeit.Timer(lambda: [mapper.handle(k) for k in keys]).repeat(repeat=repeat, number=1))
+            results[f'{name} handle'] = best / lookups * 1e9
+
+            best = min(timeit.Timer(lambda: mapper.handle_many(keys)).repeat(repeat=repeat, number=1))
+            results[f'{name} handle_many'] = best / lookups * 1e9
+
+    os.remove(path)
+    return results
+
+
+def run_regex(size: int = 20000, repeat: int = 5) -> dict:
+    """ Chained `Regex` tries vs `RegexSet` """
+    patterns = [r'(\w+)@(\w+)\.com', r'\+7(\d{10})', r'(\d{4})-(\d{2})-(\d{2})', r'id:(\d+)']
+    samples = ['user@mail.com', 'tel +79991234567', 'date 2020-04-05', 'id:42', 'nothing here']
+    values = [random.choice(samples) for _ in range(size)]
+    handlers = [Regex(p, index=INDEX_ALL()) for p in patterns]
+    regex_set = RegexSet(patterns, index=INDEX_ALL())
+
+    def try_all():
+        collect = []
+        for value in values:
+            for handler in handlers:
+                try:
+                    collect.append(handler.handle(value))
+                    break
+                except Exception:
+                    pass
+            else:
+                collect.append(None)
+        return collect
+
+    results = {}
+    for name, func in (
+        ('Regex chain', try_all),
+        ('RegexSet match', lambda: [regex_set.match(v) for v in values]),
+        ('RegexSet match_many', lambda: regex_set.match_many(values)),
+    ):
+        best = min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+        results[name] = best / size * 1e9
+
+    return results
+
+
+if __name__ == '__main__':
+    for case, ns in {**run_mapper(), **run_regex()}.items():
+        print(f'{case:<40} {ns:>10.1f} ns/op')
@@ -0,0 +1,237 @@
+"""
+Serializers benchmarks
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_serializers.py
+"""
+import os
+import sqlite3
+import tempfile
+import timeit
+import tracemalloc
+
+from fusebox.orm.fields import StringField, IntegerField, DateField
+from fusebox.orm.serializers import Serializer, ModelSerializer
+
+
+class UserSerializer(Serializer):
+    email = StringField(required=True)
+    username = StringField(required=True)
+    firstname = StringField()
+    lastname = StringField()
+    age = IntegerField(required=True)
+
+
+def run_init(number: int = 20000, repeat: int = 7) -> dict:
+    """ Serializer per request """
+    data = {'email': 'email@email.com', 'username': 'username', 'age': '16'}
+
+    results = {}
+    for name, func in (
+        ('Serializer()', lambda: UserSerializer(data=data)),
+        ('Serializer(only=...)', lambda: UserSerializer(data=data, only=('email', 'username', 'age'))),
+        ('Serializer().handle()', lambda: UserSerializer(data=data).handle()),
+    ):
+        best = min(timeit.Timer(func).repeat(repeat=repeat, number=number))
+        results[name] = best / number * 1e9
+
+    return results
+
+
+# Rows kinds and serializer arguments
+ROWS_KINDS = (
+    ('dict', {'compiled': True}),
+    ('field dict', {'as_field_dict': True}),
+    ('record', {'as_record': True}),
+)
+
+
+def run_rows(size: int = 20000, repeat: int = 5) -> dict:
+    """ Compare interpreted and generated row handlers """
+    rows = [
+        {'email': f'user{i}@email.com', 'username': f'user{i}', 'firstname': 'Name', 'age': str(i % 80)}
+        for i in range(size)
+    ]
+
+    results = {}
+    for name, compiled in (('interpreted', False), ('compiled', True)):
+        serializer = UserSerializer(data=rows, compiled=compiled)
+        best = min(timeit.Timer(serializer.handle).repeat(repeat=repeat, number=1))
+        results[f'Serializer.handle ({name})'] = best / size * 1e9
+
+    return results
+
+
+def run_records(size: int = 20000, repeat: int = 5) -> dict:
+    """ Compare dict rows, `FieldContainer` rows and records """
+    rows = [
+        {'email': f'user{i}@email.com', 'username': f'user{i}', 'firstname': 'Name', 'age': str(i % 80)}
+        for i in range(size)
+    ]
+
+    results = {}
+    for name, kwargs in ROWS_KINDS:
+        serializer = UserSerializer(data=rows, **kwargs)
+        best = min(timeit.Timer(serializer.handle).repeat(repeat=repeat, number=1))
+        results[f'Serializer.handle ({name})'] = best / size * 1e9
+
+    return results
+
+
+def run_records_memory(size: int = 20000) -> dict:
+    """ Memory of one row (bytes), values are shared between rows kinds """
+    rows = [
+        {'email': f'user{i}@email.com', 'username': f'user{i}', 'firstname': 'Name', 'age': i % 80 + 1}
+        for i in range(size)
+    ]
+
+    results = {}
+    for name, kwargs in ROWS_KINDS:
+        serializer = UserSerializer(data=rows, **kwargs)
+        tracemalloc.start()
+        handled = serializer.handle()
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        results[f'Serializer rows memory ({name})'] = memory / size
+        del handled
+
+    return results
+
+
+class EventSerializer(Serializer):
+    name = StringField(required=True)
+    amount = IntegerField()
+    date = DateField()
+
+
+def run_dump(size: int = 50000, repeat: int = 3) -> dict:
+    """ Compare processing with processing and writing to disk """
+    rows = [{'name': f'event{i}', 'amount': str(i), 'date': f'2020-01-{i % 28 + 1:02}'} for i in range(size)]
+    serializer = EventSerializer(compiled=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'rows.json')
+
+        def dump(output_format: str) -> None:
+            with open(path, 'w') as file:
+                serializer.dump(file, rows, output_format=output_format)
+
+        results = {}
+        for name, func in (
+            ('process', lambda: list(serializer.iter_handle(rows))),
+            ('process, dump ndjson', lambda: dump('ndjson')),
+            ('process, dump json', lambda: dump('json')),
+        ):
+            best = min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+            results[f'Serializer rows ({name})'] = best / size * 1e9
+
+    return results
+
+
+def run_errors(size: int = 20000, repeat: int = 5) -> dict:
+    """ Errors collection: valid rows and rows with 1% of errors """
+    rows = [
+        {'email': f'user{i}@email.com', 'username': f'user{i}', 'firstname': 'Name', 'age': str(i % 80)}
+        for i in range(size)
+    ]
+    failed = [dict(row, age='x') if i % 100 == 0 else row for (i, row) in enumerate(rows)]
+    serializer = UserSerializer(compiled=True)
+
+    results = {}
+    for name, func in (
+        ('with_errors, valid', lambda: list(serializer.iter_handle(rows, with_errors=True))),
+        ('handle_collect, valid', lambda: serializer.handle_collect(rows)),
+        ('handle_collect, 1% errors', lambda: serializer.handle_collect(failed)),
+    ):
+        best = min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+        results[f'Serializer {name}'] = best / size * 1e9
+
+    return results
+
+
+class State:
+    def __init__(self, values: dict) -> None:
+        self.dict = values
+
+
+class User:
+    """ SQLAlchemy-like model """
+
+    def __init__(self, i: int) -> None:
+        self._sa_instance_state = State({'id': i, 'username': f'user{i}', 'email': f'user{i}@email.com', 'age': i % 80})
+
+
+class UserModelSerializer(ModelSerializer):
+    class Meta:
+        model = User
+        fields = ('id', 'username', 'email', 'age')
+
+
+def run_models(size: int = 20000, repeat: int = 5) -> dict:
+    """ Bulk `ModelSerializer(many=True)` """
+    users = [User(i) for i in range(size)]
+
+    results = {}
+    best = min(timeit.Timer(lambda: UserModelSerializer(users, many=True).handle()).repeat(repeat=repeat, number=1))
+    results['ModelSerializer(many=True).handle'] = best / size * 1e9
+    return results
+
+
+def run_cursor(size: int = 50000, repeat: int = 5) -> dict:
+    """ Compare cursor rows handling and dicts built from rows """
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE users (email TEXT, username TEXT, firstname TEXT, age TEXT)')
+    connection.executemany(
+        'INSERT INTO users VALUES (?, ?, ?, ?)',
+        [(f'user{i}@email.com', f'user{i}', 'Name', str(i % 80)) for i in range(size)]
+    )
+    query = 'SELECT email, username, firstname, age FROM users'
+    serializer = UserSerializer()
+
+    def rows_as_dicts():
+        cursor = connection.execute(query)
+        columns = [i[0] for i in cursor.description]
+        return list(serializer.iter_handle(dict(zip(columns, row)) for row in cursor))
+
+    results = {}
+    for name, func in (
+        ('iter_handle (dicts)', rows_as_dicts),
+        ('iter_cursor', lambda: list(serializer.iter_cursor(connection.execute(query)))),
+    ):
+        best = min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+        results[f'Serializer cursor rows, {name}'] = best / size * 1e9
+
+    connection.close()
+    return results
+
+
+def run_parallel(size: int = 200000, workers: int = None) -> dict:
+    """ Compare serial and process pool paths """
+    rows = [
+        {'email': f'user{i}@email.com', 'username': f'user{i}', 'firstname': 'Name', 'age': str(i % 80)}
+        for i in range(size)
+    ]
+    serializer = UserSerializer(compiled=True)
+
+    results = {}
+    for name, func in (
+        ('serial', lambda: list(serializer.iter_handle(rows))),
+        ('parallel', lambda: list(serializer.handle_parallel(rows, max_workers=workers))),
+        ('parallel, unordered', lambda: list(serializer.handle_parallel(rows, max_workers=workers, ordered=False))),
+    ):
+        best = min(timeit.Timer(func).repeat(repeat=3, number=1))
+        results[f'Serializer rows ({name})'] = best / size * 1e9
+
+    return results
+
+
+if __name__ == '__main__':
+    for case, ns in {
+        **run_init(), **run_rows(), **run_records(), **run_dump(), **run_errors(),
+        **run_models(), **run_cursor(), **run_parallel()
+    }.items():
+        print(f'{case:<40} {ns:>10.1f} ns/op')
+
+    for case, size in run_records_memory().items():
+        print(f'{case:<40} {size:>10.1f} bytes/row')
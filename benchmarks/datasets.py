@@ -0,0 +1,102 @@
+"""
+Synthetic datasets for benchmarks.
+
+Datasets are generated by seeded `random.Random`, so every run gets the same values.
+Shapes:
+    * clean - all values are valid, dirty - `dirty` share of values are garbage
+    * short/long strings
+    * low cardinality (values are repeated) / high cardinality (almost all values are unique)
+"""
+import random
+import string
+from typing import Callable, List
+
+
+SEED = 1337
+
+# Number of unique values of low cardinality datasets
+LOW_CARDINALITY = 50
+
+SHORT_LENGTH = (4, 12)
+LONG_LENGTH = (200, 1000)
+
+GARBAGE = ('', 'n/a', 'NULL', '--', 'abc', '12a', ' ')
+
+
+def _make_values(make_value: Callable[[random.Random], str], size: int, cardinality: str, dirty: float) -> List[str]:
+    rnd = random.Random(SEED)
+    if cardinality == 'low':
+        pool = [make_value(rnd) for _ in range(LOW_CARDINALITY)]
+        values = [rnd.choice(pool) for _ in range(size)]
+    else:
+        values = [make_value(rnd) for _ in range(size)]
+
+    if dirty:
+        for index in rnd.sample(range(size), int(size * dirty)):
+            values[index] = rnd.choice(GARBAGE)
+
+    return values
+
+
+def make_strings(size: int, length: str = 'short', cardinality: str = 'high', dirty: float = 0.0) -> List[str]:
+    low, high = SHORT_LENGTH if length == 'short' else LONG_LENGTH
+    alphabet = string.ascii_letters + string.digits + ' '
+
+    def make_value(rnd: random.Random) -> str:
+        return ''.join(rnd.choices(alphabet, k=rnd.randint(low, high)))
+
+    return _make_values(make_value, size, cardinality, dirty)
+
+
+def make_integers(size: int, cardinality: str = 'high', dirty: float = 0.0) -> List[str]:
+    return _make_values(lambda rnd: str(rnd.randint(-10 ** 6, 10 ** 6)), size, cardinality, dirty)
+
+
+def make_floats(size: int, cardinality: str = 'high', dirty: float = 0.0) -> List[str]:
+    def make_value(rnd: random.Random) -> str:
+        value = f'{rnd.uniform(-10 ** 4, 10 ** 4):.{rnd.randint(1, 4)}f}'
+        return value.replace('.', ',') if rnd.random() < 0.5 else value
+
+    return _make_values(make_value, size, cardinality, dirty)
+
+
+def make_dates(size: int, date_format: str = '%Y-%m-%d', cardinality: str = 'high', dirty: float = 0.0) -> List[str]:
+    def make_value(rnd: random.Random) -> str:
+        return f'{rnd.randint(1970, 2030):04}-{rnd.randint(1, 12):02}-{rnd.randint(1, 28):02}'
+
+    values = _make_values(make_value, size, cardinality, dirty)
+    if date_format == '%Y-%m-%d':
+        return values
+
+    # Reformat valid values only
+    return [
+        f'{v[8:10]}.{v[5:7]}.{v[0:4]}' if date_format == '%d.%m.%Y' and len(v) == 10 else v
+        for v in values
+    ]
+
+
+def make_arrays(size: int, length: int = 5, separator: str = ',', dirty: float = 0.0) -> List[str]:
+    def make_value(rnd: random.Random) -> str:
+        return separator.join(str(rnd.randint(0, 1000)) for _ in range(length))
+
+    return _make_values(make_value, size, 'high', dirty)
+
+
+def make_rows(size: int, dirty: float = 0.0) -> List[dict]:
+    """ Rows of user-like records (see `bench_serializers.UserSerializer`) """
+    rnd = random.Random(SEED)
+    rows = [
+        {
+            'email': f'user{i}@email.com',
+            'username': f'user{i}',
+            'firstname': rnd.choice(('Name', 'Other', 'Third')),
+            'age': str(rnd.randint(1, 99)),
+        }
+        for i in range(size)
+    ]
+
+    if dirty:
+        for index in rnd.sample(range(size), int(size * dirty)):
+            rows[index] = dict(rows[index], age=rnd.choice(GARBAGE[1:]))
+
+    return rows
@@ -0,0 +1,182 @@
+"""
+Benchmarks suite
+
+Runs all benchmarks, saves results as JSON and compares them with baseline.
+Results of `compare` are regressions, if current value is bigger than baseline more than `threshold`.
+Everything runs offline.
+
+Usage:
+    PYTHONPATH=src python benchmarks/run.py run --output results.json
+    PYTHONPATH=src python benchmarks/run.py run --only fields,serializers --repeat 3
+    PYTHONPATH=src python benchmarks/run.py compare baseline.json results.json --threshold 0.1
+"""
+import sys
+import json
+import inspect
+import argparse
+import datetime
+import platform
+from typing import Callable, Dict, List, Tuple
+
+import bench_core
+import bench_fields
+import bench_handlers
+import bench_serializers
+
+
+# Benchmarks by groups
+#   * group name
+#   * benchmark function (returns dict of cases values)
+#   * unit of values
+SUITE: Tuple[Tuple[str, Callable[..., dict], str], ...] = (
+    ('fields', bench_fields.run, 'ns/op'),
+    ('fields', bench_fields.run_datasets, 'ns/op'),
+    ('fields', bench_fields.run_batch, 'ns/op'),
+    ('fields', bench_fields.run_columns, 'ns/op'),
+    ('fields', bench_fields.run_arrays, 'ns/op'),
+    ('fields', bench_fields.run_floats, 'ns/op'),
+    ('handlers', bench_handlers.run_mapper, 'ns/op'),
+    ('handlers', bench_handlers.run_regex, 'ns/op'),
+    ('core', bench_core.run_validators, 'ns/op'),
+    ('core', bench_core.run_containers, 'ns/op'),
+    ('core', bench_core.run_writers, 'ns/op'),
+    ('core', bench_core.run_misc, 'ns/op'),
+    ('serializers', bench_serializers.run_init, 'ns/op'),
+    ('serializers', bench_serializers.run_rows, 'ns/op'),
+    ('serializers', bench_serializers.run_records, 'ns/op'),
+    ('serializers', bench_serializers.run_records_memory, 'bytes/row'),
+    ('serializers', bench_serializers.run_dump, 'ns/op'),
+    ('serializers', bench_serializers.run_errors, 'ns/op'),
+    ('serializers', bench_serializers.run_models, 'ns/op'),
+    ('serializers', bench_serializers.run_cursor, 'ns/op'),
+    ('parallel', bench_serializers.run_parallel, 'ns/op'),
+)
+
+# Default max allowed slowdown (10%)
+DEFAULT_THRESHOLD = 0.1
+
+
+def get_meta() -> dict:
+    try:
+        from importlib.metadata import version
+        fusebox_version = version('fusebox')
+    except Exception:
+        fusebox_version = None
+
+    return {
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'fusebox': fusebox_version,
+    }
+
+
+def run_suite(groups: List[str] = None, repeat: int = None, verbose: bool = True) -> dict:
+    """
+    Run benchmarks
+
+    Args:
+        groups (list): groups to run. By default, all groups
+        repeat (int): override number of repeats of benchmarks
+        verbose (bool): print cases while they're running
+    """
+    cases = {}
+    for group, func, unit in SUITE:
+        if groups and group not in groups:
+            continue
+
+        kwargs = {}
+        if repeat is not None and 'repeat' in inspect.signature(func).parameters:
+            kwargs['repeat'] = repeat
+
+        for name, value in func(**kwargs).items():
+            cases[f'{group}: {name}'] = {'value': value, 'unit': unit}
+            if verbose:
+                print(f'{group + ": " + name:<60} {value:>12.1f} {unit}', flush=True)
+
+    return {'meta': get_meta(), 'cases': cases}
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> Dict[str, list]:
+    """
+    Compare results with baseline
+
+    Returns:
+        report (dict): `regressions`, `improvements` and `unchanged` - lists of
+        (case, baseline value, current value, change) tuples, and `missing` and `new` cases
+    """
+    report = {'regressions': [], 'improvements': [], 'unchanged': [], 'missing': [], 'new': []}
+    baseline_cases = baseline['cases']
+    current_cases = current['cases']
+
+    for name, case in baseline_cases.items():
+        if name not in current_cases:
+            report['missing'].append(name)
+            continue
+
+        old, new = case['value'], current_cases[name]['value']
+        change = (new - old) / old if old else 0.0
+        if change > threshold:
+            report['regressions'].append((name, old, new, change))
+        elif change < -threshold:
+            report['improvements'].append((name, old, new, change))
+        else:
+            report['unchanged'].append((name, old, new, change))
+
+    report['new'] = [name for name in current_cases if name not in baseline_cases]
+    return report
+
+
+def print_report(report: Dict[str, list]) -> None:
+    for title in ('regressions', 'improvements', 'unchanged'):
+        if report[title]:
+            print(f'\n{title.capitalize()}:')
+            for name, old, new, change in report[title]:
+                print(f'  {name:<60} {old:>12.1f} -> {new:>12.1f} ({change:+.1%})')
+
+    for title in ('missing', 'new'):
+        if report[title]:
+            print(f'\n{title.capitalize()} cases:')
+            for name in report[title]:
+                print(f'  {name}')
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='fusebox benchmarks suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run benchmarks')
+    run_parser.add_argument('--output', help='path of JSON results')
+    run_parser.add_argument('--only', help='comma-separated groups: ' + ', '.join(dict.fromkeys(i[0] for i in SUITE)))
+    run_parser.add_argument('--repeat', type=int, help='number of repeats of every benchmark')
+
+    compare_parser = commands.add_parser('compare', help='compare results with baseline')
+    compare_parser.add_argument('baseline', help='path of baseline JSON results')
+    compare_parser.add_argument('current', help='path of current JSON results')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help='max allowed slowdown (0.1 - 10%%)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        groups = args.only.split(',') if args.only else None
+        results = run_suite(groups, args.repeat)
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump(results, file, indent=2)
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+
+    report = compare(baseline, current, args.threshold)
+    print_report(report)
+    return 1 if report['regressions'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,83 @@
-from fusebox.core.fields import *
-from fusebox.core.handlers import *
-from fusebox.core.etc import *
-from fusebox.core.validators import *
-from fusebox.core.utils import *
-from fusebox.core.exceptions import *
-from fusebox.core.containers import *
-from fusebox.orm.serializers import *
+"""
+Fusebox. Useful tools to work with data
+
+Names are imported lazily (PEP 562), so `import fusebox` doesn't load
+submodules and their dependencies until they're used
+"""
+import importlib
+
+
+# Modules of public names. Order is the same as star-imports order was
+_MODULES = (
+    ('fusebox.core.fields', (
+        'Field', 'StringField', 'IntegerField', 'FloatField', 'DateField', 'ArrayField',
+    )),
+    ('fusebox.core.handlers', (
+        'IHandler', 'IAsyncHandler', 'Mapper', 'Regex', 'RegexSet',
+    )),
+    ('fusebox.core.mappings', (
+        'MappingIndex', 'MappedIndex',
+    )),
+    ('fusebox.core.etc', (
+        'DEFAULT_ARRAY_SEPARATORS', 'DEFAULT_FLOAT_SEPARATORS', 'NUMBER_LOCALES',
+        'AMERICAN_DATE_FORMAT', 'AMERICAN_DATETIME_FORMAT',
+        'EUROPEAN_DATE_FORMAT', 'EUROPEAN_DATETIME_FORMAT',
+        'DEFAULT_REGEX_INDEX', 'INDEX_ALL', 'LIMITLESS_ARRAY',
+        'DATE_REGEX', 'DATE_INPUT_FORMATS', 'EMPTY_VALUE', 'DEFAULT_FROM_INPUT',
+        'STATUS_OK', 'STATUS_NULL', 'STATUS_SKIP', 'STATUS_ERROR',
+    )),
+    ('fusebox.core.validators', (
+        'EmailValidator', 'MinLengthValidator', 'MaxLengthValidator', 'RangeValidator',
+        'CompareValidator', 'RegexValidator', 'ValidatorChain',
+    )),
+    ('fusebox.core.utils', (
+        'get_separator', 'import_numpy', 'iter_chunks',
+    )),
+    ('fusebox.core.exceptions', (
+        'ArraySizeLimitError', 'RegexError', 'HandlerError',
+    )),
+    ('fusebox.core.tokenizers', (
+        'ArrayTokenizer',
+    )),
+    ('fusebox.core.numbers', (
+        'NumberParser',
+    )),
+    ('fusebox.core.containers', (
+        'FieldContainer',
+    )),
+    ('fusebox.core.records', (
+        'Record', 'make_record_class',
+    )),
+    ('fusebox.core.writers', (
+        'ValueEncoder', 'JsonWriter', 'encode_value',
+    )),
+    ('fusebox.core.profiling', (
+        'StageStats', 'FieldStats', 'ProfileReport',
+    )),
+    ('fusebox.orm.serializers', (
+        'Serializer', 'ModelSerializer',
+    )),
+)
+
+_LAZY_NAMES = {name: module for (module, names) in _MODULES for name in names}
+
+_SUBMODULES = ('core', 'orm')
+
+__all__ = tuple(_LAZY_NAMES)
+
+
+def __getattr__(name: str):
+    module = _LAZY_NAMES.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module), name)
+        globals()[name] = value
+        return value
+
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_SUBMODULES))
@@ -0,0 +1,264 @@
+"""
+Columnar processing for numeric fields.
+
+Whole column is parsed by NumPy in one vectorized pass,
+only leftovers (fractions, bad values, etc.) are processed by field's scalar path.
+NumPy is an optional dependency
+"""
+from typing import Any, Sequence, Tuple
+
+from fusebox.core.etc import STATUS_OK, STATUS_NULL, STATUS_ERROR
+from fusebox.core.utils import import_numpy
+
+
+__all__ = (
+    'parse_integers',
+    'parse_floats',
+    'process_numeric_column',
+)
+
+# Max digits that can be stored in `int64` without overflow
+MAX_INTEGER_DIGITS = 18
+
+# Max exact integer of `float64` mantissa and max exact power of ten.
+# Numbers out of these limits are parsed by scalar path to keep correct rounding
+MAX_EXACT_MANTISSA = 2 ** 53
+MAX_EXACT_POWER = 22
+
+# Longest string that can be parsed in vectorized way
+MAX_NUMBER_LENGTH = 32
+
+_ZERO = ord('0')
+_PLUS = ord('+')
+_MINUS = ord('-')
+_DOT = ord('.')
+_EXP = ord('e')
+_EXP_UPPER = ord('E')
+
+
+def _code_points(np, strings, lengths):
+    """
+    Convert strings to (width × rows) matrix of code points.
+    Column-major layout makes reductions over characters cheap
+    """
+    width = max(int(lengths.max()), 1)
+    strings = strings.astype(f'<U{width}')
+    return np.ascontiguousarray(strings.view('<u4').reshape(len(strings), width).T)
+
+
+def _count(np, mask):
+    return mask.sum(axis=0, dtype=np.int8)
+
+
+def _first(np, mask, default):
+    """ Index of the first `True` character or `default` """
+    position = default
+    for column in range(mask.shape[0] - 1, -1, -1):
+        position = np.where(mask[column], column, position)
+    return position
+
+
+def _horner(np, digits, mask):
+    """ Collect digits from left to right by mask """
+    number = np.zeros(digits.shape[1], dtype=np.int64)
+    for column in range(digits.shape[0]):
+        number = np.where(mask[column], number * 10 + digits[column], number)
+    return number
+
+
+def parse_integers(np, strings) -> Tuple[Any, Any]:
+    """
+    Parse stripped strings as integers
+
+    Returns:
+        values (ndarray): `int64` array
+        parsed (ndarray): boolean mask of parsed values
+    """
+    size = len(strings)
+    values = np.zeros(size, dtype=np.int64)
+    parsed = np.zeros(size, dtype=bool)
+
+    lengths = np.char.str_len(strings)
+    candidates = np.flatnonzero((lengths > 0) & (lengths <= MAX_INTEGER_DIGITS + 1))
+    if not candidates.size:
+        return values, parsed
+
+    lengths = lengths[candidates]
+    codes = _code_points(np, strings[candidates], lengths)
+
+    columns = np.arange(codes.shape[0])[:, None]
+    inside = columns < lengths
+    signed = (codes[0] == _PLUS) | (codes[0] == _MINUS)
+    sign_mask = (columns == 0) & signed
+
+    digits = codes - _ZERO
+    is_digit = (digits <= 9) & inside
+
+    count = _count(np, is_digit)
+    valid = (
+        np.all(is_digit | sign_mask | ~inside, axis=0)
+        & (count > 0)
+        & (count <= MAX_INTEGER_DIGITS)
+    )
+
+    number = _horner(np, digits, is_digit)
+    number = np.where(codes[0] == _MINUS, -number, number)
+
+    values[candidates[valid]] = number[valid]
+    parsed[candidates[valid]] = True
+    return values, parsed
+
+
+def parse_floats(np, strings, separators: Sequence[str] = (), dot_decimal: bool = True) -> Tuple[Any, Any]:
+    """
+    Parse stripped strings as floats.
+    The first separator found in string is used as decimal point (like `get_separator` does).
+    If `dot_decimal` is disabled, `.` isn't decimal point (f.e. it's thousands separator of locale),
+    so such strings are left to the scalar path
+
+    Returns:
+        values (ndarray): `float64` array
+        parsed (ndarray): boolean mask of parsed values
+    """
+    size = len(strings)
+    values = np.zeros(size, dtype=np.float64)
+    parsed = np.zeros(size, dtype=bool)
+
+    lengths = np.char.str_len(strings)
+    candidates = np.flatnonzero((lengths > 0) & (lengths <= MAX_NUMBER_LENGTH))
+    if not candidates.size:
+        return values, parsed
+
+    lengths = lengths[candidates]
+    codes = _code_points(np, strings[candidates], lengths)
+    width = codes.shape[0]
+    columns = np.arange(width)[:, None]
+    inside = columns < lengths
+
+    # Decimal point: `.` or the first separator found in string
+    is_dot = codes == _DOT if dot_decimal else np.zeros(codes.shape, dtype=bool)
+    pending = np.ones(codes.shape[1], dtype=bool)
+    for separator in separators:
+        is_separator = codes == ord(separator)
+        found = is_separator.any(axis=0) & pending
+        is_dot |= is_separator & found
+        pending &= ~found
+
+    is_exp = (codes == _EXP) | (codes == _EXP_UPPER)
+    exp_pos = _first(np, is_exp, lengths)
+    has_exp = exp_pos < lengths
+    dot_pos = _first(np, is_dot, exp_pos)
+
+    exp_sign_mask = (columns == exp_pos + 1) & inside & ((codes == _PLUS) | (codes == _MINUS))
+    exp_signed = exp_sign_mask.any(axis=0)
+    exp_negative = (exp_sign_mask & (codes == _MINUS)).any(axis=0)
+
+    sign_mask = ((columns == 0) & ((codes[0] == _PLUS) | (codes[0] == _MINUS))) | exp_sign_mask
+
+    digits = codes - _ZERO
+    is_digit = (digits <= 9) & inside
+    mantissa_mask = is_digit & (columns < exp_pos)
+    fraction_mask = mantissa_mask & (columns > dot_pos)
+    exponent_mask = is_digit & (columns > exp_pos)
+
+    mantissa_count = _count(np, mantissa_mask)
+    exponent_count = _count(np, exponent_mask)
+
+    valid = (
+        np.all(is_digit | sign_mask | is_dot | is_exp | ~inside, axis=0)
+        & (_count(np, is_dot) <= 1)
+        & (_count(np, is_exp) <= 1)
+        & (dot_pos <= exp_pos)
+        & (mantissa_count > 0)
+        & (mantissa_count <= MAX_INTEGER_DIGITS)
+        & (~has_exp | ((exponent_count > 0) & (exponent_count <= 3)))
+    )
+
+    mantissa = _horner(np, digits, mantissa_mask)
+    exponent = _horner(np, digits, exponent_mask)
+    exponent = np.where(exp_negative, -exponent, exponent) - _count(np, fraction_mask)
+
+    # Exact (correctly rounded) fast path only
+    valid &= (mantissa <= MAX_EXACT_MANTISSA) & (np.abs(exponent) <= MAX_EXACT_POWER)
+
+    powers = 10.0 ** np.arange(MAX_EXACT_POWER + 1)
+    power = powers[np.clip(np.abs(exponent), 0, MAX_EXACT_POWER)]
+    number = np.where(exponent >= 0, mantissa * power, mantissa / power)
+    number = np.where(codes[0] == _MINUS, -number, number)
+
+    values[candidates[valid]] = number[valid]
+    parsed[candidates[valid]] = True
+    return values, parsed
+
+
+def process_numeric_column(
+    field,
+    values: Sequence[Any],
+    dtype: str,
+    vectorize: bool = True,
+    separators: Sequence[str] = (),
+    fill_value: Any = None,
+    dot_decimal: bool = True,
+) -> Tuple[Any, Any]:
+    """
+    Process column of numeric values
+
+    Args:
+        field (Field): `IntegerField` or `FloatField` instance
+        values (Sequence): sequence of raw values
+        dtype (str): `int64` or `float64`
+        vectorize (bool): use vectorized parser. Otherwise, only scalar path will be used
+        separators (Sequence): decimal separators for floats
+        dot_decimal (bool): `.` is decimal point of floats
+        fill_value (Any): value for failed rows. By default, it's field's numeric `default`,
+        `NaN` for floats or `0` for integers
+
+    Returns:
+        results (ndarray): typed array
+        statuses (ndarray): `uint8` array of row statuses (see `Field.process_batch`)
+    """
+    np = import_numpy()
+
+    if fill_value is None:
+        if isinstance(field.default, (int, float)):
+            fill_value = field.default
+        else:
+            fill_value = float('nan') if dtype == 'float64' else 0
+
+    size = len(values)
+    results = np.full(size, fill_value, dtype=dtype)
+    statuses = np.zeros(size, dtype=np.uint8)
+    done = np.zeros(size, dtype=bool)
+
+    # Only one-char separators are supported by vectorized parser
+    if any(len(separator) != 1 for separator in separators):
+        vectorize = False
+
+    if vectorize and size:
+        strings = np.asarray(values, dtype=np.str_)
+        if strings.ndim == 1:
+            strings = np.char.strip(strings)
+            if dtype == 'int64':
+                parsed, done = parse_integers(np, strings)
+            else:
+                parsed, done = parse_floats(np, strings, separators, dot_decimal)
+
+            results[done] = parsed[done]
+
+    # Leftovers go through the scalar path
+    leftovers = np.flatnonzero(~done).tolist()
+    if leftovers:
+        batch, batch_statuses = field.process_batch([values[i] for i in leftovers])
+        for index, value, status in zip(leftovers, batch, batch_statuses):
+            if status == STATUS_OK:
+                if value is None:
+                    status = STATUS_NULL
+                else:
+                    try:
+                        results[index] = value
+                    except (TypeError, ValueError, OverflowError):
+                        status = STATUS_ERROR
+
+            statuses[index] = status
+
+    return results, statuses
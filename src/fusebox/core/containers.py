@@ -1,8 +1,10 @@
+import copy
 import json
 from typing import Any
 from collections import OrderedDict
 
 from fusebox.core.etc import RAW_FIELDS
+from fusebox.core.writers import encode_value
 from fusebox.core.fields import Field
 
 
@@ -12,24 +14,56 @@ __all__ = (
 
 
 class FieldContainer:
+    """
+    Container of fields and their values.
+    Values, that were set by container, are stored in container,
+    not in fields, so fields can be shared between containers (and threads).
+
+    Fields, returned by container (`__getitem__`, `get_field`, `values`, `items`),
+    are copies, bound to their values, so `container[key].value` works as before
+    and shared fields aren't changed. Copy is made once, on the first access
+    """
 
     __slots__ = (
         '__container',
+        '__values',
     )
 
     def __init__(self):
         self.__container = OrderedDict({})
+        self.__values = {}
 
     def __setitem__(self, key, field: Field):
         if not isinstance(field, Field):
             raise TypeError('argument field must be `Field` based class')
         self.__container[key] = field
+        self.__values.pop(key, None)
 
     def __getitem__(self, item):
+        if item in self.__values:
+            return self.__bind(item)
         return self.__container[item]
 
     def __delitem__(self, key):
         self.__container.pop(key)
+        self.__values.pop(key, None)
+
+    def __bind(self, key: str) -> Field:
+        """ Replace field by its copy with value stored in container """
+        field = copy.copy(self.__container[key])
+        field._value = self.__values.pop(key)
+        field._ready = True
+        self.__container[key] = field
+        return field
+
+    def __bind_all(self) -> None:
+        for key in tuple(self.__values):
+            self.__bind(key)
+
+    def add(self, key: str, field: Field, value: Any) -> None:
+        """ Add field with its already handled value """
+        self[key] = field
+        self.__values[key] = value
 
     def get_field(
         self,
@@ -42,7 +76,11 @@ class FieldContainer:
         if field is not None:
             # Return `Field` instance
             if isinstance(attr, RAW_FIELDS):
-                return field
+                return self.__bind(key) if key in self.__values else field
+
+            # Return value stored in container
+            if attr == 'value' and key in self.__values:
+                return self.__values[key]
 
             # Return attribute from `Field` instance.
             # Default is `value`
@@ -51,8 +89,8 @@ class FieldContainer:
         raise AttributeError(f'Field `{key}` not found')
 
     def set(self, key: str, value: Any) -> None:
-        """ Set value by calling field's `set` method """
-        self.__container[key].set(value)
+        """ Set value by calling field's `parse` method. Field itself isn't changed """
+        self.__values[key] = self.__container[key].parse(value)
 
     def get(
         self,
@@ -68,6 +106,7 @@ class FieldContainer:
 
     def pop(self, key, default=None):
         """ Delete key/field from container """
+        self.__values.pop(key, None)
         self.__container.pop(key, default)
 
     def get_items(
@@ -94,9 +133,17 @@ class FieldContainer:
         if full_house:
             keys = self.__container.keys()
 
-        return {
-            self.get_field(k, 'name'): self.get_field(k, 'value') for k in keys
-        }
+        container = self.__container
+        values = self.__values
+        result = {}
+        for k in keys:
+            field = container.get(k)
+            if field is None:
+                raise AttributeError(f'Field `{k}` not found')
+
+            result[field.name] = values[k] if k in values else field.value
+
+        return result
 
     def as_json(self, *keys, full_house: bool = True) -> str:
         """
@@ -105,15 +152,17 @@ class FieldContainer:
             keys (tuple):
             full_house (bool): return all keys
         """
-        return json.dumps(self.as_dict(*keys, full_house=full_house))
+        return json.dumps(self.as_dict(*keys, full_house=full_house), default=encode_value)
 
     def keys(self):
         return self.__container.keys()
 
     def values(self):
+        self.__bind_all()
         return self.__container.values()
 
     def items(self):
+        self.__bind_all()
         return self.__container.items()
 
     def __repr__(self):
@@ -4,6 +4,7 @@ import operator
 __all__ = (
     'DEFAULT_ARRAY_SEPARATORS',
     'DEFAULT_FLOAT_SEPARATORS',
+    'NUMBER_LOCALES',
     'AMERICAN_DATE_FORMAT',
     'AMERICAN_DATETIME_FORMAT',
     'EUROPEAN_DATE_FORMAT',
@@ -12,8 +13,13 @@ __all__ = (
     'INDEX_ALL',
     'LIMITLESS_ARRAY',
     'DATE_REGEX',
+    'DATE_INPUT_FORMATS',
     'EMPTY_VALUE',
-    'DEFAULT_FROM_INPUT'
+    'DEFAULT_FROM_INPUT',
+    'STATUS_OK',
+    'STATUS_NULL',
+    'STATUS_SKIP',
+    'STATUS_ERROR',
 )
 
 # Default empty value
@@ -23,7 +29,13 @@ EMPTY_VALUE = type('EMPTY_VALUE', (), {})
 RAW_FIELDS = type('RAW_FIELDS', (), {})
 
 # Return input value if error occurred
-DEFAULT_FROM_INPUT = type('DEFAULT_AS_INPUT', (), {})
+DEFAULT_FROM_INPUT = type('DEFAULT_FROM_INPUT', (), {})
+
+# Row statuses for `Field.process_batch`
+STATUS_OK = 0
+STATUS_NULL = 1
+STATUS_SKIP = 2
+STATUS_ERROR = 3
 
 # Default separators for `ArrayField`
 DEFAULT_ARRAY_SEPARATORS = ('-', '@', '—', ',')
@@ -31,6 +43,18 @@ DEFAULT_ARRAY_SEPARATORS = ('-', '@', '—', ',')
 # Default separators for `FloatField`
 DEFAULT_FLOAT_SEPARATORS = (',', '.')
 
+# Thousands separators that are recognized by `FloatField` without locale (besides `,` and `.`)
+SPACE_THOUSANDS_SEPARATORS = (' ', '\u00a0', '\u202f')
+
+# Number formats of `FloatField` locales - decimal separator and thousands separators
+NUMBER_LOCALES = {
+    'en': ('.', (',',)),
+    'de': (',', ('.',)),
+    'fr': (',', SPACE_THOUSANDS_SEPARATORS),
+    'ru': (',', SPACE_THOUSANDS_SEPARATORS),
+    'ch': ('.', ("'", '\u2019')),
+}
+
 # To get all values from iterable field's result
 INDEX_ALL = type('INDEX_ALL', (), {})
 
@@ -38,7 +62,7 @@ INDEX_ALL = type('INDEX_ALL', (), {})
 DEFAULT_REGEX_INDEX = 1
 
 # To disable `ArrayField` size limit
-LIMITLESS_ARRAY = type('ARRAY_NO_SIZE_LIMITS', (), {})
+LIMITLESS_ARRAY = type('LIMITLESS_ARRAY', (), {})
 
 # Date regex, formats
 DATE_REGEX = r'(\d+\S+\d+\S+\d+)'
@@ -49,8 +73,38 @@ EUROPEAN_DATETIME_FORMAT = '%d.%m.%Y %H:%M:%S'
 AMERICAN_DATE_FORMAT = '%Y-%m-%d'
 AMERICAN_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Candidates for `DateField` input format inference.
+# Only formats that give the same result as `dateutil.parser.parse`
+# (month goes first, if it's ambiguous) are allowed here
+DATE_INPUT_FORMATS = (
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%d %H:%M',
+    '%Y.%m.%d',
+    '%Y.%m.%d %H:%M:%S',
+    '%Y/%m/%d',
+    '%Y/%m/%d %H:%M:%S',
+    '%m/%d/%Y',
+    '%m/%d/%Y %H:%M:%S',
+    '%m.%d.%Y',
+    '%m-%d-%Y',
+    '%d %B %Y',
+    '%d %b %Y',
+    '%B %d, %Y',
+    '%b %d, %Y',
+)
+
+# How many values `DateField` parses by `dateutil` to infer input format
+DATE_INFERENCE_SAMPLE_SIZE = 20
+
 DATETIME_ATTRIBUTE = 'date'
 
+# Size of `JsonWriter` buffer (in characters)
+WRITER_BUFFER_SIZE = 1 << 20
+
+# Number of items that `ArrayField` converts by child field at once
+ARRAY_BATCH_SIZE = 1024
+
 OPERATORS = {
     '>': operator.gt,
     '>=': operator.ge,
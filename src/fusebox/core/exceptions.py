@@ -13,7 +13,9 @@ class FieldNotReadyError(Exception):
     """ Raise an error if the method has not been called"""
 
 
-class HandlerError(Exception):
+class HandlerError(ValueError):
+
+    code_name = 'handler_error'
 
     def __init__(self, message: str = None):
         self._message = message
@@ -23,21 +25,27 @@ class HandlerError(Exception):
 
 
 class RegexError(ValueError):
-    pass
+
+    code_name = 'regex_error'
 
 
 class ArraySizeLimitError(ValueError):
-    pass
+
+    code_name = 'array_size_limit'
 
 
 class NullValueError(ValueError):
 
+    code_name = 'null_value'
+
     def __str__(self):
         return 'Value cant be nullable'
 
 
 class SkipValueError(ValueError):
 
+    code_name = 'skip_value'
+
     def __str__(self):
         return 'Value in skip list'
 
@@ -57,6 +65,10 @@ class ValidationError(ValueError):
     def __str__(self):
         return self._message
 
+    @property
+    def code_name(self) -> str:
+        return self._code_name
+
     @property
     def error(self):
         if self._detailed_exception:
@@ -1,44 +1,166 @@
-import dateutil.parser
+import time
+import array
+import threading
+import functools
+import itertools
 from datetime import datetime
-from fractions import Fraction
 
 from typing import Any
 from typing import List
 from typing import Tuple
+from typing import Sequence
 from typing import Union
 from typing import Callable
+from typing import Iterator
 
 from fusebox.core.etc import EMPTY_VALUE
+from fusebox.core.etc import STATUS_OK
+from fusebox.core.etc import STATUS_NULL
+from fusebox.core.etc import STATUS_SKIP
+from fusebox.core.etc import STATUS_ERROR
 from fusebox.core.etc import LIMITLESS_ARRAY
+from fusebox.core.etc import ARRAY_BATCH_SIZE
 from fusebox.core.etc import DEFAULT_FROM_INPUT
+from fusebox.core.etc import DATE_INPUT_FORMATS
 from fusebox.core.etc import EUROPEAN_DATE_FORMAT
+from fusebox.core.etc import DATE_INFERENCE_SAMPLE_SIZE
 from fusebox.core.etc import DEFAULT_FLOAT_SEPARATORS
 from fusebox.core.etc import DEFAULT_ARRAY_SEPARATORS
 from fusebox.core.exceptions import HandlerError, FieldNotReadyError, NullValueError, SkipValueError
-
-from fusebox.core.handlers import IHandler
-from fusebox.core.utils import get_separator
+from fusebox.core import profiling
+from fusebox.core.profiling import FieldStats
+
+from fusebox.core.handlers import IHandler, IAsyncHandler
+from fusebox.core.columns import process_numeric_column
+from fusebox.core.numbers import NumberParser
+from fusebox.core.tokenizers import ArrayTokenizer
+from fusebox.core.utils import get_separator, iter_chunks
 from fusebox.core.exceptions import ArraySizeLimitError
-from fusebox.core.validators import IValidator
+from fusebox.core.validators import IValidator, IAsyncValidator, ValidatorChain
 
 
 __all__ = ('Field', 'StringField', 'IntegerField',
            'FloatField', 'DateField', 'ArrayField',)
 
 
-class Field:
+def _is_coroutine_function(func: Callable) -> bool:
+    """ `inspect` is imported only for fields with method """
+    import inspect
+    return inspect.iscoroutinefunction(func)
+
+
+def _parse_date_fuzzy(value: str) -> datetime:
+    """ `dateutil` is imported on the first fuzzy parsed date """
+    import dateutil.parser
+    return dateutil.parser.parse(value, fuzzy=True)
+
+
+# Stages of processing plan (see `Field.compile`).
+# Stages are shared by all fields and take field as the first argument,
+# so compiled plan doesn't create closures for every field
+
+def _handlers_stage(field: 'Field', value: Any) -> Any:
+    return field.handle(value)
+
+
+def _method_stage(field: 'Field', value: Any) -> Any:
+    return field._method(value)
+
+
+def _process_stage(field: 'Field', value: Any) -> Any:
+    try:
+        return field.process(value)
+    except field.exceptions as e:
+        raise HandlerError(str(e))
+
+
+def _check_type_stage(field: 'Field', value: Any) -> Any:
+    if isinstance(value, field.allowed_types):
+        raise TypeError(f'Type `{type(value)}` is not allowed in {field.__class__.__name__}')
+    return value
+
+
+def _async_only_stage(field: 'Field', value: Any) -> Any:
+    raise TypeError(f'{field.__class__.__name__} has async handlers or validators, use method `aparse`')
+
+
+def _run_plan(field: 'Field', value: Any) -> Any:
+    """ Runner of plan with several stages """
+    for stage in field._plan:
+        value = stage(field, value)
+    return value
+
+
+def _compile_and_run(field: 'Field', value: Any) -> Any:
+    """ Runner of field that hasn't been compiled yet """
+    field.compile()
+    return field._run(field, value)
+
+
+# Plans of shared stages only, so fields with the same options share one tuple
+_SHARED_PLANS = {}
+
+
+def _get_slots(bases: tuple) -> Tuple[set, list]:
+    """ Names of slots that are in layout of bases and attributes that bases declare by `__add_slots__` """
+    layout, declared = set(), []
+    for base in bases:
+        for cls in base.__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            layout.update((slots,) if isinstance(slots, str) else slots)
+            declared.extend(cls.__dict__.get('__add_slots__') or ())
+
+    return layout, declared
+
+
+class FieldMeta(type):
+    """
+    Metaclass of fields.
+
+    Turns `__add_slots__` of field class and its bases into `__slots__`,
+    so every field has fixed layout without instance `__dict__`.
+    Classes with explicit `__slots__` are left as is. Mixins (f.e. `orm.fields.Field`)
+    declare attributes by `__add_slots__` with empty `__slots__`, so they can be mixed
+    with other fields, and their attributes are added to slots of subclasses.
+
+    Subclasses that don't declare `__add_slots__` (f.e. user fields) keep `__dict__`
+    """
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict, **kwargs):
+        if '__slots__' not in namespace:
+            layout, declared = _get_slots(bases)
+            declared.extend(namespace.get('__add_slots__') or ())
+            slots = [i for i in dict.fromkeys(declared) if i not in layout]
+
+            if '__add_slots__' in namespace:
+                namespace['__slots__'] = tuple(slots)
+            elif slots:
+                if not any(base.__dictoffset__ for base in bases):
+                    slots.append('__dict__')
+                namespace['__slots__'] = tuple(slots)
+
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class Field(metaclass=FieldMeta):
     """
     Base field class
     """
 
-    __add_slots__: list[str] = None
+    # Attributes of subclasses (see `FieldMeta`)
+    __add_slots__: Tuple[str, ...] = ()
 
-    __slots__: list[str] = [
+    __slots__: Tuple[str, ...] = (
         '_value', '_name', '_verbose_name',
         '_null', '_default', '_skip_values',
         '_method', '_handlers', '_validators',
         '_raise_exception', '_check_type', '_ready',
-    ]
+        '_plan', '_run', '_skip_lookup', '_async_plan',
+        '_stats',
+    )
+
+    # Slots that aren't pickled (see `__getstate__`)
+    _unpicklable_slots: tuple = ('_plan', '_run', '_skip_lookup', '_async_plan', '_stats', '__dict__')
 
     allowed_types: tuple[Any] = None
 
@@ -51,13 +173,6 @@ class Field:
         MemoryError,
     )
 
-    @classmethod
-    def __new__(cls, *args, **kwargs):
-        if isinstance(cls.__add_slots__, (list, tuple)):
-            cls.__slots__.extend(cls.__add_slots__)
-
-        return super().__new__(cls)
-
     def __init__(
         self,
         value: Union[Any, EMPTY_VALUE] = EMPTY_VALUE(),
@@ -119,6 +234,200 @@ class Field:
         # List of validators (see core/validators.py)
         self._validators = validators
 
+        # Profiling stats (see core/profiling.py). Only profiled fields are registered
+        self._stats: Union[FieldStats, None] = None
+        if profiling.is_enabled():
+            self._stats = profiling.register(FieldStats(self.__class__.__name__, name))
+
+        # Processing plan is compiled on the first use (see method `compile`)
+        self._plan: Union[tuple, None] = None
+        self._run: Callable = None
+        self._skip_lookup: Union[frozenset, tuple, None] = None
+        self._async_plan: Union[tuple, None] = None
+        self._reset_plan()
+
+    def _reset_plan(self) -> None:
+        """ Drop compiled plan, it'll be compiled on the next call """
+        self._skip_lookup = self._make_skip_lookup()
+        self._plan = None
+        self._async_plan = None
+        self._run = _compile_and_run
+
+    def _get_plan(self) -> tuple:
+        """ Compiled processing plan """
+        if self._plan is None:
+            self.compile()
+        return self._plan
+
+    def compile(self) -> None:
+        """
+        Build processing plan
+
+        Collects only configured stages (handlers, method, process,
+        validators and type check) into a tuple, so method `set` doesn't
+        check every option on every call.
+        Stages are shared functions that take field and value, so only
+        validators stage is made for every field.
+        Plan is compiled on the first call, call it again if you've changed field's options
+        """
+        self._skip_lookup = self._make_skip_lookup()
+
+        # Async stages can be called only by `aparse`
+        if self._has_async_stages():
+            self._async_plan = self._make_async_plan()
+            self._plan = ()
+            self._run = _async_only_stage
+            return
+
+        self._async_plan = None
+        stages = []
+
+        if self._handlers:
+            stages.append(('handlers', _handlers_stage))
+
+        if self._method:
+            stages.append(('method', _method_stage))
+
+        stages.append(('process', _process_stage))
+
+        if self._validators:
+            stages.append(('validators', self._make_validate_stage()))
+
+        if self._check_type and hasattr(self, 'allowed_types'):
+            stages.append(('check_type', _check_type_stage))
+
+        plan = tuple(stage for (_, stage) in stages)
+
+        if self._stats is not None:
+            # Stages are wrapped by timers only if field is profiled
+            plan = tuple(profiling.wrap_stage(self._stats, name, stage) for (name, stage) in stages)
+        elif not self._validators:
+            plan = _SHARED_PLANS.setdefault(plan, plan)
+
+        self._plan = plan
+        self._run = plan[0] if len(plan) == 1 else _run_plan
+
+    def _has_async_stages(self) -> bool:
+        return (
+            any(isinstance(i, IAsyncHandler) for i in self._handlers or ())
+            or any(isinstance(i, IAsyncValidator) for i in self._validators or ())
+            or (self._method is not None and _is_coroutine_function(self._method))
+        )
+
+    def _make_async_plan(self) -> tuple:
+        """
+        Build plan of `(stage, is_async)` pairs for method `aparse`.
+        Adjacent sync stages are chained into one stage, so they're called without awaiting
+        """
+        stages = []
+
+        for handler in self._handlers or ():
+            stages.append((handler.handle, isinstance(handler, IAsyncHandler)))
+
+        if self._method:
+            stages.append((self._method, _is_coroutine_function(self._method)))
+
+        stages.append((functools.partial(_process_stage, self), False))
+
+        validators = self._validators or ()
+        for is_async, group in itertools.groupby(validators, key=lambda i: isinstance(i, IAsyncValidator)):
+            if is_async:
+                stages.extend((self._make_async_validate_stage(i), True) for i in group)
+            else:
+                stages.append((functools.partial(self._make_validate_stage(tuple(group)), self), False))
+
+        if self._check_type and hasattr(self, 'allowed_types'):
+            stages.append((functools.partial(_check_type_stage, self), False))
+
+        plan = []
+        for is_async, group in itertools.groupby(stages, key=lambda i: i[1]):
+            group = tuple(stage for (stage, _) in group)
+            if is_async:
+                plan.extend((stage, True) for stage in group)
+            else:
+                plan.append((self._make_runner(group), False))
+
+        return tuple(plan)
+
+    def __getstate__(self) -> dict:
+        """ Compiled plan can't be pickled, so it's compiled again by `__setstate__` """
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name not in self._unpicklable_slots and hasattr(self, name):
+                    state[name] = getattr(self, name)
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self._stats = None
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        if profiling.is_enabled():
+            self._stats = profiling.register(FieldStats(self.__class__.__name__, self._name))
+        self._reset_plan()
+
+    @staticmethod
+    def _make_runner(plan: tuple) -> Callable:
+        """ Chain stages of async plan, that take only value, into one callable """
+        if len(plan) == 1:
+            return plan[0]
+
+        def run(value: Any) -> Any:
+            for stage in plan:
+                value = stage(value)
+            return value
+
+        return run
+
+    def _make_skip_lookup(self) -> Union[frozenset, tuple, None]:
+        """ Use hashed lookup for skippable values if it's possible """
+        if not self._skip_values:
+            return None
+
+        try:
+            return frozenset(self._skip_values)
+        except TypeError:
+            return tuple(self._skip_values)
+
+    def _make_validate_stage(self, validators: Sequence[IValidator] = None) -> Callable:
+        validate = self.validate
+
+        # Compiled chain merges adjacent bounds validators
+        if validators is not None:
+            validate = ValidatorChain(validators).validate
+        elif type(self).validate is Field.validate:
+            validate = ValidatorChain(self._validators).validate
+
+        def validate_stage(field: Field, value: Any) -> Any:
+            validate(value)
+            return value
+
+        return validate_stage
+
+    @staticmethod
+    def _make_async_validate_stage(validator: IAsyncValidator) -> Callable:
+        validate = validator.validate
+
+        async def async_validate_stage(value: Any) -> Any:
+            await validate(value)
+            return value
+
+        return async_validate_stage
+
+    def _is_skip_value(self, value: Any) -> bool:
+        """ Check if value in skippables """
+        skip_lookup = self._skip_lookup
+        if skip_lookup is None:
+            return False
+
+        try:
+            return value in skip_lookup
+        except TypeError:
+            # Unhashable value
+            return value in self._skip_values
+
     def validate(self, value: Any) -> Any:
         """
         Calls all validators
@@ -127,10 +436,7 @@ class Field:
               is_valid (bool): is value passed all validators
         """
         for validator in self._validators:
-            try:
-                validator.validate(value)
-            except Exception as e:
-                raise e
+            validator.validate(value)
 
     def handle(self, value: Any) -> Any:
         for handler in self._handlers:
@@ -148,68 +454,290 @@ class Field:
         * Calls validators, handlers and method `handle`
         * Sets final, validated and handled value as field's attribute
 
+        All stages are prepared by method `compile`
+
         Args:
             value (Any): Any value to handle. By default, it's `EMPTY_VALUE`
             that allows you to set value from `__init__` method
         """
-        original_value = value
-
         if isinstance(value, EMPTY_VALUE):
             value = self._value
 
+        value = self.parse(value)
+
+        # Final preparations
+
+        self._ready = True
+        self._value = value
+        return value
+
+    def parse(self, value: Any) -> Any:
+        """
+        Side-effect free version of method `set`.
+        Returns handled value, but doesn't store it,
+        so one field can be shared across threads
+
+        Args:
+            value (Any): Any value to handle
+
+        Returns:
+            value (Any): handled value or default, if `raise_exception` is disabled
+        """
+        if self._stats is not None:
+            return self._profiled_parse(value)
+
         try:
             # First, check if value can be nullable
-            if not self._null and value is None:
+            if value is None and not self._null:
                 raise NullValueError
 
             # Then check if value in skippables
-            if self._skip_values:
-                if value in self._skip_values:
-                    raise SkipValueError
+            if self._skip_lookup is not None and self._is_skip_value(value):
+                raise SkipValueError
+
+            # Handlers, method, `process`, validators and type check
+            return self._run(self, value)
+
+        except self.exceptions as e:
+            return self._fallback(value, e)
+
+    def _profiled_parse(self, value: Any) -> Any:
+        """ Method `parse` that counts calls, time and paths """
+        stats = self._stats
+        if not stats.active:
+            # Profiling was disabled globally
+            self.disable_profiling()
+            return self.parse(value)
+
+        start = time.perf_counter()
+        stats.calls += 1
+
+        try:
+            if value is None and not self._null:
+                raise NullValueError
+
+            if self._skip_lookup is not None and self._is_skip_value(value):
+                raise SkipValueError
+
+            result = self._run(self, value)
+            stats.fast += 1
+            return result
+
+        except self.exceptions as e:
+            stats.slow += 1
+            if not isinstance(e, (NullValueError, SkipValueError)):
+                stats.failures += 1
+            return self._fallback(value, e)
+
+        finally:
+            stats.time += time.perf_counter() - start
+
+    def enable_profiling(self) -> FieldStats:
+        """ Enable profiling of field (see core/profiling.py) """
+        if self._stats is None or not self._stats.active:
+            self._stats = profiling.register(FieldStats(self.__class__.__name__, self._name))
+            self._reset_plan()
+
+        return self._stats
+
+    def disable_profiling(self) -> None:
+        """ Disable profiling of field. Collected stats are dropped """
+        if self._stats is not None:
+            self._stats.active = False
+            self._stats = None
+            self._reset_plan()
+
+    @property
+    def stats(self) -> Union[FieldStats, None]:
+        """ Profiling stats or `None`, if profiling is disabled """
+        stats = self._stats
+        return stats if stats is not None and stats.active else None
+
+    async def aparse(self, value: Any) -> Any:
+        """
+        Async version of method `parse`.
+        Async handlers, method and validators are awaited, sync stages are called inline
+
+        Args:
+            value (Any): Any value to handle
+
+        Returns:
+            value (Any): handled value or default, if `raise_exception` is disabled
+        """
+        self._get_plan()
+        async_plan = self._async_plan
+        if async_plan is None:
+            return self.parse(value)
+
+        try:
+            if value is None and not self._null:
+                raise NullValueError
+
+            if self._skip_lookup is not None and self._is_skip_value(value):
+                raise SkipValueError
+
+            result = value
+            for stage, is_async in async_plan:
+                result = stage(result)
+                if is_async:
+                    result = await result
+
+            return result
+
+        except self.exceptions as e:
+            return self._fallback(value, e)
 
-            # Handle by handlers objects
-            if self._handlers:
-                value = self.handle(value)
+    async def aset(self, value: Any = EMPTY_VALUE()) -> Any:
+        """ Async version of method `set` """
+        if isinstance(value, EMPTY_VALUE):
+            value = self._value
+
+        value = await self.aparse(value)
+
+        self._ready = True
+        self._value = value
+        return value
+
+    def _fallback(self, value: Any, error: Exception) -> Any:
+        """
+        Get default value or raise an error
 
-            # Handle by method
-            if self._method:
-                value = self._method(value)
+        To return value as it was passed
+        then you need to pass `default=DEFAULT_FROM_INPUT()`.
+        But remember, that result will be unpredictable in some way
+        """
+        if not self._raise_exception:
+            if isinstance(self._default, DEFAULT_FROM_INPUT):
+                return value
+            return self._default
+
+        raise error
+
+    def try_parse(self, value: Any) -> Tuple[Any, Union[Exception, None]]:
+        """
+        Same as method `parse`, but returns an error instead of raising it.
+        Null and skip errors aren't raised at all, so the only exceptions
+        are the ones raised by plan stages
 
-            # And now we need to call method `process`
+        Returns:
+            value (Any): handled value or `None`
+            error (Exception|None): error, if value can't be handled
+        """
+        if self._stats is not None:
+            # Profiled field counts paths by method `parse`
             try:
-                value = self.process(value)
+                return self.parse(value), None
             except self.exceptions as e:
-                raise HandlerError(str(e))
+                return None, e
 
-            # Then we need to validate finalized data
+        if value is None and not self._null:
+            error = NullValueError()
+        elif self._skip_lookup is not None and self._is_skip_value(value):
+            error = SkipValueError()
+        else:
+            try:
+                return self._run(self, value), None
+            except self.exceptions as e:
+                error = e
 
-            if self._validators:
-                self.validate(value)
+        if self._raise_exception:
+            return None, error
+        return self._fallback(value, error), None
 
-            if self._check_type and hasattr(self, 'allowed_types'):
-                if isinstance(value, self.allowed_types):
-                    raise TypeError(f'Type `{type(value)}` is not allowed in {self.__class__.__name__}')
+    def process_batch(self, values: Sequence[Any]) -> Tuple[List[Any], bytearray]:
+        """
+        Process sequence of values without raising exception per value.
+        Field's state stays untouched
 
-            # Final preparations
+        Failed values are replaced by `default` (or input value
+        if `default=DEFAULT_FROM_INPUT()`), like method `set` does
 
-            self._ready = True
-            self._value = value
-            return value
+        Args:
+            values (Sequence): sequence of raw values
 
-        except self.exceptions as e:
-            # To return value as it was passed
-            # then you need to pass `default=DEFAULT_FROM_INPUT()`.
-            # But remember, that result will be unpredictable in some way
-            if not self._raise_exception:
-                self._ready = True
-                if isinstance(self._default, DEFAULT_FROM_INPUT):
-                    self._value = original_value
-                    return original_value
+        Returns:
+            results (list): processed values
+            statuses (bytearray): row statuses - `STATUS_OK`, `STATUS_NULL`,
+            `STATUS_SKIP` or `STATUS_ERROR` (see core/etc.py)
+        """
+        if self._stats is not None and not self._stats.active:
+            self.disable_profiling()
+
+        stats = self._stats
+        if stats is not None:
+            start = time.perf_counter()
+
+        self._get_plan()
+        run = self._run
+        null = self._null
+        skip_lookup = self._skip_lookup
+        is_skip_value = self._is_skip_value
+        exceptions = self.exceptions
+        default = self._default
+        default_from_input = isinstance(default, DEFAULT_FROM_INPUT)
+
+        results = []
+        append = results.append
+        statuses = bytearray(len(values))
+
+        for index, value in enumerate(values):
+            if value is None and not null:
+                statuses[index] = STATUS_NULL
+
+            elif skip_lookup is not None and is_skip_value(value):
+                statuses[index] = STATUS_SKIP
+
+            else:
+                try:
+                    append(run(self, value))
+                    continue
+                except exceptions:
+                    statuses[index] = STATUS_ERROR
+
+            append(value if default_from_input else default)
+
+        if stats is not None:
+            # Counted like values of method `parse`
+            slow = len(statuses) - statuses.count(STATUS_OK)
+            stats.calls += len(statuses)
+            stats.fast += len(statuses) - slow
+            stats.slow += slow
+            stats.failures += statuses.count(STATUS_ERROR)
+            stats.time += time.perf_counter() - start
+
+        return results, statuses
+
+    def set_many(self, values: Sequence[Any]) -> Tuple[List[Any], bytearray]:
+        """
+        Batch version of method `set`.
+        Sets list of processed values as field's value
 
-                self._value = self._default
-                return self._default
+        If `raise_exception` is enabled, raises an exception
+        of the first failed value, like method `set` does
 
-            raise e
+        Args:
+            values (Sequence): sequence of raw values
+
+        Returns:
+            results (list): processed values
+            statuses (bytearray): row statuses (see method `process_batch`)
+        """
+        results, statuses = self.process_batch(values)
+
+        if self._raise_exception and any(statuses):
+            index = next(i for (i, s) in enumerate(statuses) if s)
+            # Raises the same exception as method `set`
+            self.set(values[index])
+
+        self._ready = True
+        self._value = results
+        return results, statuses
+
+    @property
+    def is_async(self) -> bool:
+        """ Field has async stages and must be handled by `aparse` """
+        self._get_plan()
+        return self._async_plan is not None
 
     @property
     def value(self):
@@ -224,6 +752,8 @@ class Field:
     @name.setter
     def name(self, name: str):
         self._name = name
+        if self._stats is not None:
+            self._stats.name = name
 
     @property
     def verbose_name(self):
@@ -242,7 +772,7 @@ class StringField(Field):
     """
     A very simple string field
     """
-    __add_slots__ = ['_min_length', '_max_length']
+    __add_slots__ = ('_min_length', '_max_length')
 
     def __init__(
         self, *,
@@ -274,56 +804,148 @@ class IntegerField(Field):
     A very simple integer field
     """
 
+    __add_slots__ = ()
+
     def process(self, value, *args, **kwargs) -> Union[int, None]:
         if value is None:
             return
 
         return int(value)
 
+    def process_array(self, values: Sequence[Any], fill_value: Any = None) -> Tuple[Any, Any]:
+        """
+        Process column of values into `int64` NumPy array.
+        Requires `numpy`
+
+        Column is parsed in one vectorized pass, leftovers
+        and fields with handlers, method, validators, etc. are processed by the scalar path
+
+        Args:
+            values (Sequence): sequence of raw values
+            fill_value (Any): value for failed rows (see `process_numeric_column`)
+
+        Returns:
+            results (ndarray): `int64` array
+            statuses (ndarray): `uint8` array of row statuses (see method `process_batch`)
+        """
+        # Profiled fields count values by the scalar path
+        vectorize = (
+            self._stats is None
+            and len(self._get_plan()) == 1
+            and self._skip_lookup is None
+            and type(self).process is IntegerField.process
+        )
+        return process_numeric_column(self, values, 'int64', vectorize, fill_value=fill_value)
+
 
 class FloatField(Field):
     """
     Float field.
-    Supports separators, fractials
+    Supports decimal and thousands separators, mixed fractions (`3 1/2`) and fractions
+
+    Strings are parsed by `NumberParser` of `locale` (see core/numbers.py).
+    Without locale, the only separator of `separators` in number is decimal (`1,5`),
+    and numbers with thousands separators (`1,234.5`, `1.234,5`, `1 234,5`) are recognized too.
+    With locale (f.e. `en`, `de`, see `NUMBER_LOCALES`), numbers must use its separators
     """
 
     __add_slots__ = (
-        'separators',
+        'separators', 'locale', '_parser',
     )
 
     def __init__(
         self, *,
         separators: str = None,
+        locale: Union[str, Tuple[str, Sequence[str]]] = None,
         **kwargs
     ) -> None:
         self.separators = separators or DEFAULT_FLOAT_SEPARATORS
+
+        # Locale name or `(decimal separator, thousands separators)` pair
+        self.locale = locale
+        self._parser = NumberParser.from_locale(locale, self.separators)
+
         super().__init__(**kwargs)
 
     def process(self, value: str) -> Union[float, None]:
         if value is None:
             return
 
-        new_value = value
-        separator = get_separator(self.separators, value)
+        if not isinstance(value, str):
+            return float(value)
+
+        return self._parser.parse(value)
+
+    def process_array(self, values: Sequence[Any], fill_value: Any = None) -> Tuple[Any, Any]:
+        """
+        Process column of values into `float64` NumPy array.
+        Requires `numpy`
+
+        Column is parsed in one vectorized pass (with decimal separators of locale), leftovers
+        like fractions, thousands separators and fields with handlers, method, validators, etc.
+        are processed by the scalar path
+
+        Args:
+            values (Sequence): sequence of raw values
+            fill_value (Any): value for failed rows (see `process_numeric_column`)
 
-        # Check for separator
-        if separator:
-            new_value = new_value.replace(separator, '.')
+        Returns:
+            results (ndarray): `float64` array
+            statuses (ndarray): `uint8` array of row statuses (see method `process_batch`)
+        """
+        # Profiled fields count values by the scalar path
+        vectorize = (
+            self._stats is None
+            and len(self._get_plan()) == 1
+            and self._skip_lookup is None
+            and type(self).process is FloatField.process
+        )
+        return process_numeric_column(
+            self, values, 'float64', vectorize,
+            separators=self._parser.decimal_separators,
+            dot_decimal=self._parser.dot_decimal,
+            fill_value=fill_value
+        )
 
-        # Check for fraction
-        if '/' in new_value:
-            new_value = float(sum(Fraction(s) for s in new_value.split()))
 
-        return float(new_value)
+# Parse paths of `DateField` (see `DateField.parse_stats`)
+_DATE_PARSE_PATHS = ('format', 'iso', 'inferred', 'fuzzy')
+
+# Format learning of shared `DateField` (see `DateField._learn_format`)
+_date_learning_lock = threading.Lock()
 
 
 class DateField(Field):
+    """
+    Date field.
+
+    Strings are parsed by cascade of fast paths:
+    * `input_formats` - explicit input formats (`datetime.strptime`)
+    * ISO 8601 strings (`datetime.fromisoformat`)
+    * Inferred format - the dominant format learned from the first values
+    that were parsed by `dateutil` (see `DATE_INPUT_FORMATS`)
+    * `dateutil.parser.parse` with fuzzy parsing as a last resort
+
+    Property `parse_stats` shows how often each path was taken
+
+    Field can be shared by threads: format learning is locked,
+    so the format is inferred once from `DATE_INFERENCE_SAMPLE_SIZE` samples.
+    Parse stats counters aren't locked, they're approximate in that case
+    """
+
+    __add_slots__ = (
+        'as_string', 'out_date_format', 'date_attribute',
+        'input_formats', 'infer_format', '_inferred_format',
+        '_format_votes', '_inference_samples', '_parse_stats',
+    )
 
     def __init__(
         self, *,
         as_string: bool = False,
         out_date_format: str = EUROPEAN_DATE_FORMAT,
         date_attribute: str = None,
+        input_formats: Sequence[str] = None,
+        infer_format: bool = True,
         **kwargs
     ) -> None:
         # Return `datetime` object as string
@@ -335,22 +957,118 @@ class DateField(Field):
         # Attribute from `datetime` object
         self.date_attribute = date_attribute
 
+        # Input formats hints. They're used before any other parser
+        self.input_formats = tuple(input_formats or ())
+
+        # Learn the dominant input format. Votes are created by the first learned value
+        self.infer_format = infer_format
+        self._inferred_format: Union[str, None] = None
+        self._format_votes: Union[dict, None] = None
+        self._inference_samples = 0
+
+        # Parse paths counters. They're created by the first parsed string
+        self._parse_stats: Union[dict, None] = None
+
         super().__init__(**kwargs)
 
+    @property
+    def inferred_format(self) -> Union[str, None]:
+        return self._inferred_format
+
+    @property
+    def parse_stats(self) -> dict:
+        """ How often each parse path was taken """
+        return dict(self._parse_stats or dict.fromkeys(_DATE_PARSE_PATHS, 0))
+
+    def reset_parse_stats(self) -> None:
+        self._parse_stats = None
+
+    def _learn_format(self, value: str, parsed: datetime) -> None:
+        """ Vote for formats that give the same result as `dateutil` """
+        matched = None
+        for date_format in DATE_INPUT_FORMATS:
+            try:
+                if datetime.strptime(value, date_format) == parsed:
+                    matched = date_format
+                    break
+            except ValueError:
+                pass
+
+        with _date_learning_lock:
+            # Learning could be finished by another thread
+            if not self.infer_format:
+                return
+            self._vote(matched)
+
+    def _vote(self, date_format: Union[str, None]) -> None:
+        if date_format is not None:
+            if self._format_votes is None:
+                self._format_votes = {}
+            self._format_votes[date_format] = self._format_votes.get(date_format, 0) + 1
+
+        self._inference_samples += 1
+        if self._inference_samples < DATE_INFERENCE_SAMPLE_SIZE:
+            return
+
+        # Stop learning and take the dominant format, if it's there
+        if self._format_votes:
+            date_format, votes = max(tuple(self._format_votes.items()), key=lambda i: i[1])
+            if votes * 2 >= self._inference_samples:
+                self._inferred_format = date_format
+
+        self.infer_format = False
+        self._format_votes = None
+
+    def _parse_string(self, value: str) -> datetime:
+        stats = self._parse_stats
+        if stats is None:
+            stats = self._parse_stats = dict.fromkeys(_DATE_PARSE_PATHS, 0)
+
+        for date_format in self.input_formats:
+            try:
+                new_value = datetime.strptime(value, date_format)
+                stats['format'] += 1
+                return new_value
+            except ValueError:
+                pass
+
+        if len(value) >= 10 and value[4] == '-' and value[7] == '-' and value[5:7].isdigit():
+            try:
+                new_value = datetime.fromisoformat(value)
+                if new_value.tzinfo is None:
+                    stats['iso'] += 1
+                    return new_value
+            except ValueError:
+                pass
+
+        if self._inferred_format:
+            try:
+                new_value = datetime.strptime(value, self._inferred_format)
+                # `%Y` takes short years as is, unlike `dateutil`
+                if new_value.year >= 100:
+                    stats['inferred'] += 1
+                    return new_value
+            except ValueError:
+                pass
+
+        new_value = _parse_date_fuzzy(value)
+        stats['fuzzy'] += 1
+
+        if self.infer_format:
+            self._learn_format(value, new_value)
+
+        return new_value
+
     def process(self, value: str) -> Union[datetime, None]:
         if value is None:
             return
 
-        try:
-            if isinstance(value, str):
-                new_value = dateutil.parser.parse(value, fuzzy=True)
-            elif isinstance(value, (int, float)):
-                new_value = datetime.fromtimestamp(value)
-            elif isinstance(value, datetime):
-                new_value = value
-
-        except dateutil.parser.ParserError as e:
-            raise e
+        if isinstance(value, str):
+            new_value = self._parse_string(value)
+        elif isinstance(value, (int, float)):
+            new_value = datetime.fromtimestamp(value)
+        elif isinstance(value, datetime):
+            new_value = value
 
         if self.date_attribute:
             new_value = getattr(new_value, self.date_attribute)()
@@ -369,16 +1087,43 @@ class DateField(Field):
 
 
 class ArrayField(Field):
+    """
+    Array field. Splits string by separator and converts items by `child_field`
+
+    Items are split up to `size` limit, so the array that exceeds limit
+    isn't split to the end, and converted by child field in batches.
+
+    Output:
+    * `list` - list of converted items
+    * `array` - compact `array.array` (`IntegerField` and `FloatField` children only)
+    * `numpy` - `int64`/`float64` ndarray, parsed by child's `process_array` (requires `numpy`)
+    * `iter` - lazy iterator. Items are split and converted while iterator is consumed,
+    so errors (f.e. `ArraySizeLimitError`) are raised by iterator, not by `parse`
+
+    By default, string is split by the first separator found in it.
+    Several separators at once, nested arrays (f.e. `1,2;3,4` -> `[[1, 2], [3, 4]]`),
+    quotes and escapes are handled by `ArrayTokenizer` in one pass (see core/tokenizers.py).
+    Size limit of nested arrays is the number of items of the innermost level
+    """
 
     __add_slots__ = (
-        'child_field', 'separators', 'size'
+        'child_field', 'separators', 'size',
+        'output', 'batch_size', '_typecode', '_tokenizer',
     )
 
+    outputs: Tuple[str, ...] = ('list', 'array', 'numpy', 'iter')
+
     def __init__(
         self, *,
         child_field: Field,
         separators: Tuple[str] = None,
         size: Union[int, LIMITLESS_ARRAY] = LIMITLESS_ARRAY(),
+        output: str = 'list',
+        batch_size: int = ARRAY_BATCH_SIZE,
+        multiple_separators: bool = False,
+        nested_separators: Sequence[Union[str, Sequence[str]]] = None,
+        quote: str = None,
+        escape: str = None,
         **kwargs
     ) -> None:
 
@@ -388,40 +1133,181 @@ class ArrayField(Field):
         # List of separators
         self.separators = separators or DEFAULT_ARRAY_SEPARATORS
 
-        # Array size limit
+        # Array size limit (max number of items)
         self.size = size
 
+        # Output type (see `outputs`)
+        if output not in self.outputs:
+            raise ValueError(f'unknown output `{output}`')
+        self.output = output
+
+        # Number of items converted by child field at once
+        self.batch_size = batch_size
+
+        # Type code of `array.array` output
+        self._typecode = None
+        if output in ('array', 'numpy'):
+            if isinstance(child_field, IntegerField):
+                self._typecode = 'q'
+            elif isinstance(child_field, FloatField):
+                self._typecode = 'd'
+            else:
+                raise ValueError(f'`{output}` output requires `IntegerField` or `FloatField` child field')
+
+        # Tokenizer of several separators, nested arrays, quotes and escapes.
+        # Separators of outer levels go first
+        self._tokenizer = None
+        if multiple_separators or nested_separators or quote or escape:
+            self._tokenizer = ArrayTokenizer((*(nested_separators or ()), self.separators), quote, escape)
+            if self._tokenizer.depth > 1 and self._typecode:
+                raise ValueError(f'`{output}` output doesn\'t support nested arrays')
+
         super().__init__(**kwargs)
 
     def _split_string(self, value) -> List[Any]:
-        """ Split string by separator """
+        """ Split string by separator, but not further than size limit """
+        maxsplit = -1 if isinstance(self.size, LIMITLESS_ARRAY) else self.size
+        if self._tokenizer is not None:
+            # Blank string is an empty array, as `str.split` makes it without separator
+            if not value.strip():
+                return []
+            return self._tokenizer.split(value, maxsplit)
+
         separator = get_separator(self.separators, value)
-        return value.split(separator)
+        return value.split(separator, maxsplit)
+
+    def _iter_batches(self, value: str) -> Iterator[List[str]]:
+        """
+        Split string lazily, window by window.
+        Window is cut by the last separator in it and split by `str.split`
+        """
+        separator = get_separator(self.separators, value)
+        if separator is None:
+            yield value.split()
+            return
+
+        # About `batch_size` items of 8 characters
+        window = self.batch_size * 8
+        step = len(separator)
+        length = len(value)
+        start = 0
+        while start + window < length:
+            cut = value.rfind(separator, start, start + window)
+            if cut == -1:
+                # Item is longer than window
+                cut = value.find(separator, start + window)
+                if cut == -1:
+                    break
+
+            yield value[start:cut].split(separator)
+            start = cut + step
+
+        yield value[start:].split(separator)
 
     def _check_array_size(self, value) -> bool:
-        """ Check array size, I guess """
+        """ Check that array doesn't exceed size limit """
         if isinstance(self.size, LIMITLESS_ARRAY):
             return True
 
-        return len(value) >= self.size
+        return self._count_items(value) <= self.size
+
+    def _count_items(self, value: List[Any]) -> int:
+        """ Number of items of the innermost level of (nested) array """
+        depth = 1 if self._tokenizer is None else self._tokenizer.depth
+        for _ in range(depth - 1):
+            value = [i for items in value for i in items]
+
+        return len(value)
+
+    def _convert_values(self, values: Sequence[Any]) -> List[Any]:
+        """
+        Convert batch of child field values.
+        Child field raises an error of the first failed value, like method `parse` does
+        """
+        child_field = self.child_field
+        results, statuses = child_field.process_batch(values)
+        if child_field._raise_exception and any(statuses):
+            index = next(i for (i, s) in enumerate(statuses) if s)
+            child_field.parse(values[index])
+
+        return results
+
+    def _convert_array(self, values: Sequence[Any]) -> array.array:
+        """ Convert values into `array.array` batch by batch """
+        result = array.array(self._typecode)
+        for batch in iter_chunks(values, self.batch_size):
+            try:
+                result.extend(self._convert_values(batch))
+            except TypeError:
+                raise ValueError(f'array item can\'t be stored in `{self._typecode}` array')
+
+        return result
+
+    def _convert_column(self, values: Sequence[Any]) -> Any:
+        """ Convert values into ndarray by child's vectorized `process_array` """
+        child_field = self.child_field
+        results, statuses = child_field.process_array(values)
+        if child_field._raise_exception and statuses.any():
+            child_field.parse(values[int(statuses.nonzero()[0][0])])
 
-    def _convert_values(self, values: List[Any]) -> List[Field]:
-        """ Convert child field values """
-        collect = []
-        for value in values:
-            self.child_field.set(value)
-            collect.append(self.child_field.value)
+        return results
 
-        return collect
+    def _convert_nested(self, values: List[Any], depth: int) -> List[Any]:
+        """ Convert nested lists of child field values """
+        if depth == 1:
+            return self._convert_values(values)
+
+        return [self._convert_nested(i, depth - 1) for i in values]
+
+    def _iter_values(self, value: str) -> Iterator[Any]:
+        """ Split and convert items lazily """
+        if self._tokenizer is not None:
+            yield from self._iter_tokens(value)
+            return
+
+        limitless = isinstance(self.size, LIMITLESS_ARRAY)
+        count = 0
+        for batch in self._iter_batches(value):
+            count += len(batch)
+            if not limitless and count > self.size:
+                raise ArraySizeLimitError(f'array size ({self.size}) exceeded')
+
+            yield from self._convert_values(batch)
+
+    def _iter_tokens(self, value: str) -> Iterator[Any]:
+        """ Tokenized string is split at once, but its items are converted lazily """
+        items = self._split_string(value)
+        if not self._check_array_size(items):
+            raise ArraySizeLimitError(f'array size ({self.size}) exceeded')
+
+        depth = self._tokenizer.depth
+        if depth > 1:
+            for item in items:
+                yield self._convert_nested(item, depth - 1)
+            return
+
+        for batch in iter_chunks(items, self.batch_size):
+            yield from self._convert_values(batch)
 
     def process(self, value: str) -> Any:
         if value is None:
             return
 
+        if self.output == 'iter':
+            return self._iter_values(value)
+
         new_value = self._split_string(value)
 
         if not self._check_array_size(new_value):
             raise ArraySizeLimitError(f'array size ({self.size}) exceeded')
 
-        new_value = self._convert_values(new_value)
-        return new_value
+        if self.output == 'array':
+            return self._convert_array(new_value)
+
+        if self.output == 'numpy':
+            return self._convert_column(new_value)
+
+        if self._tokenizer is not None and self._tokenizer.depth > 1:
+            return self._convert_nested(new_value, self._tokenizer.depth)
+
+        return self._convert_values(new_value)
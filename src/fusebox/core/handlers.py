@@ -1,15 +1,18 @@
 import re
 from abc import ABC, abstractmethod
-from typing import Any, List, Union
+from typing import Any, Iterable, List, Sequence, Tuple, Union
 
 from fusebox.core.etc import INDEX_ALL, DEFAULT_REGEX_INDEX
 from fusebox.core.exceptions import RegexError
+from fusebox.core.mappings import MappingIndex, MappedIndex
 
 
 __all__ = (
     'IHandler',
+    'IAsyncHandler',
     'Mapper',
     'Regex',
+    'RegexSet',
 )
 
 
@@ -20,6 +23,16 @@ class IHandler(ABC):
         pass
 
 
+class IAsyncHandler(ABC):
+    """
+    Handler that does I/O. It's awaited by `Field.aparse`
+    """
+
+    @abstractmethod
+    async def handle(self, value) -> Any:
+        pass
+
+
 class Mapper(IHandler):
     """
     Handful mapper (dict/hashmap)
@@ -32,24 +45,37 @@ class Mapper(IHandler):
     >>>         Mapper({'Yes': True, 'No': False}, default='Not found', ignore_case=True)
     >>>     ]
     >>> )
+
+    Keys are normalized once. For large mappings use `MappingIndex`
+    (loaded from CSV/JSON files) or `MappedIndex` (memory-mapped on-disk index)
+    as `mapping` (see core/mappings.py). Index keys are already normalized,
+    so `ignore_case` and `normalize` can't differ from index's ones
     """
 
     def __init__(
         self,
-        mapping: dict,
+        mapping: Union[dict, MappingIndex, MappedIndex],
         default: Any = None,
-        ignore_case: bool = False
+        ignore_case: bool = None,
+        normalize: str = None
     ) -> None:
-        self._mapping = mapping
+        if isinstance(mapping, (MappingIndex, MappedIndex)):
+            if ignore_case is not None and bool(ignore_case) != mapping.ignore_case:
+                raise ValueError(f'`ignore_case` differs from index\'s one ({mapping.ignore_case})')
+            if normalize is not None and normalize != mapping.normalize:
+                raise ValueError(f'`normalize` differs from index\'s one ({mapping.normalize})')
+        else:
+            mapping = MappingIndex(mapping, ignore_case=bool(ignore_case), normalize=normalize)
+
+        self._index = mapping
         self._default = default
-        self._ignore_case = ignore_case
 
     def handle(self, value) -> Any:
-        if self._ignore_case:
-            value = value.lower()
-            self._mapping = {k.lower(): v for (k, v) in self._mapping.items()}
+        return self._index.get(value, self._default)
 
-        return self._mapping.get(value, self._default)
+    def handle_many(self, values: Iterable[Any]) -> List[Any]:
+        """ Map column of values """
+        return self._index.get_many(values, self._default)
 
 
 class Regex(IHandler):
@@ -60,12 +86,12 @@ class Regex(IHandler):
         default: Any = None,
         index: Union[int, INDEX_ALL] = DEFAULT_REGEX_INDEX
     ) -> None:
-        self._regex = regex
+        self._regex = re.compile(regex)
         self._default = default
         self._index = index
 
     def handle(self, value) -> Union[str, List[str]]:
-        new_value = re.search(self._regex, value)
+        new_value = self._regex.search(value)
 
         if not new_value:
             raise RegexError
@@ -75,3 +101,210 @@ class Regex(IHandler):
 
         elif isinstance(self._index, INDEX_ALL):
             return list(new_value.groups())
+
+
+# Group constructs that refer to groups: `(?P<name>...)`, `(?P=name)` and `(?(name)yes|no)`
+_GROUP_REFERENCE = re.compile(r'\(\?(?:P<(?P<group>\w+)>|P=(?P<reference>\w+)\)|\((?P<condition>\w+)\))')
+
+# Inline global flags, f.e. `(?i)`
+_GLOBAL_FLAGS = re.compile(r'\(\?[aiLmsux]+\)')
+
+_OCTAL_DIGITS = '01234567'
+
+
+def _prepare_pattern(pattern: str, prefix: str, verbose: bool = False) -> str:
+    """
+    Prepare pattern of `RegexSet`: named groups and their references are prefixed,
+    so several patterns can use the same group names.
+    Pattern is scanned token by token (escapes, character classes and comments of verbose patterns
+    are skipped), so only real numbered backreferences and inline global flags are rejected
+    """
+    result = []
+    position = 0
+    length = len(pattern)
+    in_class = False
+
+    while position < length:
+        char = pattern[position]
+
+        if char == '\\':
+            digits = ''
+            if not in_class:
+                while len(digits) < 3 and pattern[position + 1 + len(digits):][:1].isdigit():
+                    digits += pattern[position + 1 + len(digits)]
+
+            # `\0` and three octal digits are octal escapes, other digits are group numbers
+            if digits and digits[0] != '0' and not (len(digits) == 3 and all(i in _OCTAL_DIGITS for i in digits)):
+                raise RegexError(f'numbered backreferences are not allowed ({pattern})')
+
+            result.append(pattern[position:position + 2])
+            position += 2
+            continue
+
+        if in_class:
+            in_class = char != ']'
+            result.append(char)
+            position += 1
+            continue
+
+        if char == '[':
+            # `]` right after `[` or `[^` is a literal
+            end = position + 1
+            if pattern.startswith('^', end):
+                end += 1
+            if pattern.startswith(']', end):
+                end += 1
+
+            in_class = True
+            result.append(pattern[position:end])
+            position = end
+            continue
+
+        if char == '#' and verbose:
+            end = pattern.find('\n', position)
+            end = length if end == -1 else end
+            result.append(pattern[position:end])
+            position = end
+            continue
+
+        if char == '(' and pattern.startswith('?', position + 1):
+            if _GLOBAL_FLAGS.match(pattern, position):
+                raise RegexError(f'inline global flags are not allowed, use argument `flags` ({pattern})')
+
+            match = _GROUP_REFERENCE.match(pattern, position)
+            if match is not None:
+                name = match.group(match.lastgroup)
+                if name.isdigit():
+                    raise RegexError(f'numbered backreferences are not allowed ({pattern})')
+
+                if match.lastgroup == 'group':
+                    result.append(f'(?P<{prefix}{name}>')
+                elif match.lastgroup == 'reference':
+                    result.append(f'(?P={prefix}{name})')
+                else:
+                    result.append(f'(?({prefix}{name})')
+
+                position = match.end()
+                continue
+
+        result.append(char)
+        position += 1
+
+    return ''.join(result)
+
+
+class RegexSet(IHandler):
+    r"""
+    Multi-pattern regex handler.
+    All patterns are compiled into one alternation, so value is scanned once.
+    The leftmost match wins, at the same position - the first pattern
+
+    Result follows `Regex` rules: `index` is a group index of the matched pattern
+    (`0` - whole match), `INDEX_ALL` - all groups of the matched pattern
+
+    >>> phone = RegexSet([r'\+7(\d{10})', r'8(\d{10})'], index=1)
+    >>> phone.handle('tel: 89991234567')
+    >>> '9991234567'
+    >>> phone.match('tel: +79991234567')
+    >>> (0, '9991234567')
+
+    Named groups are renamed for every pattern, so patterns can use the same group names.
+    Patterns can't use numbered backreferences and inline global flags (use `flags`)
+
+    Values without match raise `RegexError` in methods `handle` and `handle_many`,
+    so field's `default` is used for them. Methods `match` and `match_many` return `None`
+    """
+
+    def __init__(
+        self,
+        patterns: Sequence[str],
+        index: Union[int, INDEX_ALL] = DEFAULT_REGEX_INDEX,
+        flags: int = 0
+    ) -> None:
+        if not patterns:
+            raise RegexError('at least one pattern is required')
+
+        self._patterns = tuple(patterns)
+        self._index = index
+        self._flags = flags
+
+        parts = []
+        # Outer group index -> (pattern index, group to fetch or groups slice)
+        self._groups = {}
+        offset = 1
+
+        for pattern_index, pattern in enumerate(self._patterns):
+            try:
+                groups = re.compile(pattern, flags).groups
+            except re.error as e:
+                raise RegexError(f'invalid pattern {pattern}: {e}')
+
+            pattern = _prepare_pattern(pattern, f'_p{pattern_index}_', bool(flags & re.VERBOSE))
+
+            if isinstance(index, int):
+                if index > groups:
+                    raise RegexError(f'pattern {pattern} has no group {index}')
+                fetch = offset + index
+            else:
+                # Slice of `match.groups()`
+                fetch = slice(offset, offset + groups)
+
+            self._groups[offset] = (pattern_index, fetch)
+            parts.append(f'(?P<_p{pattern_index}>{pattern})')
+            offset += groups + 1
+
+        try:
+            self._regex = re.compile('|'.join(parts), flags)
+        except re.error as e:
+            raise RegexError(f'patterns can\'t be combined: {e}')
+
+    def _result(self, match: re.Match) -> Tuple[int, Union[str, List[str]]]:
+        pattern_index, fetch = self._groups[match.lastindex]
+        if isinstance(fetch, slice):
+            return pattern_index, list(match.groups()[fetch])
+        return pattern_index, match.group(fetch)
+
+    def match(self, value: str) -> Union[Tuple[int, Union[str, List[str]]], None]:
+        """ Returns matched pattern index and its result or `None` """
+        match = self._regex.search(value)
+        if match is None:
+            return None
+        return self._result(match)
+
+    def handle(self, value) -> Union[str, List[str]]:
+        match = self._regex.search(value)
+        if match is None:
+            raise RegexError(f'value {value!r} doesn\'t match any pattern')
+
+        return self._result(match)[1]
+
+    def match_many(self, values: Iterable[str]) -> List[Union[Tuple[int, Union[str, List[str]]], None]]:
+        """
+        Column mode of method `match`.
+        Returns matched pattern index and result or `None` for every value
+        """
+        result = self._result
+        return [None if m is None else result(m) for m in map(self._regex.search, values)]
+
+    def handle_many(self, values: Iterable[str]) -> List[Union[str, List[str]]]:
+        """
+        Column mode of method `handle`.
+        Value without match raises `RegexError`, like method `handle` does
+        """
+        search = self._regex.search
+        groups = self._groups
+        collect = []
+        append = collect.append
+
+        for value in values:
+            match = search(value)
+            if match is None:
+                raise RegexError(f'value {value!r} doesn\'t match any pattern')
+
+            fetch = groups[match.lastindex][1]
+            if isinstance(fetch, slice):
+                append(list(match.groups()[fetch]))
+            else:
+                append(match.group(fetch))
+
+        return collect
@@ -0,0 +1,367 @@
+"""
+Mapping indexes for `Mapper` handler.
+
+`MappingIndex` - in-memory index with normalized (case-folded/unicode-normalized) keys.
+Can be loaded from CSV/JSON files and saved as on-disk index.
+
+`MappedIndex` - read-only on-disk index opened by `mmap`,
+so worker processes share the same pages
+"""
+import csv
+import json
+import mmap
+import struct
+import sys
+import unicodedata
+import zlib
+from typing import Any, Callable, Iterable, List, Union
+
+__all__ = (
+    'MappingIndex',
+    'MappedIndex',
+)
+
+# On-disk index layout:
+# * header - magic, version, flags, number of keys, hash table size
+# * hash table - records offsets (`0` is an empty slot), linear probing by `crc32`
+# * records - key length, value length, value type, key and value bytes
+INDEX_MAGIC = b'FBIX'
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('<4sHHQQ')
+INDEX_SLOT = struct.Struct('<Q')
+INDEX_RECORD = struct.Struct('<IIB')
+
+# Flags. Normalization form (`NORMALIZATION_FORMS` index + 1) is stored in the high byte
+INDEX_IGNORE_CASE = 1
+INDEX_NORMALIZE_SHIFT = 8
+
+# Value types
+VALUE_STRING = 0
+VALUE_JSON = 1
+
+NORMALIZATION_FORMS = ('NFC', 'NFKC', 'NFD', 'NFKD')
+
+
+def make_normalizer(ignore_case: bool = False, normalize: str = None) -> Union[Callable, None]:
+    """
+    Create keys normalizer.
+    Keys are case-folded first: `casefold` can give not normalized string,
+    so unicode normalization is the last step
+
+    Args:
+        ignore_case (bool): case-fold keys
+        normalize (str): unicode normalization form - NFC, NFKC, NFD or NFKD
+    """
+    if normalize and normalize not in NORMALIZATION_FORMS:
+        raise ValueError(f'unknown normalization form `{normalize}`')
+
+    if ignore_case and normalize:
+        def normalizer(key: Any) -> Any:
+            if isinstance(key, str):
+                return unicodedata.normalize(normalize, key.casefold())
+            return key
+
+    elif ignore_case:
+        def normalizer(key: Any) -> Any:
+            if isinstance(key, str):
+                return key.casefold()
+            return key
+
+    elif normalize:
+        def normalizer(key: Any) -> Any:
+            if isinstance(key, str):
+                return unicodedata.normalize(normalize, key)
+            return key
+
+    else:
+        normalizer = None
+
+    return normalizer
+
+
+class MappingIndex:
+    """
+    In-memory mapping index. Keys are normalized once, while index is building
+
+    >>> from fusebox.core.handlers import Mapper
+    >>> index = MappingIndex.from_csv('cities.csv', key_column='alias', value_column='city', ignore_case=True)
+    >>> city_field = Field(handlers=[Mapper(index, default='Unknown')])
+    """
+
+    def __init__(
+        self,
+        mapping: dict = None,
+        ignore_case: bool = False,
+        normalize: str = None
+    ) -> None:
+        self._ignore_case = ignore_case
+        self._normalize = normalize
+        self._normalizer = make_normalizer(ignore_case, normalize)
+
+        mapping = mapping or {}
+        if self._normalizer:
+            normalizer = self._normalizer
+            mapping = {normalizer(k): v for (k, v) in mapping.items()}
+        else:
+            mapping = dict(mapping)
+
+        self._mapping = mapping
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str,
+        key_column: Union[int, str] = 0,
+        value_column: Union[int, str] = 1,
+        encoding: str = 'utf-8',
+        **kwargs
+    ) -> 'MappingIndex':
+        """
+        Load index from CSV file.
+        Columns can be set by index or by header name
+
+        Args:
+            path (str): path to CSV file
+            key_column (int|str): keys column
+            value_column (int|str): values column
+            encoding (str): file encoding
+            kwargs: `MappingIndex` arguments and `csv.reader` format parameters
+        """
+        index_kwargs = {k: kwargs.pop(k) for k in ('ignore_case', 'normalize') if k in kwargs}
+
+        with open(path, newline='', encoding=encoding) as file:
+            reader = csv.reader(file, **kwargs)
+
+            if isinstance(key_column, str) or isinstance(value_column, str):
+                header = next(reader)
+                if isinstance(key_column, str):
+                    key_column = header.index(key_column)
+                if isinstance(value_column, str):
+                    value_column = header.index(value_column)
+
+            mapping = {row[key_column]: row[value_column] for row in reader if row}
+
+        return cls(mapping, **index_kwargs)
+
+    @classmethod
+    def from_json(cls, path: str, encoding: str = 'utf-8', **kwargs) -> 'MappingIndex':
+        """
+        Load index from JSON file with an object
+
+        Args:
+            path (str): path to JSON file
+            encoding (str): file encoding
+            kwargs: `MappingIndex` arguments
+        """
+        with open(path, encoding=encoding) as file:
+            mapping = json.load(file)
+
+        if not isinstance(mapping, dict):
+            raise ValueError('JSON file must contain an object')
+
+        return cls(mapping, **kwargs)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if self._normalizer:
+            key = self._normalizer(key)
+
+        return self._mapping.get(key, default)
+
+    def get_many(self, keys: Iterable[Any], default: Any = None) -> List[Any]:
+        get = self._mapping.get
+        normalizer = self._normalizer
+        if normalizer:
+            return [get(normalizer(k), default) for k in keys]
+
+        return [get(k, default) for k in keys]
+
+    def save(self, path: str) -> None:
+        """
+        Save index as on-disk index (see `MappedIndex`).
+        Keys must be strings, values - JSON-serializable objects
+
+        Args:
+            path (str): path to index file
+        """
+        table_size = 8
+        while table_size < len(self._mapping) * 2:
+            table_size *= 2
+
+        table = [0] * table_size
+        records = bytearray()
+        records_offset = INDEX_HEADER.size + INDEX_SLOT.size * table_size
+
+        for key, value in self._mapping.items():
+            if not isinstance(key, str):
+                raise TypeError(f'index keys must be strings, not `{type(key).__name__}`')
+
+            key_bytes = key.encode('utf-8')
+            if isinstance(value, str):
+                value_type, value_bytes = VALUE_STRING, value.encode('utf-8')
+            else:
+                value_type, value_bytes = VALUE_JSON, json.dumps(value).encode('utf-8')
+
+            slot = zlib.crc32(key_bytes) & (table_size - 1)
+            while table[slot]:
+                slot = (slot + 1) & (table_size - 1)
+
+            table[slot] = records_offset + len(records)
+            records += INDEX_RECORD.pack(len(key_bytes), len(value_bytes), value_type)
+            records += key_bytes
+            records += value_bytes
+
+        flags = INDEX_IGNORE_CASE if self._ignore_case else 0
+        if self._normalize:
+            flags |= (NORMALIZATION_FORMS.index(self._normalize) + 1) << INDEX_NORMALIZE_SHIFT
+
+        with open(path, 'wb') as file:
+            file.write(INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, flags, len(self._mapping), table_size))
+            file.write(struct.pack(f'<{table_size}Q', *table))
+            file.write(records)
+
+    def __getstate__(self) -> dict:
+        return {
+            'mapping': self._mapping,
+            'ignore_case': self._ignore_case,
+            'normalize': self._normalize,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self._mapping = state['mapping']
+        self._ignore_case = state['ignore_case']
+        self._normalize = state['normalize']
+        self._normalizer = make_normalizer(self._ignore_case, self._normalize)
+
+    @property
+    def ignore_case(self) -> bool:
+        return self._ignore_case
+
+    @property
+    def normalize(self) -> Union[str, None]:
+        return self._normalize
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def __contains__(self, key: Any) -> bool:
+        if self._normalizer:
+            key = self._normalizer(key)
+        return key in self._mapping
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} <id: {id(self)}, keys: {len(self._mapping)}>'
+
+
+class MappedIndex:
+    """
+    Read-only on-disk index opened by `mmap`.
+    Build it by `MappingIndex.save`
+
+    >>> MappingIndex.from_csv('sku.csv', ignore_case=True).save('sku.idx')
+    >>> index = MappedIndex('sku.idx')
+    >>> index.get('SKU-1')
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+        with open(path, 'rb') as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, flags, count, table_size = INDEX_HEADER.unpack_from(self._buffer, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            self._buffer.close()
+            raise ValueError(f'`{path}` is not a mapping index file')
+
+        self._count = count
+        self._mask = table_size - 1
+
+        # Hash table view without copying
+        table = memoryview(self._buffer)[INDEX_HEADER.size:INDEX_HEADER.size + INDEX_SLOT.size * table_size]
+        self._table = table.cast('Q') if sys.byteorder == 'little' else None
+        self._ignore_case = bool(flags & INDEX_IGNORE_CASE)
+        normalize = flags >> INDEX_NORMALIZE_SHIFT
+        self._normalize = NORMALIZATION_FORMS[normalize - 1] if normalize else None
+        self._normalizer = make_normalizer(self._ignore_case, self._normalize)
+
+    @property
+    def ignore_case(self) -> bool:
+        return self._ignore_case
+
+    @property
+    def normalize(self) -> Union[str, None]:
+        return self._normalize
+
+    def _find(self, key: Any) -> Union[int, None]:
+        """ Find record offset by normalized key """
+        if not isinstance(key, str):
+            return None
+
+        key_bytes = key.encode('utf-8')
+        key_size = len(key_bytes)
+        buffer = self._buffer
+        table = self._table
+        mask = self._mask
+        slot = zlib.crc32(key_bytes) & mask
+
+        while True:
+            if table is not None:
+                offset = table[slot]
+            else:
+                offset, = INDEX_SLOT.unpack_from(buffer, INDEX_HEADER.size + slot * INDEX_SLOT.size)
+
+            if not offset:
+                return None
+
+            start = offset + INDEX_RECORD.size
+            if buffer[start:start + key_size] == key_bytes and INDEX_RECORD.unpack_from(buffer, offset)[0] == key_size:
+                return offset
+
+            slot = (slot + 1) & mask
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        if self._normalizer:
+            key = self._normalizer(key)
+
+        offset = self._find(key)
+        if offset is None:
+            return default
+
+        key_size, value_size, value_type = INDEX_RECORD.unpack_from(self._buffer, offset)
+        start = offset + INDEX_RECORD.size + key_size
+        value = self._buffer[start:start + value_size].decode('utf-8')
+
+        if value_type == VALUE_JSON:
+            return json.loads(value)
+
+        return value
+
+    def get_many(self, keys: Iterable[Any], default: Any = None) -> List[Any]:
+        get = self.get
+        return [get(k, default) for k in keys]
+
+    def close(self) -> None:
+        if self._table is not None:
+            self._table.release()
+        self._buffer.close()
+
+    def __reduce__(self):
+        # Every process opens (and shares) the same file
+        return self.__class__, (self._path,)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: Any) -> bool:
+        if self._normalizer:
+            key = self._normalizer(key)
+        return self._find(key) is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} <id: {id(self)}, path: {self._path}, keys: {self._count}>'
@@ -0,0 +1,199 @@
+"""
+Numbers grammar of `FloatField`.
+
+Numeric strings are classified by one precompiled regex:
+* decimal numbers with decimal and thousands separators of number formats (f.e. `1 234,56`, `1,234.56`)
+* mixed fractions (`3 1/2`) and fractions (`1/2`)
+
+Values are computed by `float` and integer arithmetic, without `Fraction` objects.
+Strings without separators, spaces and fractions go straight to `float`,
+numbers of the first format without thousands separators (f.e. `1,5`) get `.` decimal separator first.
+The regex is used only if `float` fails
+"""
+import re
+import functools
+from typing import Sequence, Tuple, Union
+
+from fusebox.core.etc import NUMBER_LOCALES
+from fusebox.core.etc import DEFAULT_FLOAT_SEPARATORS
+from fusebox.core.etc import SPACE_THOUSANDS_SEPARATORS
+
+
+__all__ = (
+    'NumberParser',
+)
+
+# Decimal separators and thousands separators
+NumberFormat = Tuple[Sequence[str], Sequence[str]]
+
+# Groups of classifier: sign, mixed fraction, fraction, then (number, format marker) pairs
+_MIXED_GROUP = 4
+_FRACTION_GROUP = 6
+_FIRST_FORMAT_GROUP = 8
+
+
+class NumberParser:
+    """
+    Parser of numeric strings
+
+    Number formats are tried in order, so the first format that matches string is used.
+    All separators must be one character long
+
+    Args:
+        formats (Sequence): number formats, `(decimal separators, thousands separators)` pairs
+        grouping_required (bool): numbers of formats with thousands separators must have them
+    """
+
+    __slots__ = (
+        'formats', 'decimal_separators', 'dot_decimal',
+        '_classify', '_is_clean', '_tables', '_plain_separators', '_dot_thousands',
+    )
+
+    def __init__(self, formats: Sequence[NumberFormat], grouping_required: bool = False) -> None:
+        formats = tuple((tuple(decimal), tuple(thousands)) for (decimal, thousands) in formats)
+        if not formats:
+            raise ValueError('number formats are empty')
+        if any(len(i) != 1 for (decimal, thousands) in formats for i in (*decimal, *thousands)):
+            raise ValueError('number separators must be one character long')
+
+        self.formats = formats
+
+        # Decimal separators of numbers without thousands separators for vectorized parser (see core/columns.py)
+        self.decimal_separators = tuple(dict.fromkeys(
+            i for (decimal, thousands) in formats if not (thousands and grouping_required) for i in decimal
+        ))
+        self.dot_decimal = '.' in self.decimal_separators
+
+        numbers = []
+        for decimal, thousands in formats:
+            integer = r'\d+'
+            if thousands:
+                integer = rf'\d{{1,3}}(?:[{_escape(thousands)}]\d{{3}})+'
+                if not grouping_required:
+                    integer += r'|\d+'
+            numbers.append(
+                rf'((?=[{_escape(decimal)}]?\d)(?:{integer})?(?:[{_escape(decimal)}]\d*)?(?:[eE][+-]?\d+)?)()'
+            )
+
+        self._classify = re.compile(
+            r'\s*([+-]?)\s*(?:'
+            r'(\d+)\s+(\d+)\s*/\s*(\d+)'
+            r'|(\d+)\s*/\s*(\d+)'
+            rf'|{"|".join(numbers)}'
+            r')\s*'
+        ).fullmatch
+
+        # Characters that `float` doesn't parse as the grammar does
+        special = {'/', *(i for (decimal, thousands) in formats for i in (*decimal, *thousands))}
+        special.discard('.')
+        if not self.dot_decimal:
+            special.add('.')
+        self._is_clean = re.compile(rf'[{_escape(special)}\s]').search
+
+        # Tables that convert number of format to `float` syntax
+        self._tables = tuple(
+            str.maketrans({**{i: None for i in thousands}, **{i: '.' for i in decimal}})
+            for (decimal, thousands) in formats
+        )
+
+        # The first format without thousands separators and with `.` decimal separator
+        # is `float` syntax with other decimal separators (`str.replace` is much faster than `str.translate`)
+        plain_decimal, plain_thousands = formats[0]
+        self._plain_separators = (
+            tuple(i for i in plain_decimal if i != '.') if not plain_thousands and '.' in plain_decimal else None
+        )
+        # `1.234.567` isn't `float` syntax, but it's number
+        self._dot_thousands = any('.' in thousands for (_, thousands) in formats)
+
+    @classmethod
+    def from_locale(
+        cls,
+        locale: Union[str, Tuple[str, Sequence[str]], None] = None,
+        separators: Sequence[str] = None
+    ) -> 'NumberParser':
+        """
+        Get parser of locale. Parsers are immutable, so fields with the same locale share one parser
+
+        Args:
+            locale (str|tuple): name of locale (see `NUMBER_LOCALES`) or `(decimal separator, thousands separators)` pair.
+            Without locale, the only separator in number is decimal (like `1,5`),
+            and numbers with thousands separators (like `1,234.5`, `1.234,5` or `1 234,5`) are recognized too
+            separators (Sequence): decimal separators of numbers without locale (`.` is always decimal, like in `float`)
+        """
+        if locale is None:
+            return _make_parser(cls, None, tuple(dict.fromkeys((*(separators or DEFAULT_FLOAT_SEPARATORS), '.'))))
+
+        if isinstance(locale, str):
+            if locale not in NUMBER_LOCALES:
+                raise ValueError(f'unknown locale `{locale}`')
+            locale = NUMBER_LOCALES[locale]
+
+        decimal, thousands = locale
+        return _make_parser(cls, (decimal, tuple(thousands)), None)
+
+    def parse(self, value: str) -> float:
+        """ Parse numeric string """
+        number = value
+        if self._plain_separators is not None:
+            for separator in self._plain_separators:
+                if separator in number:
+                    number = number.replace(separator, '.')
+        elif self._is_clean(value) is not None:
+            number = None
+
+        if number is not None:
+            try:
+                return float(number)
+            except ValueError:
+                # Only numbers with several `.` thousands separators (`1.234.567`),
+                # spaces, fractions and thousands separators of other formats aren't `float` syntax
+                if number is value and self._is_clean(value) is None and not (
+                    self._dot_thousands and value.count('.') > 1
+                ):
+                    raise
+
+        match = self._classify(value)
+        if match is None:
+            raise ValueError(f'could not convert string to float: {value!r}')
+
+        group = match.lastindex
+        negative = match.group(1) == '-'
+
+        if group == _MIXED_GROUP or group == _FRACTION_GROUP:
+            whole, numerator, denominator = (
+                match.group(2, 3, 4) if group == _MIXED_GROUP else ('0', *match.group(5, 6))
+            )
+            denominator = int(denominator)
+            if not denominator:
+                raise ValueError(f'zero denominator: {value!r}')
+
+            # Integer true division is correctly rounded
+            result = (int(whole) * denominator + int(numerator)) / denominator
+            return -result if negative else result
+
+        number = match.group(group - 1).translate(self._tables[(group - _FIRST_FORMAT_GROUP) // 2])
+        result = float(number)
+        return -result if negative else result
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} <formats: {self.formats}>'
+
+
+@functools.lru_cache(maxsize=64)
+def _make_parser(cls: type, locale: Union[Tuple[str, Tuple[str, ...]], None], separators: Tuple[str, ...]) -> NumberParser:
+    """ Make parser of locale or, without locale, of decimal separators (see `NumberParser.from_locale`) """
+    if locale is None:
+        return cls((
+            (separators, ()),
+            (('.',), (',',)),
+            ((',',), ('.',)),
+            (separators, SPACE_THOUSANDS_SEPARATORS),
+        ), grouping_required=True)
+
+    decimal, thousands = locale
+    return cls((((decimal,), thousands),))
+
+
+def _escape(characters) -> str:
+    """ Escape characters for character class """
+    return ''.join(re.escape(i) for i in characters)
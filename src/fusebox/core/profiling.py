@@ -0,0 +1,234 @@
+"""
+Fields profiling.
+
+Profiled field counts calls, time and failures of every stage of its plan
+(handlers, method, `process`, validators, type check) and how many values
+were handled by the plan (fast path) or went to null/skip/default fallback (slow path).
+
+Profiling can be enabled for one field, serializer's fields or globally.
+Stages are wrapped by timers only when field is profiled,
+so disabled profiling costs one attribute check per `parse` call.
+Only stats of profiled fields are registered, fields themselves aren't tracked:
+global `enable` finds existing fields by `gc`, and `disable` deactivates registered stats,
+so profiled fields drop their timers on the next call.
+Counters aren't locked: numbers are approximate if field is shared by threads
+"""
+import gc
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, List
+
+
+__all__ = (
+    'StageStats',
+    'FieldStats',
+    'ProfileReport',
+    'enable',
+    'disable',
+    'is_enabled',
+    'report',
+)
+
+# Profiling of all fields (see `enable`)
+_enabled = False
+
+# Stats of profiled fields, to report and disable them globally
+_stats = weakref.WeakSet()
+
+
+class StageStats:
+    """ Counters of one stage """
+
+    __slots__ = ('calls', 'time', 'failures')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.time = 0.0
+        self.failures = 0
+
+    def as_dict(self) -> dict:
+        return {'calls': self.calls, 'time': self.time, 'failures': self.failures}
+
+
+class FieldStats:
+    """ Counters of field and its stages """
+
+    __slots__ = (
+        'field_class', 'name', 'calls', 'time', 'failures', 'fast', 'slow', 'stages',
+        'active', '__weakref__',
+    )
+
+    def __init__(self, field_class: str, name: str = None) -> None:
+        self.field_class = field_class
+        self.name = name
+        # Stats are deactivated by `disable`, field drops them on the next call
+        self.active = True
+        self.calls = 0
+        self.time = 0.0
+        self.failures = 0
+        self.fast = 0
+        self.slow = 0
+        self.stages: Dict[str, StageStats] = {}
+
+    def stage(self, name: str) -> StageStats:
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats()
+        return stats
+
+    def reset(self) -> None:
+        self.calls = self.fast = self.slow = self.failures = 0
+        self.time = 0.0
+        for stats in self.stages.values():
+            stats.calls = stats.failures = 0
+            stats.time = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            'field': self.name,
+            'class': self.field_class,
+            'calls': self.calls,
+            'time': self.time,
+            'failures': self.failures,
+            'fast': self.fast,
+            'slow': self.slow,
+            'stages': {k: v.as_dict() for (k, v) in self.stages.items()},
+        }
+
+
+def wrap_stage(stats: FieldStats, name: str, stage: Callable) -> Callable:
+    """ Wrap stage of field's plan by timer. Stages take field and value """
+    stage_stats = stats.stage(name)
+    perf_counter = time.perf_counter
+
+    def profiled_stage(field: Any, value: Any) -> Any:
+        start = perf_counter()
+        try:
+            return stage(field, value)
+        except BaseException:
+            stage_stats.failures += 1
+            raise
+        finally:
+            stage_stats.calls += 1
+            stage_stats.time += perf_counter() - start
+
+    return profiled_stage
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class ProfileReport:
+    """
+    Fields stats, sorted by time (the hottest fields first)
+
+    Args:
+        stats (Iterable[FieldStats]): stats of fields
+        labels (dict): extra labels of Prometheus metrics (f.e. serializer name)
+    """
+
+    def __init__(self, stats: Iterable[FieldStats], labels: Dict[str, str] = None) -> None:
+        self._stats: List[FieldStats] = sorted(stats, key=lambda i: i.time, reverse=True)
+        self._labels = labels or {}
+
+    @property
+    def total_time(self) -> float:
+        return sum(i.time for i in self._stats)
+
+    def top(self, count: int = 10) -> List[FieldStats]:
+        return self._stats[:count]
+
+    def reset(self) -> None:
+        for stats in self._stats:
+            stats.reset()
+
+    def as_dict(self) -> dict:
+        return {
+            'total_time': self.total_time,
+            'fields': [i.as_dict() for i in self._stats],
+        }
+
+    def as_prometheus(self, prefix: str = 'fusebox') -> str:
+        """ Export stats in Prometheus text format """
+        metrics = (
+            ('field_calls_total', 'counter', 'Number of values handled by field'),
+            ('field_seconds_total', 'counter', 'Time spent by field'),
+            ('field_failures_total', 'counter', 'Number of values that failed'),
+            ('field_path_total', 'counter', 'Number of values by path (fast - plan, slow - fallback)'),
+            ('stage_calls_total', 'counter', 'Number of stage calls'),
+            ('stage_seconds_total', 'counter', 'Time spent by stage'),
+            ('stage_failures_total', 'counter', 'Number of stage failures'),
+        )
+        samples = {name: [] for (name, _, _) in metrics}
+
+        for stats in self._stats:
+            labels = dict(self._labels, field=stats.name, **{'class': stats.field_class})
+            samples['field_calls_total'].append((labels, stats.calls))
+            samples['field_seconds_total'].append((labels, stats.time))
+            samples['field_failures_total'].append((labels, stats.failures))
+            samples['field_path_total'].append((dict(labels, path='fast'), stats.fast))
+            samples['field_path_total'].append((dict(labels, path='slow'), stats.slow))
+
+            for stage_name, stage in stats.stages.items():
+                stage_labels = dict(labels, stage=stage_name)
+                samples['stage_calls_total'].append((stage_labels, stage.calls))
+                samples['stage_seconds_total'].append((stage_labels, stage.time))
+                samples['stage_failures_total'].append((stage_labels, stage.failures))
+
+        lines = []
+        for name, metric_type, description in metrics:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} {metric_type}')
+            for labels, value in samples[name]:
+                labels = ','.join(f'{k}="{_escape_label(v)}"' for (k, v) in labels.items())
+                lines.append(f'{prefix}_{name}{{{labels}}} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+    def __iter__(self):
+        return iter(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} <id: {id(self)}, fields: {len(self._stats)}>'
+
+
+def register(stats: FieldStats) -> FieldStats:
+    """ Register stats of profiled field. It's called by `Field.enable_profiling` """
+    _stats.add(stats)
+    return stats
+
+
+def _iter_fields() -> Iterable[Any]:
+    """ Find all existing fields. Fields aren't registered, so it's done once by `enable` """
+    from fusebox.core.fields import Field
+    return (i for i in gc.get_objects() if isinstance(i, Field))
+
+
+def enable() -> None:
+    """ Enable profiling of all existing and new fields """
+    global _enabled
+    _enabled = True
+    for field in _iter_fields():
+        field.enable_profiling()
+
+
+def disable() -> None:
+    """ Disable profiling of all fields. Collected stats are dropped """
+    global _enabled
+    _enabled = False
+    for stats in tuple(_stats):
+        stats.active = False
+    _stats.clear()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def report() -> ProfileReport:
+    """ Report of all profiled fields """
+    return ProfileReport(i for i in tuple(_stats) if i.active)
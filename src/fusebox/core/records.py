@@ -0,0 +1,122 @@
+"""
+Compact records.
+
+Record is a tuple of values with read-only dict-like access by fields names.
+Record classes are generated once for every name and fields names pair,
+so a row costs one tuple, instead of a dict (or `FieldContainer`) with its own keys table
+"""
+import json
+import keyword
+import operator
+from typing import Any, Dict, Iterator, Sequence, Tuple
+
+from fusebox.core.writers import encode_value
+
+
+__all__ = (
+    'Record',
+    'make_record_class',
+)
+
+# Generated record classes by name and fields names
+_record_classes: Dict[Tuple[str, Tuple[str, ...]], type] = {}
+
+
+def _make_record(name: str, fields: Tuple[str, ...], values: tuple) -> 'Record':
+    """ Restore pickled record. Its class is generated, if it doesn't exist in current process """
+    return make_record_class(name, fields)._make(values)
+
+
+class Record(tuple):
+    """
+    Base class of records. Like `namedtuple`, iteration and `in` work with values,
+    but values can be got by fields names (`record['name']`, `record.get('name')`)
+    and `keys`, `values`, `items` methods work like dict's ones, so `dict(record)` works too.
+    Fields with valid identifiers as names are available as attributes
+    """
+
+    __slots__ = ()
+
+    # Fields names and their indexes. They're set by `make_record_class`
+    _fields: Tuple[str, ...] = ()
+    _index: Dict[str, int] = {}
+
+    @classmethod
+    def _make(cls, values: Sequence[Any]) -> 'Record':
+        """ Create record from values in fields order """
+        values = tuple(values)
+        if len(values) != len(cls._fields):
+            raise ValueError(f'{cls.__name__} expected {len(cls._fields)} values, got {len(values)}')
+
+        return tuple.__new__(cls, values)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Record':
+        """ Create record from dict. Missing fields are `None` """
+        get = data.get
+        return tuple.__new__(cls, [get(name) for name in cls._fields])
+
+    def __getitem__(self, key: Any) -> Any:
+        if key.__class__ is str:
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._index.get(key)
+        if index is None:
+            return default
+        return tuple.__getitem__(self, index)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> tuple:
+        return tuple(self)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self._fields, self)
+
+    def as_dict(self) -> dict:
+        return dict(zip(self._fields, self))
+
+    def as_json(self) -> str:
+        """ Convert record to json """
+        return json.dumps(self.as_dict(), default=encode_value)
+
+    def __reduce__(self):
+        return _make_record, (self.__class__.__name__, self._fields, tuple(self))
+
+    def __repr__(self):
+        values = ', '.join(f'{k}={v!r}' for (k, v) in zip(self._fields, self))
+        return f'{self.__class__.__name__}({values})'
+
+
+def make_record_class(name: str, fields: Sequence[str]) -> type:
+    """
+    Get record class with given fields. Class is generated once for every name and fields
+
+    Args:
+        name (str): class name
+        fields (Sequence[str]): fields names
+    """
+    fields = tuple(fields)
+    key = (name, fields)
+    record_class = _record_classes.get(key)
+    if record_class is not None:
+        return record_class
+
+    if len(set(fields)) != len(fields):
+        raise ValueError(f'record `{name}` fields names must be unique')
+
+    namespace = {
+        '__slots__': (),
+        '_fields': fields,
+        '_index': {k: i for (i, k) in enumerate(fields)},
+    }
+    for index, field in enumerate(fields):
+        if field.isidentifier() and not keyword.iskeyword(field) \
+                and not field.startswith('_') and not hasattr(Record, field):
+            namespace[field] = property(operator.itemgetter(index), doc=f'Value of field `{field}`')
+
+    record_class = _record_classes[key] = type(name, (Record,), namespace)
+    return record_class
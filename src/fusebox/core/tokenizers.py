@@ -0,0 +1,220 @@
+"""
+Array tokenizer.
+
+Splits string into items, or nested lists of items, by separators of several levels.
+Patterns are compiled once:
+* strings without quotes and escapes are split level by level by `re.split` (in C)
+* other strings are tokenized item by item by one regex that matches item
+with its quotes and escapes and the separator after it
+"""
+import re
+import itertools
+from typing import Any, List, Sequence, Tuple, Union
+
+
+__all__ = (
+    'ArrayTokenizer',
+)
+
+
+class ArrayTokenizer:
+    """
+    Tokenizer of (nested) arrays.
+
+    F.e. levels `(';', (',', '-'))` split `1,2-3;4` into `[['1', '2', '3'], ['4']]`.
+    Separators inside quotes are part of item, escape character makes
+    the next character a part of item (use it for quotes inside items).
+    Quotes and escapes are removed from items
+
+    Args:
+        levels (Sequence): separators of levels, the outermost level first.
+        Level is a separator or a sequence of separators
+        quote (str): quote character
+        escape (str): escape character
+    """
+
+    __slots__ = ('levels', 'quote', 'escape', '_splits', '_item', '_unquote', '_special')
+
+    def __init__(self, levels: Sequence[Union[str, Sequence[str]]], quote: str = None, escape: str = None) -> None:
+        levels = tuple((i,) if isinstance(i, str) else tuple(i) for i in levels)
+        if not levels or not all(levels):
+            raise ValueError('every level must have separators')
+
+        separators = [s for level in levels for s in level]
+        if not all(separators):
+            raise ValueError('separator can\'t be empty')
+        if len(set(separators)) != len(separators):
+            raise ValueError('separators of levels must be unique')
+        if any(i and any(i in s for s in separators) for i in (quote, escape)):
+            raise ValueError('quote and escape characters can\'t be part of separators')
+
+        self.levels = levels
+        self.quote = quote
+        self.escape = escape
+        self._special = tuple(i for i in (quote, escape) if i)
+        self._splits = tuple(re.compile(self._make_alternation(i)).split for i in levels)
+        self._item, self._unquote = self._compile_item(levels, quote, escape)
+
+    @staticmethod
+    def _make_alternation(separators: Sequence[str]) -> str:
+        # The longest separators go first
+        return '|'.join(re.escape(i) for i in sorted(separators, key=len, reverse=True))
+
+    @classmethod
+    def _compile_item(cls, levels: Tuple[Tuple[str, ...], ...], quote: str, escape: str) -> tuple:
+        """
+        Compile regex of item and the separator after it (or the end of string).
+        Group 1 is item, next groups are levels
+        """
+        separators = [s for level in levels for s in level]
+        special = ''.join(re.escape(i) for i in (quote, escape) if i)
+
+        if all(len(i) == 1 for i in separators):
+            plain = f'[^{special}{"".join(re.escape(i) for i in separators)}]'
+        else:
+            plain = f'(?!{cls._make_alternation(separators)}){f"[^{special}]" if special else "."}'
+
+        alternatives = [plain]
+        quoted_content = f'[^{special}]' if special else '.'
+        if escape:
+            alternatives.append(f'{re.escape(escape)}.')
+            quoted_content = f'(?:{re.escape(escape)}.|{quoted_content})'
+        if quote:
+            alternatives.append(f'{re.escape(quote)}{quoted_content}*{re.escape(quote)}')
+
+        terminators = ''.join(f'({cls._make_alternation(i)})|' for i in levels)
+        item = re.compile(f'((?:{"|".join(alternatives)})*)(?:{terminators}\\Z)', re.DOTALL)
+
+        # Removes quotes and escapes
+        unquote = None
+        if special:
+            unquote_alternatives = []
+            if quote:
+                unquote_alternatives.append(f'{re.escape(quote)}(?P<quoted>{quoted_content}*){re.escape(quote)}')
+            if escape:
+                unquote_alternatives.append(f'{re.escape(escape)}(?P<escaped>.)')
+            unquote = re.compile('|'.join(unquote_alternatives), re.DOTALL)
+
+        return item, unquote
+
+    @property
+    def depth(self) -> int:
+        return len(self.levels)
+
+    def split(self, value: str, maxsplit: int = -1) -> List[Any]:
+        """
+        Split string
+
+        Args:
+            value (str): string to split
+            maxsplit (int): max number of splits of all levels, the rest of string
+            is the last item. Outer levels are split first. By default, there's no limit
+
+        Returns:
+            items (list): list of items or nested lists of items
+        """
+        if any(i in value for i in self._special):
+            return self._tokenize(value, maxsplit)
+
+        if len(self._splits) == 1:
+            return [value] if maxsplit == 0 else self._splits[0](value, max(maxsplit, 0))
+
+        return self._split_level(value, 0, maxsplit)[0]
+
+    def _split_level(self, value: str, level: int, maxsplit: int) -> Tuple[List[Any], int]:
+        """ Split string by separators of level and its inner levels. Returns items and splits left """
+        items = [value] if maxsplit == 0 else self._splits[level](value, max(maxsplit, 0))
+        if maxsplit > 0:
+            maxsplit -= len(items) - 1
+
+        if level + 1 < len(self._splits):
+            for index, item in enumerate(items):
+                items[index], maxsplit = self._split_level(item, level + 1, maxsplit)
+
+        return items, maxsplit
+
+    def _replace_special(self, match: re.Match) -> str:
+        if match.lastgroup == 'escaped':
+            return match.group('escaped')
+
+        quoted = match.group('quoted')
+        if self.escape and self.escape in quoted:
+            return self._unquote.sub(self._replace_special, quoted)
+        return quoted
+
+    def _tokenize(self, value: str, maxsplit: int) -> List[Any]:
+        rest = None
+        if maxsplit < 0:
+            # Tokens are `(item, separator of level 0, ..., separator of level N)` tuples
+            tokens = self._item.findall(value)
+
+            # Empty match after the end of string
+            if len(tokens) > 1 and not any(tokens[-1]) and not any(tokens[-2][1:]):
+                tokens.pop()
+
+            # Characters are skipped only if quote isn't closed or string ends with escape character
+            if sum(map(len, itertools.chain.from_iterable(tokens))) != len(value):
+                raise ValueError('unclosed quote or escape')
+        else:
+            tokens = []
+            position = 0
+            match_item = self._item.match
+            while True:
+                if len(tokens) == maxsplit:
+                    rest = value[position:]
+                    break
+
+                match = match_item(value, position)
+                if match is None:
+                    raise ValueError('unclosed quote or escape')
+
+                tokens.append(match.groups(''))
+                # Group of item is the last one only at the end of string
+                if match.lastindex == 1:
+                    break
+                position = match.end()
+
+        items = self._clean_items([i[0] for i in tokens])
+        depth = len(self.levels)
+        if depth == 1:
+            if rest is not None:
+                items.append(rest)
+            return items
+
+        # Current lists of levels, the innermost list is the last one
+        lists = [[] for _ in range(depth)]
+        for item, token in zip(items, tokens):
+            lists[-1].append(item)
+            for level in range(depth):
+                if token[level + 1]:
+                    break
+            else:
+                continue
+
+            # Close lists of levels inside separator's level
+            for inner in range(depth - 1, level, -1):
+                lists[inner - 1].append(lists[inner])
+                lists[inner] = []
+
+        if rest is not None:
+            lists[-1].append(rest)
+
+        for level in range(depth - 1, 0, -1):
+            lists[level - 1].append(lists[level])
+
+        return lists[0]
+
+    def _clean_items(self, items: List[str]) -> List[str]:
+        """ Remove quotes and escapes """
+        quote = self.quote
+        escape = self.escape
+        if not escape:
+            # Without escapes all quote characters are pairs of quotes
+            return [i.replace(quote, '') for i in items]
+
+        sub = self._unquote.sub
+        replace = self._replace_special
+        return [sub(replace, i) if escape in i else (i.replace(quote, '') if quote else i) for i in items]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} <levels: {self.levels}, quote: {self.quote!r}, escape: {self.escape!r}>'
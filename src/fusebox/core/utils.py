@@ -1,10 +1,14 @@
 """
 Useful utils
 """
+import itertools
+from typing import Iterable, Iterator, List
 
 
 __all__ = (
     'get_separator',
+    'import_numpy',
+    'iter_chunks',
 )
 
 
@@ -14,3 +18,27 @@ def get_separator(separators, string):
         for separator in separators:
             if separator in string:
                 return separator
+
+
+def import_numpy():
+    """ Import optional `numpy` dependency """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError('`numpy` is required for columnar processing.'
+                          ' Install it by `python -m pip install numpy`')
+
+    return numpy
+
+
+def iter_chunks(iterable: Iterable, size: int) -> Iterator[List]:
+    """ Split iterable into lists of `size` items lazily """
+    if size < 1:
+        raise ValueError('chunk size must be positive')
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
@@ -1,6 +1,7 @@
 import abc
 import re
-from typing import Any, Iterable
+import operator
+from typing import Any, Callable, Iterable, Sequence, Tuple, Union
 
 from fusebox.core.etc import OPERATORS
 from fusebox.core.exceptions import ValidationError
@@ -12,8 +13,18 @@ __all__ = (
     'MaxLengthValidator',
     'RangeValidator',
     'CompareValidator',
+    'RegexValidator',
+    'ValidatorChain',
 )
 
+# Subjects of validators bounds (see `IValidator.bounds`)
+BOUNDS_LENGTH = 'length'
+BOUNDS_VALUE = 'value'
+
+# Types of values that can be checked by fused bounds check
+SIZED_TYPES = frozenset((str, bytes, list, tuple, dict, set, frozenset))
+NUMBER_TYPES = frozenset((int, float))
+
 
 class IValidator:
 
@@ -21,6 +32,28 @@ class IValidator:
     def validate(self, value: Any):
         pass
 
+    def bounds(self) -> Union[Tuple[str, Any, bool, Any, bool, bool], None]:
+        """
+        Describe validator as bounds check, so adjacent validators
+        can be merged by `ValidatorChain`
+
+        Returns:
+            `None` or tuple of subject (`BOUNDS_LENGTH` or `BOUNDS_VALUE`),
+            lower bound, is lower bound inclusive, upper bound, is upper bound inclusive
+            and if value must be integer. Unbounded side is `None`
+        """
+        return None
+
+
+class IAsyncValidator:
+    """
+    Validator that does I/O. It's awaited by `Field.aparse`
+    """
+
+    @abc.abstractmethod
+    async def validate(self, value: Any):
+        pass
+
 
 class MinLengthValidator(IValidator):
 
@@ -34,6 +67,10 @@ class MinLengthValidator(IValidator):
         if not self._min_length > len(value):
             raise ValidationError("Value is less than min length.")
 
+    def bounds(self):
+        # Same condition as in method `validate`
+        return BOUNDS_LENGTH, None, False, self._min_length, False, False
+
 
 class MaxLengthValidator(IValidator):
 
@@ -47,17 +84,46 @@ class MaxLengthValidator(IValidator):
         if not self._max_length < len(value):
             raise ValidationError("Value is bigger than max length.")
 
+    def bounds(self):
+        # Same condition as in method `validate`
+        return BOUNDS_LENGTH, self._max_length, False, None, False, False
+
 
 class CompareValidator(IValidator):
 
     def __init__(self, value, *operators) -> None:
+        for symbol in operators:
+            if symbol not in OPERATORS:
+                raise ValueError(f'unknown operator `{symbol}`')
+
         self._value = value
-        self._operators = (OPERATORS.get(i) for i in operators)
+        self._symbols = operators
+        self._operators = tuple(OPERATORS[i] for i in operators)
 
     def validate(self, value) -> None:
-        for operator in self._operators:
-            if not operator(value, self._value):
-                raise ValidationError(f"Something went wrong while using f{operator} operator.")
+        for symbol, operator_ in zip(self._symbols, self._operators):
+            if not operator_(value, self._value):
+                raise ValidationError(f"Value doesn't satisfy `{symbol} {self._value}` condition.")
+
+    def bounds(self):
+        lower = upper = None
+        lower_inclusive = upper_inclusive = False
+
+        for symbol in self._symbols:
+            if symbol in ('>', '>=', '='):
+                if lower is not None:
+                    return None
+                lower, lower_inclusive = self._value, symbol != '>'
+
+            if symbol in ('<', '=<', '='):
+                if upper is not None:
+                    return None
+                upper, upper_inclusive = self._value, symbol != '<'
+
+            if symbol == '!=':
+                return None
+
+        return BOUNDS_VALUE, lower, lower_inclusive, upper, upper_inclusive, False
 
 
 class RangeValidator(IValidator):
@@ -70,19 +136,167 @@ class RangeValidator(IValidator):
         if value not in range(self._min_val, self._max_val):
             raise ValidationError("Value is out of range.")
 
+    def bounds(self):
+        return BOUNDS_VALUE, self._min_val, True, self._max_val, False, True
+
 
 class RegexValidator(IValidator):
 
     def __init__(self, regex: str) -> None:
         self._regex = regex
-
-    def validate(self, value: Any):
         try:
-            if not re.match(self._regex, value):
-                raise ValidationError(f"Cant parse given regular expression with value {value}.")
-
+            self._pattern = re.compile(regex)
         except re.error:
+            self._pattern = None
+
+    def validate(self, value: Any):
+        if self._pattern is None:
             raise ValidationError("Can't parse given regular expression.", 'regex_error')
 
+        if not self._pattern.match(value):
+            raise ValidationError(f"Cant parse given regular expression with value {value}.")
+
+
+class BoundsCheck(IValidator):
+    """
+    Fused check of adjacent validators bounds.
+    If fast check fails (or value type isn't supported),
+    original validators are called to raise the same error
+    """
+
+    def __init__(self, validators: Sequence[IValidator], bounds: Tuple) -> None:
+        self._validators = tuple(validators)
+        self._check = self._make_check(*bounds)
+
+    @staticmethod
+    def _make_check(subject, lower, lower_inclusive, upper, upper_inclusive, integral) -> Callable:
+        if subject == BOUNDS_LENGTH:
+            types = SIZED_TYPES
+        elif integral:
+            types = frozenset((int,))
+        elif isinstance(lower if lower is not None else upper, str):
+            types = frozenset((str,))
+        else:
+            types = NUMBER_TYPES
+
+        lower_op = operator.ge if lower_inclusive else operator.gt
+        upper_op = operator.le if upper_inclusive else operator.lt
+        length = subject == BOUNDS_LENGTH
+
+        def check(value: Any) -> bool:
+            if type(value) not in types:
+                return False
+
+            if length:
+                value = len(value)
+
+            return (
+                (lower is None or lower_op(value, lower))
+                and (upper is None or upper_op(value, upper))
+            )
+
+        return check
+
+    def validate(self, value: Any):
+        if not self._check(value):
+            for validator in self._validators:
+                validator.validate(value)
+
+
+def _bounds_type(bound: Any) -> Union[type, None]:
+    """ Bounds can be merged only if they are numbers or strings """
+    if isinstance(bound, bool):
+        return None
+    if isinstance(bound, (int, float)):
+        return float
+    if isinstance(bound, str):
+        return str
+    return None
+
+
+def _merge_bounds(first: Tuple, second: Tuple) -> Union[Tuple, None]:
+    """ Intersect two bounds or return `None` if they can't be merged """
+    subject, lower, lower_inclusive, upper, upper_inclusive, integral = first
+    if second[0] != subject:
+        return None
+
+    kinds = {_bounds_type(b) for b in (lower, upper, second[1], second[3]) if b is not None}
+    if len(kinds) != 1 or None in kinds:
+        return None
+
+    if second[1] is not None:
+        if lower is None or second[1] > lower or (second[1] == lower and not second[2]):
+            lower, lower_inclusive = second[1], second[2]
+
+    if second[3] is not None:
+        if upper is None or second[3] < upper or (second[3] == upper and not second[4]):
+            upper, upper_inclusive = second[3], second[4]
+
+    return subject, lower, lower_inclusive, upper, upper_inclusive, integral or second[5]
+
+
+class ValidatorChain(IValidator):
+    """
+    Compiled chain of validators.
+
+    Adjacent validators with bounds (`MinLengthValidator`, `MaxLengthValidator`,
+    `RangeValidator`, `CompareValidator`) are merged into one bounds check.
+    Error messages are built only if value fails.
+    Chain is immutable, so it can be reused for any number of values
+    and shared across threads
+    """
+
+    def __init__(self, validators: Iterable[IValidator]) -> None:
+        self._validators = tuple(validators)
+        self._steps = self._compile(self._validators)
+
+        if len(self._steps) == 1:
+            self.validate = self._steps[0]
+
+    @staticmethod
+    def _compile(validators: Sequence[IValidator]) -> Tuple[Callable, ...]:
+        steps = []
+        group = []
+        group_bounds = None
+
+        def flush():
+            if not group:
+                return
+            if len(group) == 1:
+                steps.append(group[0].validate)
+            else:
+                steps.append(BoundsCheck(group, group_bounds).validate)
+            group.clear()
+
+        for validator in validators:
+            bounds = validator.bounds()
+            if bounds is not None and _bounds_type(bounds[1] if bounds[1] is not None else bounds[3]):
+                merged = _merge_bounds(group_bounds, bounds) if group else bounds
+                if merged is not None:
+                    group.append(validator)
+                    group_bounds = merged
+                    continue
+
+                flush()
+                group.append(validator)
+                group_bounds = bounds
+                continue
+
+            flush()
+            steps.append(validator.validate)
+
+        flush()
+        return tuple(steps)
+
+    def validate(self, value: Any):
+        for step in self._steps:
+            step(value)
+
+    def __reduce__(self):
+        return self.__class__, (self._validators,)
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
 
 EmailValidator = RegexValidator(r"([A-Za-z0-9]+[.-_])*[A-Za-z0-9]+@[A-Za-z0-9-]+(\.[A-Z|a-z]{2,})+")
@@ -0,0 +1,252 @@
+"""
+Streaming output of serialized rows.
+
+Rows are encoded one by one by C `json` encoder and written
+to file-like object in large blocks, so memory doesn't depend on number of rows
+"""
+import io
+import json
+import datetime
+import operator
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any, Callable, Dict, Iterable
+
+from fusebox.core.etc import WRITER_BUFFER_SIZE
+
+
+__all__ = (
+    'ValueEncoder',
+    'JsonWriter',
+    'encode_value',
+)
+
+# Output formats
+FORMAT_NDJSON = 'ndjson'
+FORMAT_JSON = 'json'
+
+# `Fraction` output formats
+FRACTION_FLOAT = 'float'
+FRACTION_STRING = 'string'
+FRACTION_PAIR = 'pair'
+
+# `Decimal` output formats
+DECIMAL_FLOAT = 'float'
+DECIMAL_STRING = 'string'
+
+
+class ValueEncoder:
+    """
+    Encoder of values that `json` doesn't support. It's used as `default` of `json` encoder.
+    Encoder is chosen by exact type of value, encoders of dates are C methods
+
+    Args:
+        datetime_format (str): `strftime` format of `datetime`. By default, ISO 8601
+        date_format (str): `strftime` format of `date`. By default, ISO 8601
+        time_format (str): `strftime` format of `time`. By default, ISO 8601
+        fraction_format (str): `float`, `string` ("3/4") or `pair` ([3, 4])
+        decimal_format (str): `string` or `float`
+    """
+
+    __slots__ = ('_encoders', '_get_encoder')
+
+    def __init__(
+        self,
+        datetime_format: str = None,
+        date_format: str = None,
+        time_format: str = None,
+        fraction_format: str = FRACTION_FLOAT,
+        decimal_format: str = DECIMAL_STRING,
+    ) -> None:
+        fraction_encoders = {
+            FRACTION_FLOAT: float,
+            FRACTION_STRING: str,
+            FRACTION_PAIR: lambda value: [value.numerator, value.denominator],
+        }
+        decimal_encoders = {
+            DECIMAL_FLOAT: float,
+            DECIMAL_STRING: str,
+        }
+        if fraction_format not in fraction_encoders:
+            raise ValueError(f'unknown fraction format `{fraction_format}`')
+
+        if decimal_format not in decimal_encoders:
+            raise ValueError(f'unknown decimal format `{decimal_format}`')
+
+        self._encoders: Dict[type, Callable[[Any], Any]] = {
+            datetime.datetime: self._make_time_encoder(datetime_format),
+            datetime.date: self._make_time_encoder(date_format),
+            datetime.time: self._make_time_encoder(time_format),
+            Fraction: fraction_encoders[fraction_format],
+            Decimal: decimal_encoders[decimal_format],
+            set: list,
+            frozenset: list,
+        }
+        self._get_encoder = self._encoders.get
+
+    @staticmethod
+    def _make_time_encoder(time_format: str = None) -> Callable[[Any], str]:
+        if time_format is None:
+            return operator.methodcaller('isoformat')
+        return operator.methodcaller('strftime', time_format)
+
+    def __call__(self, value: Any) -> Any:
+        encoder = self._get_encoder(value.__class__)
+        if encoder is not None:
+            return encoder(value)
+
+        # Subclasses of supported types
+        for value_type, encoder in self._encoders.items():
+            if isinstance(value, value_type):
+                return encoder(value)
+
+        # Records, `FieldContainer`, `array.array`, `numpy` arrays and scalars
+        if hasattr(value, 'as_dict'):
+            return value.as_dict()
+
+        if hasattr(value, 'tolist'):
+            return value.tolist()
+
+        raise TypeError(f'Object of type {value.__class__.__name__} is not JSON serializable')
+
+
+# Encoder with default formats
+encode_value = ValueEncoder()
+
+
+def _is_binary_file(file: Any) -> bool:
+    """ File-like object takes bytes """
+    if isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+
+    mode = getattr(file, 'mode', None)
+    return isinstance(mode, str) and 'b' in mode
+
+
+class JsonWriter:
+    """
+    Streaming writer of rows. Rows are written as NDJSON (one row per line)
+    or as one JSON array. Rows can be dicts, records or `FieldContainer (-s)`
+
+    Example:
+        >>> with open('users.ndjson', 'w') as file, JsonWriter(file) as writer:
+        >>>     writer.write_many(UserSerializer().iter_handle(rows))
+
+    Args:
+        file: text or binary file-like object
+        output_format (str): `ndjson` or `json`
+        buffer_size (int): size of buffer (in characters)
+        encoder (ValueEncoder): encoder of values that `json` doesn't support
+        ensure_ascii (bool): escape non-ASCII characters
+        binary (bool): write bytes. By default, file is binary if it's `io` binary stream
+        or its `mode` has `b`, other objects (f.e. duck-typed writers) get strings
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        output_format: str = FORMAT_NDJSON,
+        buffer_size: int = WRITER_BUFFER_SIZE,
+        encoder: ValueEncoder = None,
+        ensure_ascii: bool = False,
+        binary: bool = None,
+    ) -> None:
+        if output_format not in (FORMAT_NDJSON, FORMAT_JSON):
+            raise ValueError(f'unknown output format `{output_format}`')
+
+        self._file = file
+        self._binary = _is_binary_file(file) if binary is None else binary
+        self._array = output_format == FORMAT_JSON
+        self._separator = ',\n' if self._array else '\n'
+        self._buffer_size = buffer_size
+        self._encode = json.JSONEncoder(
+            default=encoder or encode_value,
+            ensure_ascii=ensure_ascii,
+            check_circular=False,
+            separators=(',', ':'),
+        ).encode
+
+        self._buffer = []
+        self._buffered = 0
+        self._count = 0
+        self._closed = False
+
+    @property
+    def count(self) -> int:
+        """ Number of written rows """
+        return self._count
+
+    def _prepare_row(self, row: Any) -> Any:
+        # `json` encodes tuples (and records) as arrays
+        if row.__class__ is dict or row is None:
+            return row
+        if hasattr(row, 'as_dict'):
+            return row.as_dict()
+        return row
+
+    def write(self, row: Any) -> None:
+        """ Write one row. `None` (failed row) is written as `null` """
+        self.write_many((row,))
+
+    def write_many(self, rows: Iterable[Any]) -> int:
+        """
+        Write rows
+
+        Returns:
+            count (int): number of written rows
+        """
+        if self._closed:
+            raise ValueError('writer is closed')
+
+        encode = self._encode
+        prepare = self._prepare_row
+        separator = self._separator
+        append = self._buffer.append
+
+        start = self._count
+        for row in rows:
+            chunk = encode(prepare(row))
+            if self._count:
+                chunk = separator + chunk
+            elif self._array:
+                chunk = '[\n' + chunk
+
+            append(chunk)
+            self._count += 1
+            self._buffered += len(chunk)
+            if self._buffered >= self._buffer_size:
+                self.flush()
+
+        return self._count - start
+
+    def flush(self) -> None:
+        """ Write buffer to file """
+        if self._buffer:
+            self._write(''.join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+    def _write(self, data: str) -> None:
+        self._file.write(data.encode() if self._binary else data)
+
+    def close(self) -> None:
+        """ Write the rest of buffer and close JSON array. File itself isn't closed """
+        if self._closed:
+            return
+
+        if self._array:
+            self._buffer.append('\n]\n' if self._count else '[]\n')
+        elif self._count:
+            self._buffer.append('\n')
+
+        self.flush()
+        self._closed = True
+
+    def __enter__(self) -> 'JsonWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} <id: {id(self)}, rows: {self._count}>'
@@ -0,0 +1,139 @@
+"""
+Generated row handlers for serializers.
+
+Handler is a plain function specialized to exact serializer's fields:
+required checks and fields dispatch are unrolled, fields `parse` methods are bound as locals.
+Like `dataclasses` do for `__init__`.
+Record handlers put values in record's fields order and create record from them
+"""
+from typing import Callable
+
+from fusebox.orm.exceptions import UndeclaredField
+
+
+__all__ = (
+    'make_row_handler',
+    'make_record_handler',
+)
+
+ROW_HANDLER_NAME = 'handle_row'
+RECORD_HANDLER_NAME = 'handle_record'
+
+# Marker of missing key
+_MISSING = object()
+
+
+def make_row_source(projection) -> str:
+    """
+    Generate source of row handler
+
+    Args:
+        projection (SchemaProjection): serializer's fields projection
+    """
+    lines = [f'def {ROW_HANDLER_NAME}(data):']
+
+    if projection.required:
+        lines.append('    get = data.get')
+
+    for name in projection.required:
+        field = projection.fields[name]
+        message = f'Input data doesnt contain field {name} ({field.__class__.__name__})'
+        lines.append(f'    if not get({name!r}):')
+        lines.append(f'        raise KeyError({message!r})')
+
+    lines.append('    result = {}')
+
+    if projection.fields:
+        lines.append('    for key, value in data.items():')
+        for index, name in enumerate(projection.fields):
+            statement = 'if' if index == 0 else 'elif'
+            lines.append(f'        {statement} key == {name!r}:')
+            lines.append(f'            result[{name!r}] = parse_{index}(value)')
+        lines.append('        else:')
+        lines.append('            raise UndeclaredField(key)')
+
+    else:
+        lines.append('    for key in data:')
+        lines.append('        raise UndeclaredField(key)')
+
+    lines.append('    return result')
+    return '\n'.join(lines) + '\n'
+
+
+def make_record_source(projection) -> str:
+    """
+    Generate source of record handler.
+    Missing fields are `None`, undeclared keys are found only if number of keys doesn't match
+
+    Args:
+        projection (SchemaProjection): serializer's fields projection
+    """
+    lines = [
+        f'def {RECORD_HANDLER_NAME}(data):',
+        '    get = data.get',
+    ]
+
+    for name in projection.required:
+        field = projection.fields[name]
+        message = f'Input data doesnt contain field {name} ({field.__class__.__name__})'
+        lines.append(f'    if not get({name!r}):')
+        lines.append(f'        raise KeyError({message!r})')
+
+    lines.append('    found = 0')
+    for index, name in enumerate(projection.fields):
+        lines.append(f'    value_{index} = get({name!r}, MISSING)')
+        lines.append(f'    if value_{index} is MISSING:')
+        lines.append(f'        value_{index} = None')
+        lines.append('    else:')
+        lines.append('        found += 1')
+        lines.append(f'        value_{index} = parse_{index}(value_{index})')
+
+    lines.append('    if found != len(data):')
+    lines.append('        for key in data:')
+    lines.append('            if key not in FIELDS:')
+    lines.append('                raise UndeclaredField(key)')
+
+    values = ''.join(f'value_{i}, ' for i in range(len(projection.fields)))
+    lines.append(f'    return new(Record, ({values}))')
+    return '\n'.join(lines) + '\n'
+
+
+def _exec_handler(source: str, name: str, namespace: dict, projection) -> Callable:
+    exec(compile(source, f'<fusebox {name} {id(projection)}>', 'exec'), namespace)
+
+    handler = namespace[name]
+    handler.__source__ = source
+    return handler
+
+
+def make_row_handler(projection) -> Callable:
+    """
+    Create row handler. Source is available as `__source__` attribute
+
+    Args:
+        projection (SchemaProjection): serializer's fields projection
+    """
+    source = make_row_source(projection)
+    namespace = {f'parse_{i}': field.parse for (i, field) in enumerate(projection.fields.values())}
+    namespace['UndeclaredField'] = UndeclaredField
+    return _exec_handler(source, ROW_HANDLER_NAME, namespace, projection)
+
+
+def make_record_handler(projection, record_class: type) -> Callable:
+    """
+    Create record handler. Source is available as `__source__` attribute
+
+    Args:
+        projection (SchemaProjection): serializer's fields projection
+        record_class (type): record class with projection's fields (see `make_record_class`)
+    """
+    source = make_record_source(projection)
+    namespace = {f'parse_{i}': field.parse for (i, field) in enumerate(projection.fields.values())}
+    namespace.update(
+        UndeclaredField=UndeclaredField,
+        MISSING=_MISSING,
+        FIELDS=frozenset(projection.fields),
+        Record=record_class,
+        new=tuple.__new__,
+    )
+    return _exec_handler(source, RECORD_HANDLER_NAME, namespace, projection)
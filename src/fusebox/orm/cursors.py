@@ -0,0 +1,109 @@
+"""
+DB-API cursor rows handling.
+
+Rows (tuples) are handled positionally: every column gets its field once,
+by name (declared fields) or by type of the first batch values (inferred fields)
+"""
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
+
+from fusebox.core.containers import FieldContainer
+
+
+__all__ = (
+    'get_columns',
+    'iter_cursor_batches',
+    'infer_column_types',
+    'make_rows_handler',
+)
+
+
+def get_columns(description: Sequence[Sequence[Any]]) -> Tuple[str, ...]:
+    """ Get columns names from `cursor.description` """
+    if not description:
+        raise ValueError('cursor description is empty, execute a query first')
+
+    return tuple(column[0] for column in description)
+
+
+def iter_cursor_batches(cursor: Any, batch_size: int) -> Iterator[List[tuple]]:
+    """ Fetch rows by `fetchmany` """
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield rows
+
+
+def infer_column_types(columns: Sequence[str], rows: Sequence[tuple]) -> Tuple[type, ...]:
+    """ Get type of the first not `None` value of every column """
+    types = []
+    for index in range(len(columns)):
+        column_type = type(None)
+        for row in rows:
+            if row[index] is not None:
+                column_type = type(row[index])
+                break
+
+        types.append(column_type)
+
+    return tuple(types)
+
+
+def make_rows_handler(
+    fields: Sequence[Any],
+    as_field_dict: bool = False,
+    as_dict: bool = False,
+    record_class: type = None,
+) -> Callable[[tuple], Any]:
+    """
+    Make handler of rows, fields are in columns order
+
+    Args:
+        fields (Sequence): fields of columns
+        as_field_dict (bool): return `FieldContainer`
+        as_dict (bool): convert `FieldContainer` or record to dict
+        record_class (type): return records of given class (see `make_record_class`)
+    """
+    names = tuple(field.name for field in fields)
+    parsers = tuple(field.parse for field in fields)
+    required = tuple(
+        (index, f'Input data doesnt contain field {field.name} ({field.__class__.__name__})')
+        for (index, field) in enumerate(fields) if getattr(field, 'required', False)
+    )
+
+    def check_required(row: tuple) -> None:
+        for index, message in required:
+            if not row[index]:
+                raise KeyError(message)
+
+    if as_field_dict:
+        def handle_row(row: tuple) -> Any:
+            check_required(row)
+
+            field_dict = FieldContainer()
+            for field, parse, value in zip(fields, parsers, row):
+                field_dict.add(field.name, field, parse(value))
+
+            if as_dict:
+                return field_dict.as_dict(full_house=True)
+
+            return field_dict
+
+    elif record_class is not None and not as_dict:
+        new = tuple.__new__
+
+        def handle_row(row: tuple) -> Any:
+            check_required(row)
+            return new(record_class, [parse(value) for (parse, value) in zip(parsers, row)])
+
+    elif required:
+        def handle_row(row: tuple) -> dict:
+            check_required(row)
+            return {name: parse(value) for (name, parse, value) in zip(names, parsers, row)}
+
+    else:
+        def handle_row(row: tuple) -> dict:
+            return {name: parse(value) for (name, parse, value) in zip(names, parsers, row)}
+
+    return handle_row
+
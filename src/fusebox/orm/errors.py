@@ -0,0 +1,92 @@
+"""
+Errors accumulation.
+
+Errors are stored as compact records in a side table instead of being raised
+"""
+from collections import namedtuple
+from typing import Any, Iterator, List, Union
+
+
+__all__ = (
+    'FieldError',
+    'ErrorTable',
+)
+
+# Error codes for errors without `code_name`
+ERROR_REQUIRED = 'required'
+ERROR_UNKNOWN = 'error'
+
+# Error record
+#   * row - row index
+#   * field - field name or `None`, if error isn't related to field
+#   * code_name - error code (`code_name` of `ValidationError`, `handler_error`, `required`, etc.)
+#   * message - error message
+#   * value - raw input value
+FieldError = namedtuple('FieldError', ('row', 'field', 'code_name', 'message', 'value'))
+
+
+def get_code_name(error: Exception) -> str:
+    return getattr(error, 'code_name', None) or ERROR_UNKNOWN
+
+
+class ErrorTable:
+    """
+    Table of errors.
+    Only `max_errors` errors are stored, the rest are counted
+    """
+
+    __slots__ = ('_errors', '_max_errors', '_total', '_rows')
+
+    def __init__(self, max_errors: int = None) -> None:
+        self._errors: List[FieldError] = []
+        self._max_errors = max_errors
+        self._total = 0
+        self._rows = set()
+
+    def add(self, row: int, field: Union[str, None], code_name: str, message: str, value: Any = None) -> None:
+        self._total += 1
+        self._rows.add(row)
+        if self._max_errors is None or len(self._errors) < self._max_errors:
+            self._errors.append(FieldError(row, field, code_name, message, value))
+
+    def add_error(self, row: int, field: Union[str, None], error: Exception, value: Any = None) -> None:
+        self.add(row, field, get_code_name(error), str(error), value)
+
+    @property
+    def total(self) -> int:
+        """ Number of all errors, including not stored ones """
+        return self._total
+
+    @property
+    def truncated(self) -> bool:
+        """ Some errors weren't stored because of `max_errors` """
+        return self._total > len(self._errors)
+
+    @property
+    def failed_rows(self) -> int:
+        return len(self._rows)
+
+    def by_row(self) -> dict:
+        """ Group errors by row index """
+        rows = {}
+        for error in self._errors:
+            rows.setdefault(error.row, []).append(error)
+        return rows
+
+    def as_dicts(self) -> List[dict]:
+        return [error._asdict() for error in self._errors]
+
+    def __iter__(self) -> Iterator[FieldError]:
+        return iter(self._errors)
+
+    def __getitem__(self, index: int) -> FieldError:
+        return self._errors[index]
+
+    def __len__(self) -> int:
+        return len(self._errors)
+
+    def __bool__(self) -> bool:
+        return self._total > 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} <id: {id(self)}, errors: {self._total}, rows: {len(self._rows)}>'
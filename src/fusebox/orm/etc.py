@@ -2,15 +2,32 @@ import datetime
 
 SERIALIZER_META_ALL_FIELDS = '__all__'
 
+# Max number of rows handled concurrently by `ahandle`
+SERIALIZER_ASYNC_CONCURRENCY = 64
+
+# Number of rows fetched by `fetchmany` (see `iter_cursor`)
+SERIALIZER_CURSOR_BATCH_SIZE = 1000
+
+# Max number of errors stored by `handle_collect`
+SERIALIZER_MAX_ERRORS = 1000
+
+# Number of models that `ModelSerializer` guesses fields types by (see `many`)
+SERIALIZER_SAMPLE_SIZE = 100
+
 SERIALIZER_META_MAIN_ATTRS = (
     'fields', 'model',
 )
 
+# Field classes of values types.
+# Lists and tuples (f.e. Postgres arrays) are already split, so they're passed through by `Field`,
+# `ArrayField` splits strings and can't be created without `child_field`.
+# Attributes that are `None` in all sampled models are passed through too
 SERIALIZER_FIELDS_MAPPING = {
+    type(None): 'Field',
     int: 'IntegerField',
     float: 'FloatField',
     str: 'StringField',
-    list: 'ArrayField',
-    tuple: 'ArrayField',
+    list: 'Field',
+    tuple: 'Field',
     datetime.datetime: 'DateField',
 }
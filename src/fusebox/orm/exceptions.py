@@ -1,5 +1,7 @@
 class UndeclaredField(AttributeError):
 
+    code_name = 'undeclared_field'
+
     def __init__(self, field_name: str) -> None:
         self._field_name = field_name
 
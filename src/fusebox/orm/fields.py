@@ -11,9 +11,19 @@ __all__ = ('Field', 'StringField', 'IntegerField',
 
 
 class Field(fields.Field):
+    """
+    Base orm field. It's mixed with core fields, so it has no slots of its own:
+    its attributes are added to slots of subclasses (see `fields.FieldMeta`)
+    """
+
+    __slots__ = ()
 
     __add_slots__ = ('_required', '_read_only', '_write_only')
 
+    def __new__(cls, *args, **kwargs):
+        # Mixin itself can't hold its attributes, so plain fields are instances of `_Field`
+        return super().__new__(_Field if cls is Field else cls)
+
     def __init__(
         self, *,
         required: bool = False,
@@ -35,8 +45,15 @@ class Field(fields.Field):
         return self._required
 
 
-StringField = type('StringField', (Field, fields.StringField), {})
-IntegerField = type('IntegerField', (Field, fields.IntegerField), {})
-FloatField = type('FloatField', (Field, fields.FloatField), {})
-ArrayField = type('ArrayField', (Field, fields.ArrayField), {})
-DateField = type('DateField', (Field, fields.DateField), {})
+def _make_field(name: str, *bases: type, **namespace) -> type:
+    """ Make concrete orm field (`__module__` must be set, or it's taken from `FieldMeta`) """
+    return type(name, (Field, *bases), dict(namespace, __add_slots__=(), __module__=__name__))
+
+
+_Field = _make_field('Field', __qualname__='_Field')
+
+StringField = _make_field('StringField', fields.StringField)
+IntegerField = _make_field('IntegerField', fields.IntegerField)
+FloatField = _make_field('FloatField', fields.FloatField)
+ArrayField = _make_field('ArrayField', fields.ArrayField)
+DateField = _make_field('DateField', fields.DateField)
@@ -0,0 +1,128 @@
+"""
+Models attributes extraction.
+
+Supported models: SQLAlchemy-like models (`_sa_instance_state`),
+models with `__values__` dict, namedtuples, dataclasses, `__slots__` classes and plain objects.
+Extraction plan (getter) is built once for every model class and fields names
+"""
+import operator
+from typing import Any, Callable, Sequence, Tuple
+
+
+__all__ = (
+    'get_model_kind',
+    'make_dict_getter',
+    'make_values_getter',
+)
+
+MODEL_VALUES = 'values'
+MODEL_SQLALCHEMY = 'sqlalchemy'
+MODEL_NAMEDTUPLE = 'namedtuple'
+MODEL_DATACLASS = 'dataclass'
+MODEL_SLOTS = 'slots'
+MODEL_OBJECT = 'object'
+
+
+def get_model_kind(model: Any) -> str:
+    """ Get kind of model by its instance """
+    if hasattr(model, '__values__'):
+        return MODEL_VALUES
+
+    if hasattr(model, '_sa_instance_state'):
+        return MODEL_SQLALCHEMY
+
+    if isinstance(model, type):
+        raise ValueError('Model attrs dict is empty'
+                         ' or doesnt contain needed attributes')
+
+    if isinstance(model, tuple) and hasattr(model, '_fields'):
+        return MODEL_NAMEDTUPLE
+
+    # Same check as `dataclasses.is_dataclass`, without importing `dataclasses`
+    if hasattr(type(model), '__dataclass_fields__'):
+        return MODEL_DATACLASS
+
+    if not hasattr(model, '__dict__'):
+        return MODEL_SLOTS
+
+    return MODEL_OBJECT
+
+
+def get_slots(model_class: type) -> Tuple[str, ...]:
+    """ Get all slots of class and its parents """
+    slots = []
+    for cls in reversed(model_class.__mro__):
+        cls_slots = cls.__dict__.get('__slots__', ())
+        if isinstance(cls_slots, str):
+            cls_slots = (cls_slots,)
+        slots.extend(i for i in cls_slots if i not in ('__dict__', '__weakref__') and i not in slots)
+
+    return tuple(slots)
+
+
+def make_dict_getter(model_class: type, kind: str) -> Callable[[Any], dict]:
+    """ Make function that returns dict of model attributes """
+    if kind == MODEL_VALUES:
+        return operator.attrgetter('__values__')
+
+    if kind == MODEL_SQLALCHEMY:
+        return operator.attrgetter('_sa_instance_state.dict')
+
+    if kind == MODEL_NAMEDTUPLE:
+        names = model_class._fields
+        return lambda model: dict(zip(names, model))
+
+    if kind == MODEL_DATACLASS:
+        # Model is a dataclass, so `dataclasses` is already imported
+        import dataclasses
+        names = tuple(i.name for i in dataclasses.fields(model_class))
+    elif kind == MODEL_SLOTS:
+        names = get_slots(model_class)
+    else:
+        return lambda model: dict(vars(model))
+
+    def get_dict(model: Any) -> dict:
+        return {name: getattr(model, name) for name in names if hasattr(model, name)}
+
+    return get_dict
+
+
+def make_values_getter(model_class: type, kind: str, names: Sequence[str]) -> Callable[[Any], tuple]:
+    """
+    Make function that returns tuple of model attributes by names.
+    Missing attributes are `None`
+    """
+    names = tuple(names)
+
+    if kind in (MODEL_VALUES, MODEL_SQLALCHEMY):
+        get_dict = make_dict_getter(model_class, kind)
+
+        def get_values(model: Any) -> tuple:
+            get = get_dict(model).get
+            return tuple([get(name) for name in names])
+
+        return get_values
+
+    if kind == MODEL_NAMEDTUPLE and all(name in model_class._fields for name in names):
+        if len(names) == 1:
+            index = model_class._fields.index(names[0])
+            return lambda model: (model[index],)
+
+        if names:
+            return operator.itemgetter(*(model_class._fields.index(name) for name in names))
+
+    if len(names) > 1:
+        getter = operator.attrgetter(*names)
+    elif names:
+        single = operator.attrgetter(names[0])
+        getter = lambda model: (single(model),)  # noqa: E731
+    else:
+        return lambda model: ()
+
+    def get_values(model: Any) -> tuple:
+        try:
+            return getter(model)
+        except AttributeError:
+            return tuple([getattr(model, name, None) for name in names])
+
+    return get_values
@@ -0,0 +1,182 @@
+"""
+Parallel serialization by worker processes.
+
+Serializer (with its fields, handlers and validators) is pickled once
+and sent to every worker by pool initializer, chunks contain only rows.
+Chunk size is adapted to `TARGET_CHUNK_TIME` by measured processing time
+"""
+import os
+import pickle
+import time
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Iterable, Iterator, List, Tuple
+
+
+__all__ = (
+    'handle_parallel',
+)
+
+MIN_CHUNK_SIZE = 16
+MAX_CHUNK_SIZE = 16384
+INITIAL_CHUNK_SIZE = 64
+
+# Target time of one chunk processing (in seconds)
+TARGET_CHUNK_TIME = 0.05
+
+# Max number of chunks in flight per worker
+CHUNKS_PER_WORKER = 2
+
+# Serializer of the current worker process (see `_init_worker`)
+_worker_serializer = None
+
+
+class RowError:
+    """ Error raised while row was being prepared in the main process """
+
+    __slots__ = ('error',)
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def _init_worker(payload: bytes) -> None:
+    global _worker_serializer
+    _worker_serializer = pickle.loads(payload)
+
+
+def _handle_chunk(rows: List[Any], kwargs: dict) -> Tuple[List[tuple], float]:
+    """ Handle chunk in worker process. Returns `(result, error)` pairs and processing time """
+    start = time.perf_counter()
+    handle = _worker_serializer._handle_row
+
+    results = []
+    for row in rows:
+        if isinstance(row, RowError):
+            results.append((None, row.error))
+            continue
+
+        try:
+            results.append((handle(row, **kwargs), None))
+        except Exception as e:
+            results.append((None, e))
+
+    return results, time.perf_counter() - start
+
+
+class ChunkSizer:
+    """ Adapts chunk size to processing time """
+
+    def __init__(self, chunk_size: int = None) -> None:
+        self.size = chunk_size or INITIAL_CHUNK_SIZE
+        self._fixed = chunk_size is not None
+
+    def update(self, rows: int, elapsed: float) -> None:
+        if self._fixed or not rows:
+            return
+
+        estimate = int(rows / max(elapsed, 1e-6) * TARGET_CHUNK_TIME)
+        self.size = min(max((self.size + estimate) // 2, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+
+
+def _prepare_rows(serializer, items: Iterator[Any], size: int) -> List[Any]:
+    rows = []
+    for item in itertools.islice(items, size):
+        try:
+            rows.append(serializer._to_row(item))
+        except Exception as e:
+            rows.append(RowError(e))
+
+    return rows
+
+
+def _emit(serializer, offset: int, results: List[tuple], ordered: bool, with_errors: bool) -> Iterator[Any]:
+    """ Apply the same errors semantics as serial path """
+    for index, (result, error) in enumerate(results, offset):
+        if with_errors:
+            result = (result, error)
+
+        elif error is not None:
+            serializer._is_valid = False
+            if serializer._raise_exception:
+                raise error
+
+        yield result if ordered else (index, result)
+
+
+def handle_parallel(
+    serializer,
+    items: Iterable[Any],
+    max_workers: int = None,
+    chunk_size: int = None,
+    ordered: bool = True,
+    with_errors: bool = False,
+    mp_context=None,
+    **kwargs
+) -> Iterator[Any]:
+    """
+    Handle items by worker processes
+
+    Args:
+        serializer (BaseSerializer): serializer instance
+        items (Iterable): items to handle
+        max_workers (int): number of worker processes. By default, number of CPUs
+        chunk_size (int): fixed chunk size. By default, it's adapted to processing time
+        ordered (bool): yield results in order. Otherwise, yield `(index, result)` pairs as they complete
+        with_errors (bool): yield `(result, error)` pairs instead of raising errors
+        mp_context: multiprocessing context
+        kwargs: handler arguments (`as_dict`)
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    payload = pickle.dumps(serializer)
+    sizer = ChunkSizer(chunk_size)
+    items = iter(items)
+
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(payload,),
+    )
+
+    try:
+        pending = {}
+        finished = {}
+        submitted = 0
+        emitted = 0
+        offset = 0
+        exhausted = False
+
+        while True:
+            while not exhausted and len(pending) < max_workers * CHUNKS_PER_WORKER:
+                rows = _prepare_rows(serializer, items, sizer.size)
+                if not rows:
+                    exhausted = True
+                    break
+
+                future = executor.submit(_handle_chunk, rows, kwargs)
+                pending[future] = (submitted, offset)
+                submitted += 1
+                offset += len(rows)
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                number, chunk_offset = pending.pop(future)
+                results, elapsed = future.result()
+                sizer.update(len(results), elapsed)
+
+                if ordered:
+                    finished[number] = (chunk_offset, results)
+                else:
+                    yield from _emit(serializer, chunk_offset, results, ordered, with_errors)
+
+            while emitted in finished:
+                chunk_offset, results = finished.pop(emitted)
+                yield from _emit(serializer, chunk_offset, results, ordered, with_errors)
+                emitted += 1
+
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -1,8 +1,18 @@
-from typing import Union, Iterable
-
+import itertools
+from collections import namedtuple
+from typing import Any, Callable, Iterator, Sequence, Tuple, Union, Iterable
+
+from fusebox.orm.codegen import make_record_handler, make_row_handler
+from fusebox.orm.models import get_model_kind, make_dict_getter, make_values_getter
+from fusebox.orm.cursors import get_columns, infer_column_types, iter_cursor_batches, make_rows_handler
+from fusebox.orm.errors import ERROR_REQUIRED, ErrorTable
 from fusebox.orm.exceptions import UndeclaredField
 from fusebox.orm.fields import Field
 from fusebox.core.containers import FieldContainer
+from fusebox.core.profiling import ProfileReport
+from fusebox.core.records import Record, make_record_class
+from fusebox.core.writers import JsonWriter, ValueEncoder
+from fusebox.core.utils import iter_chunks
 from fusebox.orm import fields as fields_mod
 
 
@@ -11,22 +21,237 @@ __all__ = (
     'ModelSerializer',
 )
 
-from fusebox.orm.etc import SERIALIZER_FIELDS_MAPPING, SERIALIZER_META_MAIN_ATTRS
+from fusebox.orm.etc import (
+    SERIALIZER_FIELDS_MAPPING, SERIALIZER_META_MAIN_ATTRS,
+    SERIALIZER_ASYNC_CONCURRENCY, SERIALIZER_CURSOR_BATCH_SIZE, SERIALIZER_MAX_ERRORS,
+    SERIALIZER_SAMPLE_SIZE,
+)
+
+
+# Fields selected by `only` and `exclude`
+#   * items - tuple of (attribute name, field) pairs
+#   * fields - fields by their names
+#   * required - names of required fields
+#   * model_fields - model attributes that will be serialized (only for `ModelSerializer`)
+SchemaProjection = namedtuple('SchemaProjection', ('items', 'fields', 'required', 'model_fields'))
+
+
+class SerializerSchema:
+    """
+    Serializer's schema. It's built once, when serializer class is created,
+    and caches fields projections by `only` and `exclude` arguments
+    """
+
+    def __init__(self, serializer_class: type, meta_info: dict = None) -> None:
+        items = []
+        for name, field in serializer_class.__dict__.items():
+            if isinstance(field, Field):
+                if field.name is None:
+                    field.name = name
+
+                items.append((name, field))
+
+        self.items = tuple(items)
+        self.model_fields = meta_info.get('fields') if meta_info else None
+
+        self._projections = {}
+        self._guessed_fields = {}
+        self._row_handlers = {}
+        self._record_handlers = {}
+        self._model_kinds = {}
+        self._values_getters = {}
+        self._column_fields = {}
+
+    def project(
+        self,
+        only: Union[tuple[str], list[str]] = None,
+        exclude: Union[tuple[str], list[str]] = None
+    ) -> SchemaProjection:
+        """
+        Get fields projection
+
+        Args:
+            only (list|tuple): list of values that will be displayed, unspecified will be ignored
+            exclude (list|tuple):
+        """
+        # Fast lookup by arguments themselves, if they're hashable
+        try:
+            return self._projections[(only, exclude)]
+        except (KeyError, TypeError):
+            pass
+
+        key = (frozenset(only) if only else None, frozenset(exclude) if exclude else None)
+        projection = self._projections.get(key)
+        if projection is not None:
+            self._cache_projection(only, exclude, projection)
+            return projection
+
+        items = self.items
+        if exclude:
+            items = tuple((k, v) for (k, v) in items if k not in exclude)
+
+        elif only:
+            items = tuple((k, v) for (k, v) in items if k in only)
+
+        model_fields = None
+        if self.model_fields is not None:
+            model_fields = frozenset(
+                k for k in self.model_fields
+                if (not only or k in only) and (not exclude or k not in exclude)
+            )
+
+        projection = SchemaProjection(
+            items=items,
+            fields={f.name: f for (_, f) in items},
+            required=tuple(f.name for (_, f) in items if f.required),
+            model_fields=model_fields,
+        )
+        self._projections[key] = projection
+        self._cache_projection(only, exclude, projection)
+        return projection
+
+    def _cache_projection(self, only, exclude, projection: SchemaProjection) -> None:
+        try:
+            self._projections[(only, exclude)] = projection
+        except TypeError:
+            # Lists can't be used as keys
+            pass
+
+    def row_handler(self, projection: SchemaProjection) -> Callable:
+        """
+        Get generated row handler for projection (see `make_row_handler`).
+        Handler is generated once for every projection
+        """
+        cached = self._row_handlers.get(id(projection))
+        if cached is not None and cached[0] is projection:
+            return cached[1]
+
+        handler = make_row_handler(projection)
+        self._row_handlers[id(projection)] = (projection, handler)
+        return handler
+
+    def record_handler(self, projection: SchemaProjection, record_class: type) -> Callable:
+        """
+        Get generated record handler for projection (see `make_record_handler`).
+        Handler is generated once for every projection
+        """
+        cached = self._record_handlers.get(id(projection))
+        if cached is not None and cached[0] is projection:
+            return cached[1]
+
+        handler = make_record_handler(projection, record_class)
+        self._record_handlers[id(projection)] = (projection, handler)
+        return handler
+
+    def _get_model_kind(self, model: object) -> Tuple[type, str, Callable]:
+        """ Get model class, its kind and dict getter. Kind is detected once for every class """
+        model_class = model if isinstance(model, type) else type(model)
+        cached = self._model_kinds.get(model_class)
+        if cached is None:
+            kind = get_model_kind(model)
+            cached = self._model_kinds[model_class] = (model_class, kind, make_dict_getter(model_class, kind))
+
+        return cached
+
+    def dict_getter(self, model: object) -> Callable[[object], dict]:
+        """ Get function that returns dict of model attributes """
+        return self._get_model_kind(model)[2]
+
+    def values_getter(self, model: object, names: Tuple[str, ...]) -> Callable[[object], tuple]:
+        """
+        Get function that returns model attributes by names (extraction plan).
+        It's built once for every model class and names
+        """
+        model_class, kind, _ = self._get_model_kind(model)
+        key = (model_class, names)
+        getter = self._values_getters.get(key)
+        if getter is None:
+            getter = self._values_getters[key] = make_values_getter(model_class, kind, names)
+
+        return getter
+
+    def column_field(self, name: str, value_type: type) -> Field:
+        """
+        Get nullable field for undeclared column by its values type.
+        Columns of unmapped types are passed through by `Field`.
+        Fields are created once for every name and type pair
+        """
+        key = (name, value_type)
+        try:
+            return self._column_fields[key]
+        except KeyError:
+            pass
+
+        field = getattr(fields_mod, SERIALIZER_FIELDS_MAPPING.get(value_type, ''), None) or Field
+        field = self._column_fields[key] = field(name=name, null=True)
+        return field
+
+    def guess_field(self, name: str, value_type: type) -> Union[Field, None]:
+        """
+        Guess nullable field class by value type (see `SERIALIZER_FIELDS_MAPPING`).
+        Lists, tuples and `None` are passed through, values of unmapped types aren't serialized.
+        Fields are created once for every name and type pair
+        """
+        key = (name, value_type)
+        try:
+            return self._guessed_fields[key]
+        except KeyError:
+            pass
+
+        field = getattr(fields_mod, SERIALIZER_FIELDS_MAPPING.get(value_type, ''), None)
+        if field:
+            field = field(name=name, null=True)
+
+        self._guessed_fields[key] = field
+        return field
 
 
 class BaseSerializer:
 
+    # Attributes that aren't pickled (see `__getstate__`)
+    _unpicklable_attrs: tuple = ('_data', '_record_class')
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._schema = cls._prepare_schema()
+
+    @classmethod
+    def _prepare_schema(cls) -> SerializerSchema:
+        """ Build class schema. It's called once, when class is created """
+        return SerializerSchema(cls)
+
     def __init__(
         self, *,
         as_field_dict: bool = False,
+        as_record: bool = False,
         raise_exception: bool = True,
         only: tuple[str, ...] = None,
         exclude: tuple[str, ...] = None
     ):
+        """
+        Args:
+            as_field_dict (bool): return `FieldContainer (-s)`
+            as_record (bool): return records (see `fusebox.core.records`) - compact tuples
+            with dict-like access, generated once for serializer's fields
+            raise_exception (bool): raise errors. Otherwise, failed items are `None`
+            only (list|tuple): list of values that will be displayed, unspecified will be ignored
+            exclude (list|tuple):
+        """
+        if as_field_dict and as_record:
+            raise AttributeError('cant use `as_field_dict` and `as_record` together')
+
         # Main preparations
+        self._projection: SchemaProjection = None
         self._fields: dict = None
+        self._required: tuple = ()
         self._prepare_fields(only, exclude)
 
+        self._as_record = as_record
+        self._record_class: type = self._get_record_class() if as_record else None
+
+        # Errors of the last `handle_collect` call
+        self._errors: ErrorTable = None
+
         # Flags
 
         self._is_valid = None
@@ -39,7 +264,7 @@ class BaseSerializer:
         exclude: Union[tuple[str], list[str]] = None
     ):
         """
-        Collect and prepare all fields in `Serializer`
+        Get prepared fields from class schema
 
         Args:
             only (list|tuple): list of values that will be displayed, unspecified will be ignored
@@ -48,23 +273,399 @@ class BaseSerializer:
         if only and exclude:
             raise AttributeError('cant use `only` and `exclude` together')
 
-        class_attrs_dict: dict = self.__class__.__dict__
+        projection = self._schema.project(only, exclude)
+        self._projection = projection
+        self._fields = projection.fields
+        self._required = projection.required
 
-        if exclude:
-            class_attrs_dict = {k: v for (k, v) in class_attrs_dict.items() if k not in exclude}
+    def _get_record_class(self) -> type:
+        """ Get record class of serializer's fields """
+        return make_record_class(f'{self.__class__.__name__}Record', tuple(self._fields))
 
-        elif only:
-            class_attrs_dict = {k: v for (k, v) in class_attrs_dict.items() if k in only}
+    def _handle_item(self, item: Any, as_dict: bool = False) -> Union[dict, FieldContainer]:
+        """ Handle one item (row or model). Errors are raised """
+        raise NotImplementedError('Method `_handle_item` must be implemented')
 
-        fields: list[Field] = []
-        for name, field in class_attrs_dict.items():
-            if isinstance(field, Field):
-                if field.name is None:
-                    field.name = name
+    def _get_items(self) -> Iterable[Any]:
+        """ Get items to handle """
+        raise NotImplementedError('Method `_get_items` must be implemented')
 
-                fields.append(field)
+    async def _ahandle_item(self, item: Any, as_dict: bool = False) -> Union[dict, FieldContainer]:
+        """ Async version of method `_handle_item` """
+        raise NotImplementedError('Method `_ahandle_item` must be implemented')
 
-        self._fields = {f.name: f for f in fields}
+    def _is_single(self) -> bool:
+        """ Serializer was created for one item """
+        raise NotImplementedError('Method `_is_single` must be implemented')
+
+    def _collect_item(self, item: Any, row: int, errors: ErrorTable, as_dict: bool = False) -> Any:
+        """
+        Handle one item without raising errors of its fields, they're added to the table
+
+        Returns:
+            result (Any): handled item or `None`, if errors were found
+        """
+        raise NotImplementedError('Method `_collect_item` must be implemented')
+
+    def _safe_handle(self, item: Any, **kwargs) -> Union[dict, FieldContainer, None]:
+        try:
+            return self._handle_item(item, **kwargs)
+
+        except Exception as e:
+            self._is_valid = False
+            if self._raise_exception:
+                raise e
+
+    def _iter_with_errors(self, items: Iterable[Any], **kwargs) -> Iterator[tuple]:
+        handle = self._handle_item
+        for item in items:
+            try:
+                yield handle(item, **kwargs), None
+
+            except Exception as e:
+                self._is_valid = False
+                yield None, e
+
+    def handle_collect(
+        self,
+        items: Iterable[Any] = None,
+        max_errors: int = SERIALIZER_MAX_ERRORS,
+        **kwargs
+    ) -> Tuple[list, ErrorTable]:
+        """
+        Handle items and collect errors instead of raising them.
+        Values are handled by `Field.try_parse`, so errors are returned by fields,
+        and every item is handled once. Errors of items iterable itself
+        (and of items that can't be read, f.e. not models) aren't collected, they're raised
+
+        Args:
+            items (Iterable): items to handle. By default, serializer's data or models
+            max_errors (int): max number of stored errors (`None` - no limit)
+            kwargs: handler arguments (`as_dict`)
+
+        Returns:
+            results (list): results, `None` for failed items
+            errors (ErrorTable): errors table
+        """
+        if items is None:
+            items = self._get_items()
+
+        errors = ErrorTable(max_errors)
+        collect = self._collect_item
+        results = [collect(item, row, errors, **kwargs) for (row, item) in enumerate(items)]
+        if errors:
+            self._is_valid = False
+
+        self._errors = errors
+        return results, errors
+
+    @property
+    def errors(self) -> Union[ErrorTable, None]:
+        """ Errors of the last `handle_collect` call """
+        return self._errors
+
+    async def ahandle(
+        self,
+        items: Iterable[Any] = None,
+        concurrency: int = SERIALIZER_ASYNC_CONCURRENCY,
+        with_errors: bool = False,
+        **kwargs
+    ) -> Union[list, dict, FieldContainer, None]:
+        """
+        Handle items concurrently. Async fields are awaited,
+        sync fields are handled inline
+
+        Args:
+            items (Iterable): items to handle. By default, serializer's data or models
+            concurrency (int): max number of items handled at the same time
+            with_errors (bool): return `(result, error)` pairs instead of raising errors
+            kwargs: handler arguments (`as_dict`)
+
+        Returns:
+            results (list): list of results or one result, like method `handle` does
+        """
+        # Event loop is running, so `asyncio` is already imported
+        import asyncio
+
+        single = items is None and self._is_single()
+        if items is None:
+            items = self._get_items()
+
+        if not any(field.is_async for field in self._fields.values()):
+            if with_errors:
+                results = list(self._iter_with_errors(items, **kwargs))
+            else:
+                results = [self._safe_handle(i, **kwargs) for i in items]
+
+            return results[0] if single else results
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def handle(item: Any) -> Any:
+            async with semaphore:
+                try:
+                    result = await self._ahandle_item(item, **kwargs)
+
+                except Exception as e:
+                    self._is_valid = False
+                    if with_errors:
+                        return None, e
+                    if self._raise_exception:
+                        raise e
+                    return None
+
+                return (result, None) if with_errors else result
+
+        tasks = [asyncio.ensure_future(handle(i)) for i in items]
+        try:
+            results = await asyncio.gather(*tasks)
+
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        return results[0] if single else results
+
+    def iter_handle(
+        self,
+        items: Iterable[Any] = None,
+        chunk_size: int = None,
+        with_errors: bool = False,
+        **kwargs
+    ) -> Iterator:
+        """
+        Handle items lazily, one by one. Items can be any iterable -
+        list, generator, `csv.DictReader`, DB cursor, etc.
+
+        Args:
+            items (Iterable): items to handle. By default, serializer's data or models
+            chunk_size (int): yield lists of `chunk_size` results
+            with_errors (bool): yield `(result, error)` pairs instead of raising errors
+            kwargs: handler arguments (`as_dict`)
+        """
+        if items is None:
+            items = self._get_items()
+
+        if with_errors:
+            results = self._iter_with_errors(items, **kwargs)
+        else:
+            results = (self._safe_handle(i, **kwargs) for i in items)
+
+        if chunk_size:
+            return iter_chunks(results, chunk_size)
+
+        return results
+
+    def dump(
+        self,
+        file: Any,
+        items: Iterable[Any] = None,
+        output_format: str = 'ndjson',
+        buffer_size: int = None,
+        encoder: ValueEncoder = None,
+        binary: bool = None,
+        **kwargs
+    ) -> int:
+        """
+        Handle items lazily and write results to file as NDJSON or JSON array (see `JsonWriter`).
+        Failed items (if `raise_exception` is disabled) are written as `null`
+
+        Args:
+            file: text or binary file-like object
+            items (Iterable): items to handle. By default, serializer's data or models
+            output_format (str): `ndjson` or `json`
+            buffer_size (int): size of writer buffer (in characters)
+            encoder (ValueEncoder): encoder of dates, fractions, arrays, etc.
+            binary (bool): write bytes (see `JsonWriter`)
+            kwargs: handler arguments
+
+        Returns:
+            count (int): number of written rows
+        """
+        options = {'output_format': output_format, 'encoder': encoder, 'binary': binary}
+        if buffer_size is not None:
+            options['buffer_size'] = buffer_size
+
+        with JsonWriter(file, **options) as writer:
+            return writer.write_many(self.iter_handle(items, **kwargs))
+
+    def _get_column_fields(self, columns: Sequence[str], rows: Sequence[tuple]) -> list:
+        """ Get fields of columns. Fields of undeclared columns are inferred by rows values """
+        for name in self._required:
+            if name not in columns:
+                raise KeyError(f'Input data doesnt contain field {name}'
+                               f' ({self._fields[name].__class__.__name__})')
+
+        fields = []
+        for name, column_type in zip(columns, infer_column_types(columns, rows)):
+            field = self._fields.get(name)
+            if field is None:
+                field = self._schema.column_field(name, column_type)
+            fields.append(field)
+
+        return fields
+
+    def _iter_batches(
+        self,
+        columns: Sequence[str],
+        batches: Iterable[Sequence[tuple]],
+        with_errors: bool = False,
+        as_dict: bool = False
+    ) -> Iterator:
+        handle_row = None
+        for batch in batches:
+            if handle_row is None:
+                fields = self._get_column_fields(columns, batch)
+                record_class = None
+                if self._as_record:
+                    record_class = make_record_class(
+                        f'{self.__class__.__name__}Record', tuple(field.name for field in fields)
+                    )
+                handle_row = make_rows_handler(fields, self._as_field_dict, as_dict, record_class)
+
+            for row in batch:
+                try:
+                    result = handle_row(row)
+
+                except Exception as e:
+                    self._is_valid = False
+                    if with_errors:
+                        yield None, e
+                        continue
+
+                    if self._raise_exception:
+                        raise e
+                    result = None
+
+                yield (result, None) if with_errors else result
+
+    def iter_rows(
+        self,
+        description: Sequence[Sequence[Any]],
+        rows: Iterable[tuple],
+        batch_size: int = SERIALIZER_CURSOR_BATCH_SIZE,
+        with_errors: bool = False,
+        **kwargs
+    ) -> Iterator:
+        """
+        Handle rows (tuples) by columns description.
+        Columns are mapped to fields by names, fields of undeclared columns are inferred by the first batch
+
+        Args:
+            description (Sequence): `cursor.description` or sequence of columns like `(name, ...)`
+            rows (Iterable): rows
+            batch_size (int): size of the first batch to infer fields
+            with_errors (bool): yield `(result, error)` pairs instead of raising errors
+            kwargs: handler arguments (`as_dict`)
+        """
+        return self._iter_batches(get_columns(description), iter_chunks(rows, batch_size), with_errors, **kwargs)
+
+    def iter_cursor(
+        self,
+        cursor: Any,
+        batch_size: int = SERIALIZER_CURSOR_BATCH_SIZE,
+        with_errors: bool = False,
+        **kwargs
+    ) -> Iterator:
+        """
+        Handle rows of executed DB-API cursor. Rows are fetched by `fetchmany`
+
+        >>> cursor = connection.execute('SELECT id, username, email FROM users')
+        >>> for user in UserSerializer().iter_cursor(cursor):
+        >>>     ...
+
+        Args:
+            cursor: executed DB-API cursor
+            batch_size (int): number of rows fetched at once
+            with_errors (bool): yield `(result, error)` pairs instead of raising errors
+            kwargs: handler arguments (`as_dict`)
+        """
+        columns = get_columns(cursor.description)
+        return self._iter_batches(columns, iter_cursor_batches(cursor, batch_size), with_errors, **kwargs)
+
+    def _to_row(self, item: Any) -> Any:
+        """ Prepare item to be sent to worker process """
+        return item
+
+    def _handle_row(self, row: Any, **kwargs) -> Union[dict, FieldContainer]:
+        """ Handle row, prepared by method `_to_row` """
+        return self._handle_item(row, **kwargs)
+
+    def handle_parallel(
+        self,
+        items: Iterable[Any] = None,
+        max_workers: int = None,
+        chunk_size: int = None,
+        ordered: bool = True,
+        with_errors: bool = False,
+        mp_context=None,
+        **kwargs
+    ) -> Iterator:
+        """
+        Handle items by worker processes (see `fusebox.orm.parallel`).
+        Serializer class must be importable by workers
+
+        Args:
+            items (Iterable): items to handle. By default, serializer's data or models
+            max_workers (int): number of worker processes. By default, number of CPUs
+            chunk_size (int): fixed chunk size. By default, it's adapted to processing time
+            ordered (bool): yield results in order. Otherwise, yield `(index, result)` pairs as they complete
+            with_errors (bool): yield `(result, error)` pairs instead of raising errors
+            mp_context: multiprocessing context
+            kwargs: handler arguments (`as_dict`)
+        """
+        if items is None:
+            items = self._get_items()
+
+        # Process pool (`concurrent.futures`, `multiprocessing`) is imported on the first call
+        from fusebox.orm.parallel import handle_parallel
+
+        return handle_parallel(
+            self, items,
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+            ordered=ordered,
+            with_errors=with_errors,
+            mp_context=mp_context,
+            **kwargs
+        )
+
+    def enable_profiling(self) -> None:
+        """
+        Enable profiling of serializer's fields (see `fusebox.core.profiling`).
+        Fields are declared in class, so they're profiled for all instances of serializer class
+        """
+        for field in self._fields.values():
+            field.enable_profiling()
+
+    def disable_profiling(self) -> None:
+        """ Disable profiling of serializer's fields """
+        for field in self._fields.values():
+            field.disable_profiling()
+
+    def profile_report(self) -> ProfileReport:
+        """ Stats of profiled fields, the hottest fields first """
+        return ProfileReport(
+            (field.stats for field in self._fields.values() if field.stats is not None),
+            labels={'serializer': self.__class__.__name__},
+        )
+
+    def __getstate__(self) -> dict:
+        """ Input data isn't pickled, so serializer can be sent to worker processes """
+        state = self.__dict__.copy()
+        for name in self._unpicklable_attrs:
+            state.pop(name, None)
+
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        for name in self._unpicklable_attrs:
+            self.__dict__.setdefault(name, None)
+
+        if self._as_record:
+            self._record_class = self._get_record_class()
 
     def __repr__(self):
         return f'({self.__class__.__name__}) <id: {id(self)}>'
@@ -97,10 +698,17 @@ class ModelSerializer(BaseSerializer):
         >>> }
     """
 
+    _unpicklable_attrs = ('_data', '_record_class', '_model', '_model_dict', '_values_getters')
+
     @classmethod
-    def __new__(cls, *args, **kwargs):
-        cls._meta_info = cls._prepare_meta_info()
-        return super().__new__(cls)
+    def _prepare_schema(cls) -> SerializerSchema:
+        # Serializer without meta can be declared, but can't be initialized
+        try:
+            cls._meta_info = cls._prepare_meta_info()
+        except AttributeError:
+            cls._meta_info = None
+
+        return SerializerSchema(cls, cls._meta_info)
 
     @classmethod
     def _prepare_meta_info(cls) -> dict:
@@ -121,8 +729,12 @@ class ModelSerializer(BaseSerializer):
         many: bool = False,
         **kwargs,
     ):
-        self._model = model or self._meta_info.get('model')
+        if self._meta_info is None:
+            self._prepare_meta_info()
+
+        self._model = model if model is not None else self._meta_info.get('model')
         self._model_dict = {}
+        self._values_getters = {}
         self._many = many
         self._data = data
 
@@ -132,18 +744,12 @@ class ModelSerializer(BaseSerializer):
 
     def _get_model_dict(self, model) -> dict:
         """
-        Get dict from model
+        Get dict from model (see `fusebox.orm.models`)
 
         Args:
             model (object):
         """
-        model_attr_dict = {}
-        if hasattr(model, '__values__'):
-            model_attr_dict = model.__values__
-
-        elif hasattr(model, '_sa_instance_state'):
-            model_attr_dict = model._sa_instance_state.dict
-
+        model_attr_dict = self._schema.dict_getter(model)(model)
         if model_attr_dict:
             return model_attr_dict
 
@@ -168,88 +774,178 @@ class ModelSerializer(BaseSerializer):
         if only and exclude:
             raise AttributeError('Cant use `only` and `exclude` together')
 
+        projection = self._schema.project(only, exclude)
         fields: list[Field] = []
 
         if self._meta_info.get('model'):
-            self._model_dict = self._get_model_dict(self._model) or {}
-            self._model_dict = {k: v for (k, v) in self._model_dict.items() if k in self._meta_info.get('fields')}
-
-            if only:
-                self._model_dict = {k: v for (k, v) in self._model_dict.items() if k in only}
-
-            if exclude:
-                self._model_dict = {k: v for (k, v) in self._model_dict.items() if k not in exclude}
-
-            if self._model_dict:
-                # We're not setting value here, only adding
-                for name, value in self._model_dict.items():
-                    # Guessing field class by its type
-                    field = SERIALIZER_FIELDS_MAPPING.get(type(value))
-                    field: Union[Field, None] = getattr(fields_mod, field, None)
-                    if field:
-                        field = field(name=name)
-                        fields.append(field)
+            model_fields = projection.model_fields
+            samples = [self._get_model_dict(i) for i in self._get_sample_models()]
+            if samples:
+                self._model_dict = {k: v for (k, v) in samples[0].items() if k in model_fields}
+
+            # We're not setting value here, only adding.
+            # Field class is guessed by type of the first not `None` value of attribute
+            names = tuple(self._model_dict)
+            rows = [tuple(i.get(k) for k in names) for i in samples]
+            for name, value_type in zip(names, infer_column_types(names, rows)):
+                field = self._schema.guess_field(name, value_type)
+                if field:
+                    fields.append(field)
 
         field_names = tuple(i.name for i in fields)
-        class_attrs_dict: dict = self.__class__.__dict__
 
-        if exclude:
-            class_attrs_dict = {k: v for (k, v) in class_attrs_dict.items() if k not in exclude}
-
-        elif only:
-            class_attrs_dict = {k: v for (k, v) in class_attrs_dict.items() if k in only}
-
-        for name, field in class_attrs_dict.items():
-            if name not in field_names and isinstance(field, Field):
+        for name, field in projection.items:
+            if name not in field_names:
                 if name not in self._model_dict:
                     if not self._meta_info.get('ignore_undeclared_fields'):
                         raise UndeclaredField(name)
 
-                if field.name is None:
-                    field.name = name
-
                 fields.append(field)
 
         self._fields = {f.name: f for f in fields}
+        self._required = tuple(f.name for f in fields if f.required)
+        self._parsers = tuple((f.name, f.parse) for f in self._fields.values())
+
+    def _get_sample_models(self) -> Sequence[object]:
+        """ Get models to guess fields by (up to `SERIALIZER_SAMPLE_SIZE` first models) """
+        if not self._many:
+            return () if self._model is None else (self._model,)
+
+        if isinstance(self._model, (list, tuple)):
+            return self._model[:SERIALIZER_SAMPLE_SIZE]
+
+        # Peek the first models and put them back
+        iterator = iter(self._model)
+        samples = tuple(itertools.islice(iterator, SERIALIZER_SAMPLE_SIZE))
+        self._model = itertools.chain(samples, iterator)
+        return samples
+
+    def _get_items(self) -> Iterable[object]:
+        return self._model if self._many else (self._model,)
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        self._model_dict = {}
+        self._values_getters = {}
+
+    def _get_values(self, model: object) -> tuple:
+        """ Get values of fields from model by its class extraction plan """
+        getter = self._values_getters.get(model.__class__)
+        if getter is None:
+            getter = self._schema.values_getter(model, tuple(self._fields))
+            self._values_getters[model.__class__] = getter
+
+        return getter(model)
+
+    def _handle_item(self, model: object, as_dict: bool = False) -> Union[dict, FieldContainer]:
+        return self._handle_values(self._get_values(model), as_dict=as_dict)
+
+    def _collect_item(self, model: object, row: int, errors: ErrorTable, as_dict: bool = False) -> Any:
+        results = []
+        failed = False
+        for field, value in zip(self._fields.values(), self._get_values(model)):
+            result, error = field.try_parse(value)
+            if error is not None:
+                errors.add_error(row, field.name, error, value)
+                failed = True
+            results.append(result)
+
+        if failed:
+            return None
+
+        if self._as_field_dict:
+            field_dict = FieldContainer()
+            for field, value in zip(self._fields.values(), results):
+                field_dict.add(field.name, field, value)
+            return field_dict.as_dict(full_house=True) if as_dict else field_dict
+
+        if self._record_class is not None:
+            record = tuple.__new__(self._record_class, results)
+            return record.as_dict() if as_dict else record
+
+        return dict(zip(self._fields, results))
+
+    def _handle_values(self, values: Sequence[Any], as_dict: bool = False) -> Union[dict, FieldContainer]:
+        """ Handle values of fields in fields order """
+        if self._as_field_dict:
+            field_dict = FieldContainer()
+            for field, value in zip(self._fields.values(), values):
+                field_dict.add(field.name, field, field.parse(value))
+
+            if as_dict:
+                return field_dict.as_dict(full_house=True)
+
+            return field_dict
 
-    def _handle_model(self, as_dict: bool = False) -> Union[dict, FieldContainer]:
+        if self._record_class is not None:
+            record = tuple.__new__(self._record_class, [parse(value) for ((_, parse), value) in zip(self._parsers, values)])
+            return record.as_dict() if as_dict else record
+
+        return {name: parse(value) for ((name, parse), value) in zip(self._parsers, values)}
+
+    async def _ahandle_item(self, model: object, as_dict: bool = False) -> Union[dict, FieldContainer]:
+        if self._as_field_dict:
+            field_dict = FieldContainer()
+        else:
+            field_dict = {}
+
+        for field, value in zip(self._fields.values(), self._get_values(model)):
+            value = (await field.aparse(value)) if field.is_async else field.parse(value)
+
+            if self._as_field_dict:
+                field_dict.add(field.name, field, value)
+            else:
+                field_dict[field.name] = value
+
+        if as_dict and isinstance(field_dict, FieldContainer):
+            return field_dict.as_dict(full_house=True)
+
+        if self._record_class is not None and not as_dict:
+            return self._record_class.from_dict(field_dict)
+
+        return field_dict
+
+    def _is_single(self) -> bool:
+        return not self._many
+
+    def _to_row(self, model: object) -> tuple:
+        # Models are sent as tuples of fields values
+        return tuple(self._get_values(model))
+
+    def _handle_row(self, values: tuple, as_dict: bool = False) -> Union[dict, FieldContainer]:
+        return self._handle_values(values, as_dict=as_dict)
+
+    def _handle_model(self, model: object = None, as_dict: bool = False) -> Union[dict, FieldContainer]:
         """
         Main data handler
 
         Arguments:
+            model (object): model to handle. By default, serializer's model
             as_dict (bool): convert `FieldContainer (-s)` to dict
         """
-        try:
-            if self._as_field_dict:
-                field_dict = FieldContainer()
-            else:
-                field_dict = {}
+        return self._safe_handle(self._model if model is None else model, as_dict=as_dict)
 
-            # TODO: доделать
-            model_dict = self._model_dict
+    def _handle_many(self, models: Iterable[object], as_dict: bool = False) -> list:
+        """ Bulk handler. Values are extracted by model class plan """
+        get_values = self._get_values
+        handle_values = self._handle_values
 
-            for field in self._fields.values():
-                # TODO: it's kinda retarded way to set field's value
-                field.set(model_dict.get(field.name))
+        results = []
+        for model in models:
+            try:
+                results.append(handle_values(get_values(model), as_dict=as_dict))
 
-                if self._as_field_dict:
-                    field_dict[field.name] = field
-                else:
-                    field_dict[field.name] = field.value
+            except Exception as e:
+                self._is_valid = False
+                if self._raise_exception:
+                    raise e
+                results.append(None)
 
-            if as_dict and isinstance(field_dict, FieldContainer):
-                return field_dict.as_dict(full_house=True)
-
-            return field_dict
-
-        except Exception as e:
-            self._is_valid = False
-            if self._raise_exception:
-                raise e
+        return results
 
     def handle(self, **kwargs):
         if self._many:
-            return [self._handle_model(i, **kwargs) for i in self._model]
+            return self._handle_many(self._model, **kwargs)
         return self._handle_model(self._model, **kwargs)
 
     def create(self):
@@ -261,14 +957,159 @@ class ModelSerializer(BaseSerializer):
 
 class Serializer(BaseSerializer):
 
+    _unpicklable_attrs = ('_data', '_record_class', '_row_handler')
+
     def __init__(
         self, *,
         data: Union[dict, Iterable[dict]] = None,
+        compiled: bool = False,
         **kwargs
     ):
+        """
+        Args:
+            data (dict|Iterable[dict]): row or rows to handle
+            compiled (bool): handle rows by generated function, specialized to serializer's fields.
+            It's generated once for every class and `only`/`exclude` pair.
+            Can't be used with `as_field_dict`. Records (`as_record`) are always handled by generated function
+        """
         self._data = data
         super().__init__(**kwargs)
 
+        self._compiled = (compiled or self._as_record) and not self._as_field_dict
+        self._row_handler = None
+        if self._compiled:
+            self._row_handler = self._get_row_handler()
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        if self._compiled:
+            self._row_handler = self._get_row_handler()
+
+    def _get_row_handler(self) -> Callable:
+        if self._record_class is not None:
+            return self._schema.record_handler(self._projection, self._record_class)
+        return self._schema.row_handler(self._projection)
+
+    @classmethod
+    def get_row_source(
+        cls,
+        only: Union[tuple[str], list[str]] = None,
+        exclude: Union[tuple[str], list[str]] = None
+    ) -> str:
+        """ Get source of generated row handler """
+        return cls._schema.row_handler(cls._schema.project(only, exclude)).__source__
+
+    def _get_items(self) -> Iterable[dict]:
+        return (self._data,) if isinstance(self._data, dict) else self._data
+
+    def _is_single(self) -> bool:
+        return isinstance(self._data, dict)
+
+    def _collect_item(self, data: dict, row: int, errors: ErrorTable, as_dict: bool = False) -> Any:
+        if not isinstance(data, dict):
+            errors.add_error(row, None, TypeError(f'Row must be dict, not {type(data).__name__}'), data)
+            return None
+
+        failed = False
+        for name in self._required:
+            if not data.get(name):
+                errors.add(row, name, ERROR_REQUIRED, f'Input data doesnt contain field {name}', data.get(name))
+                failed = True
+
+        results = []
+        for key, value in data.items():
+            field: Field = self._fields.get(key)
+            if field is None:
+                errors.add_error(row, key, UndeclaredField(key), value)
+                failed = True
+                continue
+
+            result, error = field.try_parse(value)
+            if error is not None:
+                errors.add_error(row, field.name, error, value)
+                failed = True
+            results.append((field, result))
+
+        if failed:
+            return None
+
+        if self._as_field_dict:
+            field_dict = FieldContainer()
+            for field, value in results:
+                field_dict.add(field.name, field, value)
+            return field_dict.as_dict(full_house=True) if as_dict else field_dict
+
+        field_dict = {field.name: value for (field, value) in results}
+        if self._record_class is not None:
+            record = self._record_class.from_dict(field_dict)
+            return record.as_dict() if as_dict else record
+
+        return field_dict
+
+    def _check_required(self, data: dict) -> None:
+        for field_name in self._required:
+            if not data.get(field_name):
+                raise KeyError(f'Input data doesnt contain field {field_name}'
+                               f' ({self._fields[field_name].__class__.__name__})')
+
+    def _handle_item(self, data: dict, as_dict: bool = False) -> Union[dict, FieldContainer, Record]:
+        if self._row_handler is not None:
+            if as_dict and self._record_class is not None:
+                return self._row_handler(data).as_dict()
+            return self._row_handler(data)
+
+        if self._as_field_dict:
+            field_dict = FieldContainer()
+        else:
+            field_dict = {}
+
+        self._check_required(data)
+
+        for key, value in data.items():
+            field: Field = self._fields.get(key)
+            if field.required is True and key not in self._fields:
+                raise KeyError
+
+            value = field.parse(value)
+
+            if self._as_field_dict:
+                field_dict.add(field.name, field, value)
+            else:
+                field_dict[field.name] = value
+
+        if as_dict and isinstance(field_dict, FieldContainer):
+            return field_dict.as_dict(full_house=True)
+
+        return field_dict
+
+    async def _ahandle_item(self, data: dict, as_dict: bool = False) -> Union[dict, FieldContainer]:
+        if self._as_field_dict:
+            field_dict = FieldContainer()
+        else:
+            field_dict = {}
+
+        self._check_required(data)
+
+        for key, value in data.items():
+            field: Field = self._fields.get(key)
+            if field.required is True and key not in self._fields:
+                raise KeyError
+
+            value = (await field.aparse(value)) if field.is_async else field.parse(value)
+
+            if self._as_field_dict:
+                field_dict.add(field.name, field, value)
+            else:
+                field_dict[field.name] = value
+
+        if as_dict and isinstance(field_dict, FieldContainer):
+            return field_dict.as_dict(full_house=True)
+
+        if self._record_class is not None and not as_dict:
+            return self._record_class.from_dict(field_dict)
+
+        return field_dict
+
     def _handle_data(
         self,
         data: Union[Iterable[dict], dict],
@@ -280,38 +1121,7 @@ class Serializer(BaseSerializer):
         Arguments:
             as_dict (bool): convert `FieldContainer (-s)` to dict
         """
-        try:
-            if self._as_field_dict:
-                field_dict = FieldContainer()
-            else:
-                field_dict = {}
-
-            for field_name, field_inst in self._fields.items():
-                if field_inst.required and not data.get(field_name):
-                    raise KeyError(f'Input data doesnt contain field {field_name}'
-                                   f' ({field_inst.__class__.__name__})')
-
-            for key, value in data.items():
-                field: Field = self._fields.get(key)
-                if field.required is True and key not in self._fields:
-                    raise KeyError
-
-                field.set(value)
-
-                if self._as_field_dict:
-                    field_dict[field.name] = field
-                else:
-                    field_dict[field.name] = field.value
-
-            if as_dict and isinstance(field_dict, FieldContainer):
-                return field_dict.as_dict(full_house=True)
-
-            return field_dict
-
-        except Exception as e:
-            self._is_valid = False
-            if self._raise_exception:
-                raise e
+        return self._safe_handle(data, as_dict=as_dict)
 
     def handle(self, **kwargs):
         if isinstance(self._data, (tuple, list)):
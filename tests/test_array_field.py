@@ -0,0 +1,128 @@
+import array
+import pickle
+
+import pytest
+
+from fusebox.core.fields import ArrayField, IntegerField, FloatField, StringField
+from fusebox.core.exceptions import ArraySizeLimitError, HandlerError
+
+
+def test_array_size_limit():
+    field = ArrayField(child_field=IntegerField(), size=3)
+    assert field.parse('1,2,3') == [1, 2, 3]
+    assert field.parse('1,2') == [1, 2]
+
+    with pytest.raises(HandlerError, match='array size'):
+        field.parse('1,2,3,4')
+
+    field = ArrayField(child_field=IntegerField(), size=3, raise_exception=False, default=[])
+    assert field.parse(','.join(['1'] * 10000)) == []
+
+
+def test_array_batches():
+    value = ','.join(str(i) for i in range(2500))
+    field = ArrayField(child_field=IntegerField(), batch_size=100)
+    assert field.parse(value) == list(range(2500))
+
+    with pytest.raises(HandlerError):
+        field.parse('1,2,x')
+
+    field = ArrayField(child_field=IntegerField(raise_exception=False, default=0))
+    assert field.parse('1,x,3') == [1, 0, 3]
+
+
+def test_array_typed_output():
+    result = ArrayField(child_field=IntegerField(), output='array', batch_size=2).parse('1,2,3,4,5')
+    assert isinstance(result, array.array)
+    assert (result.typecode, result.tolist()) == ('q', [1, 2, 3, 4, 5])
+
+    result = ArrayField(child_field=FloatField(), output='array').parse('1.5,2')
+    assert (result.typecode, result.tolist()) == ('d', [1.5, 2.0])
+
+    # Failed items can't be stored in typed array
+    field = ArrayField(child_field=IntegerField(raise_exception=False), output='array')
+    with pytest.raises(HandlerError):
+        field.parse('1,x')
+
+    with pytest.raises(ValueError):
+        ArrayField(child_field=StringField(), output='array')
+
+    with pytest.raises(ValueError):
+        ArrayField(child_field=IntegerField(), output='set')
+
+
+def test_array_numpy_output():
+    np = pytest.importorskip('numpy')
+
+    result = ArrayField(child_field=FloatField(), output='numpy').parse('1.5,2,3')
+    assert result.dtype == np.float64
+    assert result.tolist() == [1.5, 2.0, 3.0]
+
+    with pytest.raises(HandlerError):
+        ArrayField(child_field=IntegerField(), output='numpy').parse('1,x')
+
+
+def test_array_iter_output():
+    field = ArrayField(child_field=StringField(), output='iter', batch_size=1)
+    for value in ('a,b,,c', 'long item,b', 'x', ',', 'ab,' * 10):
+        assert list(field.parse(value)) == value.split(',')
+
+    field = ArrayField(child_field=IntegerField(), output='iter', size=4, batch_size=1)
+    items = field.parse('1,2,3,4,5,6')
+    assert next(items) == 1
+
+    # Limit is checked lazily
+    with pytest.raises(ArraySizeLimitError):
+        list(items)
+
+
+def test_array_field_pickle():
+    field = ArrayField(child_field=IntegerField(), output='array', size=10)
+    restored = pickle.loads(pickle.dumps(field))
+    assert restored.parse('1,2').tolist() == [1, 2]
+    assert restored.size == 10
+
+
+def test_array_multiple_separators():
+    field = ArrayField(child_field=IntegerField(), multiple_separators=True)
+    assert field.parse('1,2-3@4') == [1, 2, 3, 4]
+
+    field = ArrayField(child_field=IntegerField(), multiple_separators=True, output='array', size=3)
+    assert field.parse('1,2-3').tolist() == [1, 2, 3]
+    with pytest.raises(HandlerError, match='array size'):
+        field.parse('1,2-3,4')
+
+
+def test_array_nested():
+    field = ArrayField(child_field=IntegerField(), separators=(',',), nested_separators=(';',))
+    assert field.parse('1,2;3,4') == [[1, 2], [3, 4]]
+    assert list(ArrayField(
+        child_field=IntegerField(), separators=(',',), nested_separators=(';',), output='iter'
+    ).parse('1,2;3')) == [[1, 2], [3]]
+
+    # Size limit counts items of the innermost level
+    field = ArrayField(child_field=IntegerField(), separators=(',',), nested_separators=(';',), size=3)
+    assert field.parse('1,2;3') == [[1, 2], [3]]
+    with pytest.raises(HandlerError, match='array size'):
+        field.parse('1,2;3,4')
+
+    with pytest.raises(ValueError):
+        ArrayField(child_field=IntegerField(), nested_separators=(';',), output='array')
+
+
+def test_array_quotes():
+    field = ArrayField(child_field=StringField(), separators=(',',), quote='"', escape='\\')
+    assert field.parse('"a,b",c\\,d') == ['a,b', 'c,d']
+    assert pickle.loads(pickle.dumps(field)).parse('"a,b",c') == ['a,b', 'c']
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'multiple_separators': True},
+    {'nested_separators': (';',)},
+    {'quote': '"'},
+], ids=['split', 'multiple', 'nested', 'quotes'])
+@pytest.mark.parametrize('value', ['', '  '])
+def test_array_empty_string(kwargs, value):
+    assert ArrayField(child_field=IntegerField(), **kwargs).parse(value) == []
+    assert list(ArrayField(child_field=IntegerField(), output='iter', **kwargs).parse(value)) == []
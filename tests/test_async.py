@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from fusebox.core.fields import Field, IntegerField
+from fusebox.core.handlers import IAsyncHandler, Mapper
+from fusebox.core.validators import IAsyncValidator, RangeValidator
+from fusebox.core.exceptions import ValidationError
+from fusebox.orm.fields import StringField, IntegerField as OrmIntegerField
+from fusebox.orm.serializers import Serializer
+
+
+class FakeGeocoder:
+    """ Local fake of async cache service """
+
+    def __init__(self, data: dict) -> None:
+        self.data = data
+        self.active = 0
+        self.max_active = 0
+
+    async def get(self, key):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        return self.data.get(key)
+
+
+class GeocodeHandler(IAsyncHandler):
+
+    def __init__(self, service: FakeGeocoder) -> None:
+        self.service = service
+
+    async def handle(self, value):
+        return await self.service.get(value)
+
+
+class UniqueValidator(IAsyncValidator):
+
+    def __init__(self) -> None:
+        self.seen = set()
+
+    async def validate(self, value):
+        await asyncio.sleep(0)
+        if value in self.seen:
+            raise ValidationError('Value is not unique.')
+        self.seen.add(value)
+
+
+def test_sync_field_aparse():
+    field = IntegerField()
+    assert not field.is_async
+    assert asyncio.run(field.aparse('10')) == 10
+
+
+def test_async_field():
+    service = FakeGeocoder({'msk': 'Moscow'})
+    field = Field(handlers=[Mapper({'MSK': 'msk'}), GeocodeHandler(service)])
+    assert field.is_async
+    assert asyncio.run(field.aparse('MSK')) == 'Moscow'
+    assert asyncio.run(field.aset('MSK')) == 'Moscow'
+    assert field.value == 'Moscow'
+
+    with pytest.raises(TypeError):
+        field.parse('MSK')
+
+
+def test_async_method_and_validators():
+    async def method(value):
+        await asyncio.sleep(0)
+        return value + '0'
+
+    field = IntegerField(method=method, validators=[RangeValidator(0, 100), UniqueValidator()])
+    assert asyncio.run(field.aparse('4')) == 40
+
+    with pytest.raises(ValidationError):
+        asyncio.run(field.aparse('4'))
+
+    with pytest.raises(ValidationError):
+        asyncio.run(field.aparse('400'))
+
+    field = IntegerField(validators=[UniqueValidator()], raise_exception=False, default=-1)
+    assert asyncio.run(field.aparse('1')) == 1
+    assert asyncio.run(field.aparse('1')) == -1
+
+
+def test_serializer_ahandle():
+    service = FakeGeocoder({f'city{i}': f'City {i}' for i in range(100)})
+
+    class AddressSerializer(Serializer):
+        city = StringField(handlers=[GeocodeHandler(service)], required=True)
+        house = OrmIntegerField()
+
+    rows = [{'city': f'city{i}', 'house': str(i)} for i in range(100)]
+    results = asyncio.run(AddressSerializer(data=rows).ahandle(concurrency=10))
+
+    assert results == [{'city': f'City {i}', 'house': i} for i in range(100)]
+    assert 1 < service.max_active <= 10
+
+    result = asyncio.run(AddressSerializer(data=rows[0]).ahandle())
+    assert result == {'city': 'City 0', 'house': 0}
+
+
+def test_serializer_ahandle_errors():
+    class NumberSerializer(Serializer):
+        number = OrmIntegerField(validators=[UniqueValidator()])
+
+    rows = [{'number': '1'}, {'number': '1'}, {'number': '2'}]
+    with pytest.raises(ValidationError):
+        asyncio.run(NumberSerializer(data=rows).ahandle())
+
+    class OtherNumberSerializer(Serializer):
+        number = OrmIntegerField(validators=[UniqueValidator()])
+
+    results = asyncio.run(OtherNumberSerializer().ahandle(rows, with_errors=True, concurrency=1))
+    assert results[0] == ({'number': 1}, None)
+    assert isinstance(results[1][1], ValidationError)
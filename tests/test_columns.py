@@ -0,0 +1,52 @@
+import sys
+import math
+
+import pytest
+
+from fusebox.core.etc import STATUS_OK, STATUS_NULL, STATUS_ERROR
+from fusebox.core.fields import IntegerField, FloatField
+from fusebox.core.validators import RangeValidator
+
+
+def test_float_column():
+    np = pytest.importorskip('numpy')
+
+    values = ['1,5', '4 3/2', '-.5', '1e3', 'abc', None, 2.5, '0.1', '123456789.123456789']
+    field = FloatField(raise_exception=False)
+    results, statuses = field.process_array(values)
+
+    assert results.dtype == np.float64
+    assert list(statuses) == [
+        STATUS_OK, STATUS_OK, STATUS_OK, STATUS_OK,
+        STATUS_ERROR, STATUS_NULL, STATUS_OK, STATUS_OK, STATUS_OK
+    ]
+    assert math.isnan(results[4]) and math.isnan(results[5])
+
+    # Same values as the scalar path
+    expected, _ = field.process_batch(values)
+    for index in (0, 1, 2, 3, 6, 7, 8):
+        assert results[index] == expected[index]
+
+
+def test_integer_column():
+    np = pytest.importorskip('numpy')
+
+    field = IntegerField(raise_exception=False, default=-1)
+    results, statuses = field.process_array([' 12 ', '+7', '-3', '1.5', 4.0, ''])
+    assert results.dtype == np.int64
+    assert results.tolist() == [12, 7, -3, -1, 4, -1]
+    assert list(statuses) == [STATUS_OK, STATUS_OK, STATUS_OK, STATUS_ERROR, STATUS_OK, STATUS_ERROR]
+
+    # Fields with validators use the scalar path
+    field = IntegerField(raise_exception=False, validators=[RangeValidator(0, 10)])
+    results, statuses = field.process_array(['5', '50'])
+    assert results[0] == 5 and list(statuses) == [STATUS_OK, STATUS_ERROR]
+
+
+def test_column_without_numpy(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'numpy', None)
+
+    field = FloatField()
+    assert field.set('1,5') == 1.5
+    with pytest.raises(ImportError):
+        field.process_array(['1,5'])
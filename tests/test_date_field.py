@@ -0,0 +1,29 @@
+import datetime
+
+from fusebox.core.etc import EUROPEAN_DATE_FORMAT, DATE_INFERENCE_SAMPLE_SIZE
+from fusebox.core.fields import DateField
+
+
+def test_date_field_paths():
+    field = DateField(input_formats=[EUROPEAN_DATE_FORMAT])
+    assert field.set('05.04.2020') == datetime.datetime(2020, 4, 5)
+    assert field.set('2020-04-05T10:11:12') == datetime.datetime(2020, 4, 5, 10, 11, 12)
+    assert field.set('date: 2020/04/05') == datetime.datetime(2020, 4, 5)
+    assert field.parse_stats == {'format': 1, 'iso': 1, 'inferred': 0, 'fuzzy': 1}
+
+
+def test_date_field_inference():
+    field = DateField()
+    values = [f'{month:02}/{day:02}/2020' for month in range(1, 13) for day in range(1, 29)]
+
+    results = [field.set(value) for value in values]
+    assert field.inferred_format == '%m/%d/%Y'
+
+    stats = field.parse_stats
+    assert stats['fuzzy'] == DATE_INFERENCE_SAMPLE_SIZE
+    assert stats['inferred'] == len(values) - DATE_INFERENCE_SAMPLE_SIZE
+
+    # Same results as `dateutil` fuzzy parsing
+    fuzzy_field = DateField(infer_format=False)
+    assert results == [fuzzy_field.set(value) for value in values]
+    assert fuzzy_field.parse_stats['fuzzy'] == len(values)
@@ -0,0 +1,12 @@
+import pytest
+
+from fusebox.core.fields import IntegerField
+from fusebox.core.exceptions import HandlerError
+
+
+def test_handler_error_follows_raise_exception():
+    assert issubclass(HandlerError, ValueError)
+    assert IntegerField(raise_exception=False, default=-1).set('abc') == -1
+
+    with pytest.raises(HandlerError):
+        IntegerField().set('abc')
@@ -0,0 +1,44 @@
+import datetime
+
+import pytest
+
+from fusebox.core.etc import DEFAULT_FROM_INPUT, STATUS_OK, STATUS_NULL, STATUS_SKIP, STATUS_ERROR
+from fusebox.core.exceptions import HandlerError, NullValueError
+from fusebox.core.fields import IntegerField, FloatField, StringField, DateField, ArrayField
+
+
+def test_process_batch():
+    field = IntegerField(skip_values=['-'], default=0, raise_exception=False)
+    results, statuses = field.process_batch(['1', None, '-', 'abc', 5])
+    assert results == [1, 0, 0, 0, 5]
+    assert list(statuses) == [STATUS_OK, STATUS_NULL, STATUS_SKIP, STATUS_ERROR, STATUS_OK]
+
+    field = FloatField(default=DEFAULT_FROM_INPUT(), raise_exception=False)
+    results, statuses = field.process_batch(['1,5', '4 3/2', 'abc'])
+    assert results == [1.5, 5.5, 'abc']
+    assert list(statuses) == [STATUS_OK, STATUS_OK, STATUS_ERROR]
+
+
+def test_process_batch_subclasses():
+    assert StringField().process_batch(['a', 1])[0] == ['a', '1']
+    assert ArrayField(child_field=IntegerField()).process_batch(['1,2'])[0] == [[1, 2]]
+
+    results, statuses = DateField().process_batch(['2020-04-05', 'not a date'])
+    assert results[0] == datetime.datetime(2020, 4, 5)
+    assert list(statuses) == [STATUS_OK, STATUS_ERROR]
+
+
+def test_set_many():
+    field = IntegerField(raise_exception=False, default=-1)
+    results, _ = field.set_many(['1', 'abc'])
+    assert field.value == results == [1, -1]
+
+    # Same rules as method `set`
+    assert field.set('abc') == -1
+
+    field = IntegerField()
+    with pytest.raises(HandlerError):
+        field.set_many(['1', 'abc'])
+
+    with pytest.raises(NullValueError):
+        field.set_many([None])
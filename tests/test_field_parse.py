@@ -0,0 +1,107 @@
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fusebox.core.etc import RAW_FIELDS, DEFAULT_FROM_INPUT
+from fusebox.core.fields import Field, IntegerField, ArrayField, DateField
+from fusebox.core.containers import FieldContainer
+from fusebox.core.exceptions import FieldNotReadyError, HandlerError, NullValueError
+from fusebox.orm.fields import StringField, IntegerField as OrmIntegerField
+from fusebox.orm.serializers import Serializer
+
+
+def test_parse_no_side_effects():
+    field = IntegerField()
+    assert field.parse('10') == 10
+
+    with pytest.raises(FieldNotReadyError):
+        field.value
+
+    with pytest.raises(HandlerError):
+        field.parse('abc')
+
+    assert IntegerField(raise_exception=False, default=-1).parse('abc') == -1
+    assert IntegerField(raise_exception=False, default=DEFAULT_FROM_INPUT()).parse('abc') == 'abc'
+
+
+def test_try_parse():
+    field = IntegerField()
+    assert field.try_parse('10') == (10, None)
+
+    value, error = field.try_parse(None)
+    assert value is None
+    assert isinstance(error, NullValueError)
+
+
+def test_array_field_child_untouched():
+    child = IntegerField()
+    field = ArrayField(child_field=child)
+    assert field.parse('1,2,3') == [1, 2, 3]
+
+    with pytest.raises(FieldNotReadyError):
+        child.value
+
+
+def test_container_values():
+    field = Field(name='name')
+    first = FieldContainer()
+    second = FieldContainer()
+    first['name'] = field
+    second['name'] = field
+
+    first.set('name', 'first')
+    second.set('name', 'second')
+    assert first.as_dict() == {'name': 'first'}
+    assert second.as_dict() == {'name': 'second'}
+
+    with pytest.raises(FieldNotReadyError):
+        field.value
+
+
+def test_serializer_threads():
+    class UserSerializer(Serializer):
+        username = StringField(required=True)
+        age = OrmIntegerField(required=True)
+
+    def handle(i):
+        return UserSerializer(data={'username': f'user{i}', 'age': str(i)}, as_field_dict=True).handle(as_dict=True)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(handle, range(2000)))
+
+    assert results == [{'username': f'user{i}', 'age': i} for i in range(2000)]
+
+
+def test_container_fields_bound():
+    field = Field(name='name')
+    container = FieldContainer()
+    container['name'] = field
+    container.set('name', 'first')
+
+    bound = container['name']
+    assert bound is not field
+    assert bound.value == 'first'
+    assert container['name'] is bound
+    assert container.get_field('name', RAW_FIELDS()) is bound
+    assert [i.value for i in container.values()] == ['first']
+    assert container.as_dict() == {'name': 'first'}
+
+    container.set('name', 'second')
+    assert dict(container.items())['name'].value == 'second'
+    assert bound.value == 'first'
+
+    with pytest.raises(FieldNotReadyError):
+        field.value
+
+
+def test_date_field_threads():
+    field = DateField()
+    values = [f'2021/03/{i % 28 + 1:02}' for i in range(400)]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(field.parse, values))
+
+    assert results == [datetime(2021, 3, i % 28 + 1) for i in range(400)]
+    assert field.inferred_format == '%Y/%m/%d'
+    assert field._format_votes is None
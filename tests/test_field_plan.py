@@ -0,0 +1,52 @@
+import pytest
+
+from fusebox.core.etc import DEFAULT_FROM_INPUT
+from fusebox.core.handlers import Mapper
+from fusebox.core.fields import Field, IntegerField, FloatField
+from fusebox.core.exceptions import HandlerError, NullValueError, SkipValueError
+from fusebox.core.validators import RangeValidator
+
+
+def test_plan_stages():
+    field = IntegerField()
+    # Plan is compiled on the first call
+    assert field._plan is None
+    assert field.parse('1') == 1
+    assert len(field._plan) == 1
+
+    # Fields without validators share plan
+    assert IntegerField()._get_plan() is field._plan
+
+    field = IntegerField(
+        handlers=[Mapper({'one': '1'}, default='0')],
+        validators=[RangeValidator(0, 10)]
+    )
+    assert field.set('one') == 1
+    assert len(field._plan) == 3
+
+
+def test_plan_skip_values():
+    field = Field(skip_values=['skip', 'me'], raise_exception=False, default='default')
+    assert isinstance(field._skip_lookup, frozenset)
+    assert field.set('skip') == 'default'
+    assert field.set('keep') == 'keep'
+    # Unhashable values fall back to plain lookup
+    assert field.set(['skip']) == ['skip']
+
+    field = Field(skip_values=[['skip']])
+    assert isinstance(field._skip_lookup, tuple)
+    with pytest.raises(SkipValueError):
+        field.set(['skip'])
+
+
+def test_plan_errors():
+    with pytest.raises(NullValueError):
+        IntegerField().set(None)
+
+    with pytest.raises(HandlerError):
+        FloatField().set('not a float')
+
+    field = IntegerField(null=True, skip_values=['-'], raise_exception=False, default=DEFAULT_FROM_INPUT())
+    assert field.set(None) is None
+    assert field.set('-') == '-'
+    assert field.value == '-'
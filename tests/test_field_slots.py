@@ -0,0 +1,119 @@
+import gc
+import pickle
+import tracemalloc
+
+import pytest
+
+from fusebox.core import fields
+from fusebox.core import profiling
+from fusebox.orm import fields as orm_fields
+
+
+def make_field(field_class, **kwargs):
+    if issubclass(field_class, fields.ArrayField):
+        kwargs['child_field'] = fields.IntegerField()
+    return field_class(**kwargs)
+
+
+class CustomField(fields.StringField):
+    def __init__(self, *, prefix: str = '', **kwargs):
+        self.prefix = prefix
+        super().__init__(**kwargs)
+
+
+class CustomOrmField(orm_fields.Field):
+    def __init__(self, *, prefix: str = '', **kwargs):
+        self.prefix = prefix
+        super().__init__(**kwargs)
+
+
+FIELD_CLASSES = [getattr(fields, i) for i in fields.__all__] + [getattr(orm_fields, i) for i in orm_fields.__all__]
+
+# Bytes allocated per constructed field (object, its slots values and plan)
+FIELD_FOOTPRINT_BUDGET = 320
+
+
+@pytest.mark.parametrize('field_class', FIELD_CLASSES, ids=lambda i: f'{i.__module__}.{i.__name__}')
+def test_fields_have_no_dict(field_class):
+    field = make_field(field_class, name='field')
+    assert not hasattr(field, '__dict__')
+
+    restored = pickle.loads(pickle.dumps(field))
+    assert type(restored) is type(field)
+    assert restored.name == 'field'
+
+
+@pytest.mark.parametrize('field_class', FIELD_CLASSES, ids=lambda i: f'{i.__module__}.{i.__name__}')
+def test_field_footprint(field_class):
+    count = 500
+    kwargs = {'child_field': fields.IntegerField()} if issubclass(field_class, fields.ArrayField) else {}
+
+    # Warm up caches
+    [field_class(**kwargs)._get_plan() for _ in range(5)]
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = [field_class(**kwargs) for _ in range(count)]
+        constructed = tracemalloc.get_traced_memory()[0]
+        for field in items:
+            field._get_plan()
+        compiled = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert (constructed - before) / count < FIELD_FOOTPRINT_BUDGET
+    # Plans without validators are shared, so compiled fields don't grow
+    assert (compiled - constructed) / count < 64
+
+
+def test_orm_fields_layout():
+    field = orm_fields.Field(required=True, name='field')
+    assert isinstance(field, orm_fields.Field)
+    assert field.required
+    assert type(field).__name__ == 'Field'
+
+    for name in ('StringField', 'IntegerField', 'FloatField', 'DateField', 'ArrayField'):
+        field_class = getattr(orm_fields, name)
+        assert issubclass(field_class, orm_fields.Field)
+        assert issubclass(field_class, getattr(fields, name))
+        assert field_class.__module__ == 'fusebox.orm.fields'
+
+    assert make_field(orm_fields.ArrayField, required=True).required
+
+
+def test_user_fields_keep_dict():
+    assert CustomField(prefix='a').prefix == 'a'
+
+    field = CustomOrmField(prefix='b', required=True)
+    assert (field.prefix, field.required) == ('b', True)
+    assert pickle.loads(pickle.dumps(field)).prefix == 'b'
+
+
+def test_repeated_instantiation_doesnt_grow():
+    slots = {i: i.__dict__.get('__slots__') for i in FIELD_CLASSES}
+    gc.collect()
+    registered = len(profiling._stats)
+
+    def make_fields():
+        return [make_field(i) for i in FIELD_CLASSES for _ in range(200)]
+
+    # Warm up caches
+    for _ in range(5):
+        make_fields()
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(5):
+            make_fields()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert {i: i.__dict__.get('__slots__') for i in FIELD_CLASSES} == slots
+    assert len(profiling._stats) == registered
+    assert after - before < 64 * 1024
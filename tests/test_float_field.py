@@ -0,0 +1,96 @@
+import pickle
+
+import pytest
+
+from fusebox.core.etc import STATUS_OK, STATUS_ERROR
+from fusebox.core.fields import FloatField
+from fusebox.core.numbers import NumberParser
+from fusebox.core.exceptions import HandlerError
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('1234.5', 1234.5),
+    ('1234,5', 1234.5),
+    (' -.5 ', -0.5),
+    ('1e3', 1000.0),
+    ('1,234', 1.234),
+    ('1,234,567.5', 1234567.5),
+    ('1.234.567,5', 1234567.5),
+    ('1.234.567', 1234567.0),
+    ('1 234 567,5', 1234567.5),
+    ('1 234,5', 1234.5),
+    ('3 1/2', 3.5),
+    ('-3 1/2', -3.5),
+    ('4 3/2', 5.5),
+    ('1/3', 1 / 3),
+    ('- 1 / 4', -0.25),
+])
+def test_float_formats(value, expected):
+    assert FloatField().parse(value) == expected
+
+
+@pytest.mark.parametrize('value', ['12a.5', '1.5 1/2', '1234 567', '1,2,3', '1/0', '1 2', ''])
+def test_float_invalid(value):
+    with pytest.raises(HandlerError):
+        FloatField().parse(value)
+
+
+def test_float_locales():
+    field = FloatField(locale='de')
+    assert field.parse('1.234,5') == 1234.5
+    assert field.parse('1234,5') == 1234.5
+    assert field.parse('1.234') == 1234.0
+    with pytest.raises(HandlerError):
+        field.parse('1.5')
+
+    field = FloatField(locale='en')
+    assert field.parse('1,234.5') == 1234.5
+    with pytest.raises(HandlerError):
+        field.parse('1,5')
+
+    assert FloatField(locale='fr').parse('1 234,5') == 1234.5
+    assert FloatField(locale='ch').parse("1'234.5") == 1234.5
+    assert FloatField(locale=(',', ('_',))).parse('1_234,5') == 1234.5
+
+    with pytest.raises(ValueError):
+        FloatField(locale='xx')
+
+
+def test_float_custom_separators():
+    field = FloatField(separators=(';',))
+    assert field.parse('1;5') == 1.5
+    assert field.parse('1.5') == 1.5
+    with pytest.raises(HandlerError):
+        field.parse('1,5')
+
+
+def test_number_parser():
+    with pytest.raises(ValueError):
+        NumberParser([])
+    with pytest.raises(ValueError):
+        NumberParser([(('..',), ())])
+
+    with pytest.raises(ValueError, match='zero denominator'):
+        NumberParser.from_locale().parse('1 1/0')
+
+    parser = NumberParser.from_locale('de')
+    assert (parser.decimal_separators, parser.dot_decimal) == ((',',), False)
+
+    # Parsers are shared by fields
+    assert NumberParser.from_locale((',', ['.'])) is NumberParser.from_locale((',', ('.',)))
+    assert FloatField()._parser is FloatField(separators=(',', '.'))._parser
+
+
+def test_float_field_pickle():
+    field = pickle.loads(pickle.dumps(FloatField(locale='de')))
+    assert field.parse('1.234,5') == 1234.5
+
+
+def test_float_locale_column():
+    pytest.importorskip('numpy')
+
+    field = FloatField(locale='de', raise_exception=False)
+    results, statuses = field.process_array(['1,5', '1.234,5', '1.5', '2'])
+    assert results[:2].tolist() == [1.5, 1234.5]
+    assert results[3] == 2.0
+    assert list(statuses) == [STATUS_OK, STATUS_OK, STATUS_ERROR, STATUS_OK]
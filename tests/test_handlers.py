@@ -0,0 +1,65 @@
+import pytest
+
+from fusebox.core.etc import INDEX_ALL
+from fusebox.core.fields import Field
+from fusebox.core.exceptions import RegexError
+from fusebox.core.handlers import Regex, RegexSet
+
+
+def test_regex():
+    field = Field(handlers=[Regex(r'([\w+\.]+)@([\w+\.]+)', index=INDEX_ALL())])
+    assert field.set('username1@mail.com') == ['username1', 'mail.com']
+
+
+def test_regex_set():
+    phone = RegexSet([r'\+7(\d{10})', r'8(\d{10})'])
+    assert phone.handle('tel: 89991234567') == '9991234567'
+    assert phone.match('tel: +79991234567') == (0, '9991234567')
+    assert phone.match('no phone') is None
+
+    with pytest.raises(RegexError):
+        phone.handle('no phone')
+
+    # The leftmost match wins
+    regex_set = RegexSet([r'(\d+)-(\d+)', r'(\w+)@(\w+)\.com'], index=INDEX_ALL())
+    assert regex_set.match('mail@host.com 10-20') == (1, ['mail', 'host'])
+
+    with pytest.raises(RegexError):
+        RegexSet([r'\d+', r'(\d+)'], index=1)
+
+    with pytest.raises(RegexError):
+        RegexSet([r'(a)\1'])
+
+
+def test_regex_set_patterns():
+    # The same group names in several patterns
+    regex_set = RegexSet([r'(?P<year>\d{4})-(?P<month>\d\d)', r'(?P<year>\d\d)/(?P=year)'], index=INDEX_ALL())
+    assert regex_set.match('2020-01') == (0, ['2020', '01'])
+    assert regex_set.match('12/12') == (1, ['12'])
+
+    # Escaped backslash, octal escapes and digits in character class aren't backreferences
+    assert RegexSet([r'a\\1(b)'], index=1).handle('a\\1b') == 'b'
+    assert RegexSet([r'\101([\1])'], index=1).handle('A\x01') == '\x01'
+
+    for patterns in ([r'(a)(?(1)b|c)'], [r'(?i)abc'], [r'(unclosed']):
+        with pytest.raises(RegexError):
+            RegexSet(patterns)
+
+
+def test_regex_set_column():
+    regex_set = RegexSet([r'(\w+)@(\w+)\.com', r'(\d+)-(\d+)'], index=INDEX_ALL())
+    values = ['a@b.com', '12-34', 'none']
+    assert regex_set.match_many(values) == [(0, ['a', 'b']), (1, ['12', '34']), None]
+    assert regex_set.handle_many(values[:2]) == [['a', 'b'], ['12', '34']]
+
+    # Scalar and column modes fail the same way
+    with pytest.raises(RegexError, match='none'):
+        regex_set.handle('none')
+    with pytest.raises(RegexError, match='none'):
+        regex_set.handle_many(values)
+
+    field = Field(handlers=[regex_set], raise_exception=False, default='-')
+    assert field.parse('none') == '-'
+
+    regex_set = RegexSet([r'(\w+)@(\w+)\.com', r'(\d+)-(\d+)'], index=0)
+    assert regex_set.handle_many(['x a@b.com', '1-2']) == ['a@b.com', '1-2']
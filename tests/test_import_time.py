@@ -0,0 +1,55 @@
+import os
+import sys
+import subprocess
+
+import fusebox
+
+
+# Max cumulative time of `import fusebox` (in microseconds)
+IMPORT_TIME_BUDGET = 50000
+
+# Dependencies that must be imported only on demand
+LAZY_MODULES = ('asyncio', 'dateutil', 'concurrent.futures', 'multiprocessing', 'dataclasses')
+
+
+def run_python(code: str, *options: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(fusebox.__file__)))
+    return subprocess.run(
+        [sys.executable, *options, '-c', code],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def get_import_time(module: str) -> int:
+    """ Get cumulative import time of module from `-X importtime` output """
+    output = run_python(f'import {module}', '-X', 'importtime').stderr
+    for line in output.splitlines():
+        _, _, cumulative, name = (i.strip() for i in line.replace(':', '|', 1).split('|'))
+        if name == module:
+            return int(cumulative)
+
+    raise AssertionError(f'module {module} not found in -X importtime output')
+
+
+def test_import_time_budget():
+    # The best of three runs, to skip cold disk cache
+    import_time = min(get_import_time('fusebox') for _ in range(3))
+    assert import_time < IMPORT_TIME_BUDGET
+
+
+def test_lazy_modules():
+    code = (
+        'import sys, fusebox, fusebox.orm.serializers;'
+        f'print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules))'
+    )
+    assert run_python(code).stdout.strip() == ''
+
+
+def test_lazy_names():
+    code = 'import sys, fusebox; print("fusebox.core.fields" in sys.modules)'
+    assert run_python(code).stdout.strip() == 'False'
+
+    assert fusebox.Serializer is fusebox.orm.serializers.Serializer
+    assert fusebox.IntegerField is fusebox.core.fields.IntegerField
+    assert 'DateField' in dir(fusebox)
+    assert set(fusebox.__all__) >= {'Field', 'Serializer', 'EmailValidator', 'JsonWriter'}
@@ -0,0 +1,78 @@
+import json
+import pickle
+
+import pytest
+
+from fusebox.core.fields import Field
+from fusebox.core.handlers import Mapper
+from fusebox.core.mappings import MappingIndex, MappedIndex
+
+
+def test_mapper():
+    field = Field(handlers=[Mapper({'Yes': True, 'No': False}, default=None, ignore_case=True)])
+    assert field.set('YES') is True
+    assert field.set('no') is False
+    assert field.set('None value') is None
+
+    mapper = Mapper({'Straße': 'street'}, ignore_case=True, normalize='NFC')
+    assert mapper.handle_many(['STRASSE', 'strasse', 'road']) == ['street', 'street', None]
+
+
+def test_mapping_index_files(tmp_path):
+    csv_path = tmp_path / 'cities.csv'
+    csv_path.write_text('alias,city\nMSK,Moscow\nSPb,Saint Petersburg\n', encoding='utf-8')
+    index = MappingIndex.from_csv(str(csv_path), key_column='alias', value_column='city', ignore_case=True)
+    assert index.get('msk') == 'Moscow'
+    assert len(index) == 2
+
+    json_path = tmp_path / 'codes.json'
+    json_path.write_text(json.dumps({'A1': {'id': 1}, 'B2': [2]}), encoding='utf-8')
+    index = MappingIndex.from_json(str(json_path))
+    assert index.get_many(['A1', 'B2', 'C3'], default=0) == [{'id': 1}, [2], 0]
+
+
+def test_mapped_index(tmp_path):
+    path = str(tmp_path / 'sku.idx')
+    mapping = {f'SKU-{i}': f'category-{i % 7}' for i in range(1000)}
+    mapping['Extra'] = {'nested': [1, 2]}
+    MappingIndex(mapping, ignore_case=True).save(path)
+
+    with MappedIndex(path) as index:
+        assert len(index) == 1001
+        assert index.get('sku-10') == 'category-3'
+        assert index.get('EXTRA') == {'nested': [1, 2]}
+        assert index.get('missing', 'default') == 'default'
+        assert 'Sku-999' in index
+
+        mapper = Mapper(index, default='unknown')
+        assert mapper.handle_many(['SKU-1', 'nope']) == ['category-1', 'unknown']
+
+        # Pickled index opens the same file
+        copy = pickle.loads(pickle.dumps(index))
+        assert copy.get('SKU-2') == 'category-2'
+        copy.close()
+
+
+def test_mapper_index_settings(tmp_path):
+    index = MappingIndex({'Yes': True}, ignore_case=True)
+    assert Mapper(index).handle('YES') is True
+    assert Mapper(index, ignore_case=True).handle('yes') is True
+
+    with pytest.raises(ValueError, match='ignore_case'):
+        Mapper(index, ignore_case=False)
+    with pytest.raises(ValueError, match='normalize'):
+        Mapper(index, normalize='NFC')
+
+    path = str(tmp_path / 'yes.idx')
+    index.save(path)
+    with MappedIndex(path) as mapped:
+        assert Mapper(mapped, ignore_case=True).handle('YES') is True
+        with pytest.raises(ValueError):
+            Mapper(mapped, normalize='NFKC')
+
+
+def test_normalize_after_casefold():
+    # Long s with combining acute is case-folded to 's' + U+0301, it's composed to 'ś' by NFC
+    index = MappingIndex({'\u015b': 1, 'ss': 2}, ignore_case=True, normalize='NFC')
+    assert index.get('\u017f\u0301') == 1
+    assert index.get('\u1e9e') == 2
@@ -0,0 +1,159 @@
+import dataclasses
+import datetime
+from collections import namedtuple
+
+import pytest
+
+from fusebox.orm.fields import *
+from fusebox.orm.serializers import *
+from fusebox.orm.models import (
+    get_model_kind, make_values_getter,
+    MODEL_DATACLASS, MODEL_NAMEDTUPLE, MODEL_OBJECT, MODEL_SLOTS, MODEL_SQLALCHEMY, MODEL_VALUES,
+)
+
+
+class State:
+    def __init__(self, values):
+        self.dict = values
+
+
+class SAUser:
+    """ SQLAlchemy-like model """
+
+    def __init__(self, i):
+        self._sa_instance_state = State({'id': i, 'username': f'user{i}', 'created': datetime.datetime(2020, 1, 1)})
+
+
+class ValuesUser:
+    def __init__(self, i):
+        self.__values__ = {'id': i, 'username': f'user{i}', 'created': datetime.datetime(2020, 1, 1)}
+
+
+@dataclasses.dataclass
+class DataUser:
+    id: int
+    username: str
+    created: datetime.datetime
+
+
+class SlotsUser:
+    __slots__ = ('id', 'username', 'created')
+
+    def __init__(self, i):
+        self.id = i
+        self.username = f'user{i}'
+        self.created = datetime.datetime(2020, 1, 1)
+
+
+class PlainUser:
+    def __init__(self, i):
+        self.id = i
+        self.username = f'user{i}'
+        self.created = datetime.datetime(2020, 1, 1)
+
+
+TupleUser = namedtuple('TupleUser', ('id', 'username', 'created'))
+
+
+def make_users(model_class, size):
+    if model_class in (DataUser, TupleUser):
+        return [model_class(i, f'user{i}', datetime.datetime(2020, 1, 1)) for i in range(size)]
+    return [model_class(i) for i in range(size)]
+
+
+@pytest.mark.parametrize('model_class, kind', [
+    (SAUser, MODEL_SQLALCHEMY),
+    (ValuesUser, MODEL_VALUES),
+    (DataUser, MODEL_DATACLASS),
+    (SlotsUser, MODEL_SLOTS),
+    (PlainUser, MODEL_OBJECT),
+    (TupleUser, MODEL_NAMEDTUPLE),
+])
+def test_model_kinds(model_class, kind):
+    users = make_users(model_class, 100)
+    assert get_model_kind(users[0]) == kind
+
+    class UserSerializer(ModelSerializer):
+        class Meta:
+            model = model_class
+            fields = ('id', 'username', 'created')
+
+    results = UserSerializer(users, many=True).handle()
+    assert results == [
+        {'id': i, 'username': f'user{i}', 'created': datetime.datetime(2020, 1, 1)}
+        for i in range(100)
+    ]
+
+
+def test_extraction_plan_cached():
+    class UserSerializer(ModelSerializer):
+        class Meta:
+            model = PlainUser
+            fields = ('id', 'username')
+
+    users = make_users(PlainUser, 3)
+    first = UserSerializer(users, many=True)
+    first.handle()
+    second = UserSerializer(users, many=True)
+    second.handle()
+
+    assert first._values_getters[PlainUser] is second._values_getters[PlainUser]
+    assert first._fields['id'] is second._fields['id']
+
+
+def test_values_getter_missing():
+    getter = make_values_getter(PlainUser, MODEL_OBJECT, ('id', 'missing'))
+    assert getter(PlainUser(1)) == (1, None)
+
+    getter = make_values_getter(TupleUser, MODEL_NAMEDTUPLE, ('username',))
+    assert getter(TupleUser(1, 'name', None)) == ('name',)
+
+
+def test_many_empty():
+    class UserSerializer(ModelSerializer):
+        class Meta:
+            model = PlainUser
+            fields = ('id',)
+
+    assert UserSerializer([], many=True).handle() == []
+
+
+def test_many_array_attributes():
+    @dataclasses.dataclass
+    class Post:
+        id: int
+        tags: list
+        point: tuple
+
+    class PostSerializer(ModelSerializer):
+        class Meta:
+            model = Post
+            fields = ('id', 'tags', 'point')
+
+    posts = [Post(1, ['a', 'b'], (1, 2)), Post(2, [], (3, 4))]
+    assert PostSerializer(posts, many=True).handle() == [
+        {'id': 1, 'tags': ['a', 'b'], 'point': (1, 2)},
+        {'id': 2, 'tags': [], 'point': (3, 4)},
+    ]
+
+
+@pytest.mark.parametrize('reverse', [False, True])
+def test_many_leading_none(reverse):
+    @dataclasses.dataclass
+    class User:
+        id: int
+        name: str
+
+    class UserSerializer(ModelSerializer):
+        class Meta:
+            model = User
+            fields = ('id', 'name')
+
+    users = [User(1, None), User(2, 'bob')]
+    expected = [{'id': 1, 'name': None}, {'id': 2, 'name': 'bob'}]
+    if reverse:
+        users, expected = users[::-1], expected[::-1]
+
+    assert UserSerializer(users, many=True).handle() == expected
+    assert UserSerializer(iter(users), many=True).handle() == expected
+    assert UserSerializer(users, many=True)._fields['name'].__class__ is StringField
@@ -0,0 +1,116 @@
+import pickle
+
+import pytest
+
+from fusebox.core import profiling
+from fusebox.core.fields import IntegerField, FloatField
+from fusebox.core.validators import RangeValidator
+from fusebox.orm.fields import StringField, DateField
+from fusebox.orm import fields as orm_fields
+from fusebox.orm.serializers import Serializer
+
+
+class EventSerializer(Serializer):
+    name = StringField(required=True)
+    amount = orm_fields.IntegerField(raise_exception=False)
+    date = DateField()
+
+
+def test_field_profiling():
+    field = IntegerField(name='amount', raise_exception=False, validators=[RangeValidator(0, 100)])
+    assert field.stats is None
+
+    stats = field.enable_profiling()
+    for value in ('1', '2', 'x', None, '500'):
+        field.parse(value)
+
+    assert (stats.calls, stats.fast, stats.slow, stats.failures) == (5, 2, 3, 2)
+    assert stats.stages['process'].calls == 4 and stats.stages['process'].failures == 1
+    assert stats.stages['validators'].calls == 3 and stats.stages['validators'].failures == 1
+    assert stats.time > 0
+
+    restored = pickle.loads(pickle.dumps(field))
+    assert restored.stats is None and restored.parse('3') == 3
+
+    field.disable_profiling()
+    assert field.stats is None and field.parse('3') == 3
+
+
+def test_batch_profiling():
+    pytest.importorskip('numpy')
+
+    for field_class in (IntegerField, FloatField):
+        field = field_class(raise_exception=False)
+        stats = field.enable_profiling()
+        field.process_array(['1', '2', 'x', None])
+
+        assert (stats.calls, stats.fast, stats.slow, stats.failures) == (4, 2, 2, 1)
+        assert stats.stages['process'].calls == 3
+
+
+def test_global_profiling():
+    field = IntegerField(name='before')
+    try:
+        profiling.enable()
+        created = IntegerField(name='after')
+        field.parse('1')
+        created.parse('1')
+
+        names = {i.name for i in profiling.report()}
+        assert {'before', 'after'} <= names
+
+    finally:
+        profiling.disable()
+
+    assert field.stats is None and created.stats is None
+    assert not profiling.is_enabled()
+
+
+def test_serializer_profile_report():
+    serializer = EventSerializer()
+    serializer.enable_profiling()
+    try:
+        rows = [{'name': 'a', 'amount': '1', 'date': '2020-01-01'}, {'name': 'b', 'amount': 'x'}]
+        list(serializer.iter_handle(rows))
+
+        report = serializer.profile_report()
+        assert len(report) == 3
+        assert report.top(1)[0].time == max(i.time for i in report)
+
+        data = {i['field']: i for i in report.as_dict()['fields']}
+        assert data['amount']['calls'] == 2 and data['amount']['failures'] == 1
+        assert data['date']['calls'] == 1
+
+        text = report.as_prometheus()
+        assert '# TYPE fusebox_field_calls_total counter' in text
+        assert 'fusebox_field_calls_total{serializer="EventSerializer",field="amount",class="IntegerField"} 2' in text
+        assert 'stage="process"' in text
+
+        report.reset()
+        assert serializer.profile_report().as_dict()['total_time'] == 0
+
+    finally:
+        serializer.disable_profiling()
+
+    assert len(serializer.profile_report()) == 0
+
+
+def test_unprofiled_fields_not_registered():
+    registered = len(profiling._stats)
+    fields = [IntegerField() for _ in range(100)]
+    assert len(profiling._stats) == registered
+
+    field = fields[0]
+    stats = field.enable_profiling()
+    try:
+        profiling.enable()
+        assert all(i.stats is not None for i in fields)
+        assert field.stats is stats
+    finally:
+        profiling.disable()
+
+    # Timers are dropped by the next call
+    assert field.stats is None
+    field.parse('1')
+    assert stats.calls == 0 and field._stats is None
+    assert len(profiling.report()) == 0
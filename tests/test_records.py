@@ -0,0 +1,84 @@
+import json
+import pickle
+import sqlite3
+
+import pytest
+
+from fusebox.core.records import Record, make_record_class
+from fusebox.orm.fields import *
+from fusebox.orm.serializers import *
+from fusebox.orm.exceptions import UndeclaredField
+
+
+class RowSerializer(Serializer):
+    name = StringField(required=True)
+    amount = IntegerField()
+
+
+def test_record_class():
+    record_class = make_record_class('Row', ('name', 'amount', 'not valid', 'keys'))
+    assert make_record_class('Row', ('name', 'amount', 'not valid', 'keys')) is record_class
+
+    record = record_class._make(('a', 1, 2, 3))
+    assert isinstance(record, Record) and isinstance(record, tuple)
+    assert record['name'] == 'a' and record.amount == 1 and record['not valid'] == 2
+    assert record[0] == 'a' and record.get('missing', 0) == 0
+    assert record['keys'] == 3 and record.keys() == ('name', 'amount', 'not valid', 'keys')
+    assert dict(record) == record.as_dict() == {'name': 'a', 'amount': 1, 'not valid': 2, 'keys': 3}
+    assert json.loads(record.as_json()) == record.as_dict()
+    assert pickle.loads(pickle.dumps(record)) == record
+
+    with pytest.raises(KeyError):
+        record['missing']
+
+    with pytest.raises(ValueError):
+        record_class._make((1,))
+
+    with pytest.raises(ValueError):
+        make_record_class('Row', ('name', 'name'))
+
+
+def test_serializer_records():
+    rows = [{'name': 'a', 'amount': '1'}, {'name': 'b'}]
+    results = RowSerializer(data=rows, as_record=True).handle()
+
+    assert [i.as_dict() for i in results] == [{'name': 'a', 'amount': 1}, {'name': 'b', 'amount': None}]
+    assert type(results[0]).__name__ == 'RowSerializerRecord'
+    assert RowSerializer(data=rows[0], as_record=True).handle(as_dict=True) == {'name': 'a', 'amount': 1}
+
+    with pytest.raises(UndeclaredField):
+        RowSerializer(data={'name': 'a', 'extra': 1}, as_record=True).handle()
+
+    with pytest.raises(KeyError):
+        RowSerializer(data={'amount': 1}, as_record=True).handle()
+
+    with pytest.raises(AttributeError):
+        RowSerializer(as_field_dict=True, as_record=True)
+
+
+def test_serializer_records_pickle():
+    serializer = pickle.loads(pickle.dumps(RowSerializer(as_record=True)))
+    assert serializer.iter_handle([{'name': 'a'}]).__next__()['name'] == 'a'
+
+
+def test_model_serializer_records():
+    class User:
+        def __init__(self, i):
+            self.__values__ = {'id': i, 'username': f'user{i}'}
+
+    class UserModelSerializer(ModelSerializer):
+        class Meta:
+            model = User
+            fields = ('id', 'username')
+
+    results = UserModelSerializer([User(0), User(1)], many=True, as_record=True).handle()
+    assert [(i.id, i.username) for i in results] == [(0, 'user0'), (1, 'user1')]
+
+
+def test_cursor_records():
+    connection = sqlite3.connect(':memory:')
+    cursor = connection.execute("select 'a' as name, 1 as amount, 2.5 as price")
+
+    records = list(RowSerializer(as_record=True).iter_cursor(cursor))
+    assert records[0].as_dict() == {'name': 'a', 'amount': 1, 'price': 2.5}
+    connection.close()
@@ -0,0 +1,58 @@
+import pytest
+
+from fusebox.orm.fields import *
+from fusebox.core.validators import *
+from fusebox.orm.serializers import *
+from fusebox.orm.exceptions import UndeclaredField
+from fusebox.core.exceptions import ValidationError
+
+
+class UserSerializer(Serializer):
+    email = StringField(validators=[EmailValidator], required=True)
+    username = StringField(required=True)
+    age = IntegerField(validators=[RangeValidator(16, 75)])
+
+
+def test_row_source():
+    source = UserSerializer.get_row_source()
+    assert source.startswith('def handle_row(data):')
+    assert "'email'" in source and "'age'" in source
+
+    assert "'email'" not in UserSerializer.get_row_source(exclude=('email',))
+
+
+def test_compiled_same_results():
+    rows = [
+        {'email': 'email@email.com', 'username': 'user', 'age': '16'},
+        {'age': '20', 'username': 'user', 'email': 'email@email.com'},
+        {'email': 'email@email.com', 'username': 'user'},
+    ]
+    interpreted = UserSerializer(data=rows).handle()
+    compiled = UserSerializer(data=rows, compiled=True).handle()
+    assert compiled == interpreted
+    assert [list(i) for i in compiled] == [list(i) for i in interpreted]
+
+
+def test_compiled_errors():
+    with pytest.raises(KeyError):
+        UserSerializer(data={'email': 'email@email.com'}, compiled=True).handle()
+
+    with pytest.raises(AttributeError):
+        UserSerializer(data={'email': 'email@email.com', 'username': 'user', 'x': 1}, compiled=True).handle()
+
+    with pytest.raises(UndeclaredField):
+        UserSerializer(data={'email': 'email@email.com', 'username': 'user', 'x': 1}, compiled=True).handle()
+
+    with pytest.raises(ValidationError):
+        UserSerializer(data={'email': 'email@email.com', 'username': 'user', 'age': '100'}, compiled=True).handle()
+
+    serializer = UserSerializer(data={'email': 'email@email.com'}, compiled=True, raise_exception=False)
+    assert serializer.handle() is None
+
+
+def test_compiled_handler_cached():
+    first = UserSerializer(data={}, compiled=True)
+    second = UserSerializer(data={}, compiled=True)
+    assert first._row_handler is second._row_handler
+    # Field containers need interpreted path
+    assert UserSerializer(data={}, compiled=True, as_field_dict=True)._row_handler is None
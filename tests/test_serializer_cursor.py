@@ -0,0 +1,87 @@
+import sqlite3
+
+import pytest
+
+from fusebox.core.validators import RangeValidator
+from fusebox.core.exceptions import ValidationError
+from fusebox.orm.fields import *
+from fusebox.orm.serializers import *
+
+
+class UserSerializer(Serializer):
+    username = StringField(required=True)
+    age = IntegerField(validators=[RangeValidator(0, 150)])
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE users (id INTEGER, username TEXT, age TEXT, score REAL, avatar BLOB)')
+    connection.executemany(
+        'INSERT INTO users VALUES (?, ?, ?, ?, ?)',
+        [(i, f'user{i}', str(i % 100), i / 2, None) for i in range(2500)]
+    )
+    yield connection
+    connection.close()
+
+
+def test_iter_cursor(connection):
+    cursor = connection.execute('SELECT id, username, age, score, avatar FROM users ORDER BY id')
+    results = list(UserSerializer().iter_cursor(cursor, batch_size=1000))
+
+    assert len(results) == 2500
+    assert results[3] == {'id': 3, 'username': 'user3', 'age': 3, 'score': 1.5, 'avatar': None}
+
+
+def test_iter_cursor_fetchmany(connection):
+    class Cursor:
+        def __init__(self, cursor):
+            self.cursor = cursor
+            self.description = cursor.description
+            self.calls = []
+
+        def fetchmany(self, size):
+            self.calls.append(size)
+            return self.cursor.fetchmany(size)
+
+    cursor = Cursor(connection.execute('SELECT username FROM users'))
+    results = UserSerializer().iter_cursor(cursor, batch_size=1000)
+    next(results)
+    assert cursor.calls == [1000]
+
+    list(results)
+    assert cursor.calls == [1000, 1000, 1000, 1000]
+
+
+def test_iter_rows():
+    description = (('username', None), ('age', None))
+    rows = [('first', '1'), ('second', '200')]
+
+    with pytest.raises(ValidationError):
+        list(UserSerializer().iter_rows(description, rows))
+
+    results = list(UserSerializer().iter_rows(description, rows, with_errors=True))
+    assert results[0] == ({'username': 'first', 'age': 1}, None)
+    assert isinstance(results[1][1], ValidationError)
+
+    results = list(UserSerializer(as_field_dict=True).iter_rows(description, rows[:1], as_dict=True))
+    assert results == [{'username': 'first', 'age': 1}]
+
+
+def test_iter_rows_required():
+    with pytest.raises(KeyError):
+        list(UserSerializer().iter_rows((('age', None),), [('1',)]))
+
+    with pytest.raises(KeyError):
+        list(UserSerializer().iter_rows((('username', None),), [('',)]))
+
+
+def test_iter_rows_array_columns():
+    description = (('username', None), ('tags', None), ('point', None), ('data', None))
+    rows = [('first', ['x', 'y'], (1, 2), b'raw'), ('second', None, None, None)]
+
+    results = list(UserSerializer().iter_rows(description, rows))
+    assert results == [
+        {'username': 'first', 'tags': ['x', 'y'], 'point': (1, 2), 'data': b'raw'},
+        {'username': 'second', 'tags': None, 'point': None, 'data': None},
+    ]
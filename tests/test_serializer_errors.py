@@ -0,0 +1,101 @@
+import pytest
+
+from fusebox.orm.fields import *
+from fusebox.orm.serializers import *
+from fusebox.orm.errors import ErrorTable
+
+
+class RowSerializer(Serializer):
+    name = StringField(required=True)
+    amount = IntegerField()
+
+
+def test_handle_collect():
+    rows = [
+        {'name': 'a', 'amount': '1'},
+        {'name': 'b', 'amount': 'x'},
+        {'amount': '3'},
+        {'name': 'd', 'amount': '4', 'extra': 1},
+        {'name': 'e', 'amount': '5'},
+    ]
+    serializer = RowSerializer()
+    results, errors = serializer.handle_collect(rows)
+
+    assert results == [{'name': 'a', 'amount': 1}, None, None, None, {'name': 'e', 'amount': 5}]
+    assert serializer.errors is errors
+    assert errors.failed_rows == 3
+    assert not errors.truncated
+
+    by_row = errors.by_row()
+    assert [(i.field, i.code_name, i.value) for i in by_row[1]] == [('amount', 'handler_error', 'x')]
+    assert [(i.field, i.code_name) for i in by_row[2]] == [('name', 'required')]
+    assert [(i.field, i.code_name, i.value) for i in by_row[3]] == [('extra', 'undeclared_field', 1)]
+
+
+def test_handle_collect_handles_once():
+    calls = []
+
+    class CountingField(IntegerField):
+        def process(self, value):
+            calls.append(value)
+            return super().process(value)
+
+    class CountingSerializer(Serializer):
+        name = StringField(required=True)
+        amount = CountingField()
+
+    rows = [{'name': 'a', 'amount': '1'}, {'name': 'b', 'amount': 'x'}, {'amount': '3'}]
+    results, errors = CountingSerializer(as_record=True).handle_collect(rows, as_dict=True)
+
+    assert results == [{'name': 'a', 'amount': 1}, None, None]
+    assert calls == ['1', 'x', '3']
+    assert [(i.row, i.field, i.code_name) for i in errors] == [(1, 'amount', 'handler_error'), (2, 'name', 'required')]
+
+
+def test_handle_collect_max_errors():
+    rows = [{'name': str(i), 'amount': 'x'} for i in range(10)]
+    results, errors = RowSerializer().handle_collect(rows, max_errors=3)
+
+    assert results == [None] * 10
+    assert len(errors) == 3
+    assert errors.total == 10
+    assert errors.truncated
+    assert [i['row'] for i in errors.as_dicts()] == [0, 1, 2]
+
+
+def test_handle_collect_valid():
+    rows = [{'name': str(i), 'amount': str(i)} for i in range(5)]
+    serializer = RowSerializer(data=rows)
+    results, errors = serializer.handle_collect()
+
+    assert results == serializer.handle()
+    assert not errors and len(errors) == 0
+
+
+def test_model_handle_collect():
+    class User:
+        def __init__(self, i, age):
+            self.__values__ = {'id': i, 'age': age}
+
+    class UserModelSerializer(ModelSerializer):
+        class Meta:
+            model = User
+            fields = ('id', 'age')
+
+    users = [User(1, 10), User(2, 'old'), User(3, 30)]
+    results, errors = UserModelSerializer(users, many=True).handle_collect()
+
+    assert results[0] == {'id': 1, 'age': 10} and results[1] is None
+    assert isinstance(errors, ErrorTable)
+    assert [(i.row, i.field, i.code_name, i.value) for i in errors] == [(1, 'age', 'handler_error', 'old')]
+
+
+def test_handle_collect_iterator_error():
+    def rows():
+        yield {'name': 'a', 'amount': '1'}
+        yield {'name': 'b', 'amount': 'x'}
+        raise OSError('connection lost')
+
+    serializer = RowSerializer()
+    with pytest.raises(OSError, match='connection lost'):
+        serializer.handle_collect(rows())
@@ -0,0 +1,79 @@
+import multiprocessing
+import pickle
+
+import pytest
+
+from fusebox.core.handlers import Mapper, Regex
+from fusebox.core.validators import EmailValidator, RangeValidator
+from fusebox.core.exceptions import HandlerError
+from fusebox.orm.fields import *
+from fusebox.orm.serializers import *
+
+
+class RowSerializer(Serializer):
+    email = StringField(validators=[EmailValidator], required=True)
+    code = StringField(handlers=[Regex(r'(\d+)')])
+    city = StringField(handlers=[Mapper({'msk': 'Moscow'}, default='Unknown')])
+    age = IntegerField(validators=[RangeValidator(0, 150)])
+
+
+def get_rows(size):
+    return [
+        {'email': f'user{i}@mail.com', 'code': f'code-{i}', 'city': 'msk', 'age': str(i % 100)}
+        for i in range(size)
+    ]
+
+
+def test_serializer_pickle():
+    serializer = pickle.loads(pickle.dumps(RowSerializer(data=get_rows(2), compiled=True)))
+    assert serializer._data is None
+    assert serializer._row_handler is not None
+    assert serializer.iter_handle(get_rows(1)).__next__()['city'] == 'Moscow'
+
+
+def test_handle_parallel_ordered():
+    rows = get_rows(500)
+    expected = RowSerializer(data=rows).handle()
+    results = list(RowSerializer(data=rows).handle_parallel(max_workers=2, chunk_size=32))
+    assert results == expected
+
+
+def test_handle_parallel_spawn():
+    rows = get_rows(100)
+    context = multiprocessing.get_context('spawn')
+    results = RowSerializer(compiled=True).handle_parallel(rows, max_workers=2, ordered=False, mp_context=context)
+    results = sorted(results, key=lambda i: i[0])
+    assert [i[1] for i in results] == RowSerializer(data=rows).handle()
+
+
+def test_handle_parallel_errors():
+    rows = get_rows(50)
+    rows[10]['age'] = 'x'
+
+    with pytest.raises(HandlerError):
+        list(RowSerializer().handle_parallel(rows, max_workers=2))
+
+    results = list(RowSerializer(raise_exception=False).handle_parallel(rows, max_workers=2))
+    assert results[10] is None
+    assert results[11]['age'] == 11
+
+    results = list(RowSerializer().handle_parallel(rows, max_workers=2, with_errors=True))
+    assert isinstance(results[10][1], HandlerError)
+    assert results[0][1] is None
+
+
+class User:
+    def __init__(self, i):
+        self.__values__ = {'id': i, 'username': f'user{i}'}
+
+
+class UserModelSerializer(ModelSerializer):
+    class Meta:
+        model = User
+        fields = ('id', 'username')
+
+
+def test_model_serializer_parallel():
+    users = [User(i) for i in range(100)]
+    serializer = UserModelSerializer(users, many=True)
+    assert list(serializer.handle_parallel(max_workers=2)) == serializer.handle()
@@ -0,0 +1,90 @@
+import datetime
+
+import pytest
+
+from fusebox.orm.fields import *
+from fusebox.orm.serializers import *
+from fusebox.orm.exceptions import UndeclaredField
+
+
+class UserSerializer(Serializer):
+    email = StringField(required=True)
+    username = StringField()
+    age = IntegerField(required=True)
+
+
+def test_schema_built_once():
+    schema = UserSerializer._schema
+    assert [name for (name, _) in schema.items] == ['email', 'username', 'age']
+
+    first = UserSerializer(data={'email': 'a@a.com', 'age': '1'})
+    second = UserSerializer(data={'email': 'b@b.com', 'age': '2'})
+    assert first._fields is second._fields
+    assert first._required == ('email', 'age')
+    assert UserSerializer._schema is schema
+
+
+def test_schema_projections():
+    only = UserSerializer(only=('email', 'age'))
+    assert list(only._fields) == ['email', 'age']
+    # Cached by `only` and `exclude`
+    assert UserSerializer(only=['age', 'email'])._fields is only._fields
+
+    exclude = UserSerializer(exclude=('email',))
+    assert list(exclude._fields) == ['username', 'age']
+    assert exclude._required == ('age',)
+
+    with pytest.raises(AttributeError):
+        UserSerializer(only=('email',), exclude=('age',))
+
+
+def test_schema_required():
+    with pytest.raises(KeyError):
+        UserSerializer(data={'email': 'a@a.com'}).handle()
+
+    result = UserSerializer(data={'email': 'a@a.com', 'age': '5'}).handle()
+    assert result == {'email': 'a@a.com', 'age': 5}
+
+
+def test_model_serializer_schema():
+    class User:
+        """ Pseudo-model """
+        __values__ = {'id': 1, 'username': 'user', 'birth_day': datetime.datetime.now()}
+
+    class UserModelSerializer(ModelSerializer):
+        class Meta:
+            model = User
+            fields = ('id', 'username')
+
+        username = StringField()
+
+    assert UserModelSerializer._meta_info['fields'] == ('id', 'username')
+
+    first = UserModelSerializer()
+    second = UserModelSerializer()
+    assert list(first._fields) == ['id', 'username']
+    # Guessed fields are created once
+    assert first._fields['id'] is second._fields['id']
+
+    assert list(UserModelSerializer(exclude=('id',))._fields) == ['username']
+
+
+def test_model_serializer_meta():
+    class NoMetaSerializer(ModelSerializer):
+        pass
+
+    with pytest.raises(AttributeError):
+        NoMetaSerializer()
+
+    class User:
+        __values__ = {'id': 1}
+
+    class UndeclaredSerializer(ModelSerializer):
+        class Meta:
+            model = User
+            fields = ('id',)
+
+        email = StringField()
+
+    with pytest.raises(UndeclaredField):
+        UndeclaredSerializer()
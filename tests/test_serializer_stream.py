@@ -0,0 +1,70 @@
+import csv
+import io
+import itertools
+
+from fusebox.orm.fields import *
+from fusebox.orm.serializers import *
+from fusebox.core.exceptions import HandlerError
+
+
+class RowSerializer(Serializer):
+    name = StringField(required=True)
+    amount = IntegerField()
+
+
+def infinite_rows():
+    for i in itertools.count():
+        yield {'name': f'name{i}', 'amount': str(i)}
+
+
+def test_iter_handle_lazy():
+    results = RowSerializer().iter_handle(infinite_rows())
+    assert next(results) == {'name': 'name0', 'amount': 0}
+    assert next(results) == {'name': 'name1', 'amount': 1}
+
+
+def test_iter_handle_csv():
+    file = io.StringIO('name,amount\nfirst,1\nsecond,2\n')
+    results = list(RowSerializer().iter_handle(csv.DictReader(file)))
+    assert results == [{'name': 'first', 'amount': 1}, {'name': 'second', 'amount': 2}]
+
+
+def test_iter_handle_chunks():
+    chunks = RowSerializer(compiled=True).iter_handle(itertools.islice(infinite_rows(), 5), chunk_size=2)
+    assert [len(i) for i in chunks] == [2, 2, 1]
+
+    serializer = RowSerializer(data=[{'name': 'a'}, {'name': 'b'}])
+    assert list(serializer.iter_handle()) == serializer.handle()
+
+
+def test_iter_handle_errors():
+    rows = [{'name': 'a', 'amount': '1'}, {'name': 'b', 'amount': 'x'}, {'amount': '3'}]
+    results = list(RowSerializer().iter_handle(rows, with_errors=True))
+
+    assert results[0] == ({'name': 'a', 'amount': 1}, None)
+    assert results[1][0] is None and isinstance(results[1][1], HandlerError)
+    assert results[2][0] is None and isinstance(results[2][1], KeyError)
+
+    results = list(RowSerializer(raise_exception=False).iter_handle(rows))
+    assert results == [{'name': 'a', 'amount': 1}, None, None]
+
+
+def test_model_iter_handle():
+    class User:
+        def __init__(self, i):
+            self.__values__ = {'id': i, 'username': f'user{i}'}
+
+    class UserModelSerializer(ModelSerializer):
+        class Meta:
+            model = User
+            fields = ('id', 'username')
+
+    users = (User(i) for i in range(3))
+    serializer = UserModelSerializer(users, many=True)
+    assert serializer.handle() == [{'id': i, 'username': f'user{i}'} for i in range(3)]
+
+    serializer = UserModelSerializer(User(0))
+    assert serializer.handle() == {'id': 0, 'username': 'user0'}
+
+    results = serializer.iter_handle((User(i) for i in range(10)), chunk_size=4)
+    assert [len(i) for i in results] == [4, 4, 2]
@@ -0,0 +1,48 @@
+import pickle
+
+import pytest
+
+from fusebox.core.tokenizers import ArrayTokenizer
+
+
+def test_tokenizer_separators():
+    tokenizer = ArrayTokenizer([(',', '-', '--')])
+    assert tokenizer.split('1,2-3--4') == ['1', '2', '3', '4']
+    assert tokenizer.split('1,2-3', maxsplit=1) == ['1', '2-3']
+    assert tokenizer.split('') == ['']
+
+
+def test_tokenizer_nested():
+    tokenizer = ArrayTokenizer([';', ','])
+    assert tokenizer.depth == 2
+    assert tokenizer.split('1,2;3,4') == [['1', '2'], ['3', '4']]
+    assert tokenizer.split('1;;2') == [['1'], [''], ['2']]
+    assert tokenizer.split('1,2;3,4', maxsplit=2) == [['1', '2'], ['3,4']]
+
+    tokenizer = ArrayTokenizer(['|', ';', ','])
+    assert tokenizer.split('1,2;3|4') == [[['1', '2'], ['3']], [['4']]]
+
+
+def test_tokenizer_quotes_and_escapes():
+    tokenizer = ArrayTokenizer([';', ','], quote='"', escape='\\')
+    assert tokenizer.split('"a;b",c;d\\,e') == [['a;b', 'c'], ['d,e']]
+    assert tokenizer.split('"say \\"hi\\"",x') == [['say "hi"', 'x']]
+
+    with pytest.raises(ValueError, match='unclosed quote'):
+        tokenizer.split('"a,b')
+
+
+def test_tokenizer_errors():
+    with pytest.raises(ValueError):
+        ArrayTokenizer([])
+
+    with pytest.raises(ValueError):
+        ArrayTokenizer([',', ','])
+
+    with pytest.raises(ValueError):
+        ArrayTokenizer([','], quote=',')
+
+
+def test_tokenizer_pickle():
+    tokenizer = pickle.loads(pickle.dumps(ArrayTokenizer([';', ','], quote='"')))
+    assert tokenizer.split('"a;b",c;d') == [['a;b', 'c'], ['d']]
@@ -0,0 +1,106 @@
+import pickle
+import random
+
+import pytest
+
+from fusebox.core.fields import IntegerField
+from fusebox.core.exceptions import ValidationError
+from fusebox.core.validators import (
+    ValidatorChain,
+    RangeValidator,
+    CompareValidator,
+    RegexValidator,
+    MinLengthValidator,
+    MaxLengthValidator,
+)
+
+
+def run_validators(validators, value):
+    """ Reference: call validators one by one """
+    try:
+        for validator in validators:
+            validator.validate(value)
+    except Exception as e:
+        return type(e), str(e)
+
+
+def run_chain(chain, value):
+    try:
+        chain.validate(value)
+    except Exception as e:
+        return type(e), str(e)
+
+
+def test_chain_merges_bounds():
+    chain = ValidatorChain([
+        RangeValidator(0, 100),
+        CompareValidator(10, '>='),
+        CompareValidator(50, '<'),
+        RegexValidator(r'\d+'),
+        MinLengthValidator(10),
+        MaxLengthValidator(2),
+    ])
+    # Range and compares, regex, length validators
+    assert len(chain) == 3
+
+
+def test_chain_not_merged():
+    # Different types of bounds
+    chain = ValidatorChain([CompareValidator('a', '>'), CompareValidator(1, '>')])
+    assert len(chain) == 2
+
+    # Not expressible as bounds
+    chain = ValidatorChain([CompareValidator(1, '!='), CompareValidator(5, '<')])
+    assert len(chain) == 2
+
+
+def test_chain_same_errors():
+    validators = [
+        RangeValidator(-20, 20),
+        CompareValidator(-10, '>'),
+        CompareValidator(10, '=<'),
+        CompareValidator(5.5, '<'),
+    ]
+    chain = ValidatorChain(validators)
+    values = [random.randint(-30, 30) for _ in range(300)]
+    values += [random.uniform(-30, 30) for _ in range(100)]
+    values += [True, False, 5.0, 5.5, float('nan'), '1', None]
+
+    for value in values:
+        assert run_chain(chain, value) == run_validators(validators, value), value
+
+
+def test_chain_length_errors():
+    validators = [MinLengthValidator(8), MaxLengthValidator(2)]
+    chain = ValidatorChain(validators)
+
+    for value in ('', 'abc', 'abcdefgh', [1, 2, 3], (1,), 10, None):
+        assert run_chain(chain, value) == run_validators(validators, value), value
+
+
+def test_chain_pickle():
+    chain = pickle.loads(pickle.dumps(ValidatorChain([RangeValidator(0, 10), CompareValidator(5, '<')])))
+    chain.validate(4)
+    with pytest.raises(ValidationError):
+        chain.validate(7)
+
+
+def test_compare_validator_reusable():
+    with pytest.raises(ValueError):
+        CompareValidator(5, '~')
+
+    validator = CompareValidator(0, '>')
+    validator.validate(1)
+    with pytest.raises(ValidationError):
+        validator.validate(-1)
+    # Operators aren't exhausted after the first call
+    with pytest.raises(ValidationError):
+        validator.validate(-1)
+
+
+def test_field_uses_chain():
+    field = IntegerField(validators=[RangeValidator(0, 100), CompareValidator(50, '<')])
+    assert field.set('10') == 10
+
+    with pytest.raises(ValidationError):
+        field.set('75')
@@ -0,0 +1,119 @@
+import io
+import json
+import array
+import datetime
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from fusebox.core.records import make_record_class
+from fusebox.core.writers import JsonWriter, ValueEncoder
+from fusebox.orm.fields import *
+from fusebox.orm.serializers import *
+
+
+class EventSerializer(Serializer):
+    name = StringField(required=True)
+    date = DateField()
+
+
+def test_encoder():
+    value = {
+        'datetime': datetime.datetime(2020, 1, 2, 3, 4, 5),
+        'date': datetime.date(2020, 1, 2),
+        'fraction': Fraction(3, 4),
+        'decimal': Decimal('1.50'),
+        'array': array.array('i', [1, 2]),
+        'set': {1},
+    }
+    assert json.loads(json.dumps(value, default=ValueEncoder())) == {
+        'datetime': '2020-01-02T03:04:05',
+        'date': '2020-01-02',
+        'fraction': 0.75,
+        'decimal': '1.50',
+        'array': [1, 2],
+        'set': [1],
+    }
+
+    encoder = ValueEncoder(datetime_format='%d.%m.%Y', fraction_format='pair', decimal_format='float')
+    value = {'datetime': datetime.datetime(2020, 1, 2), 'fraction': Fraction(3, 4), 'decimal': Decimal('1.5')}
+    assert json.loads(json.dumps(value, default=encoder)) == {
+        'datetime': '02.01.2020', 'fraction': [3, 4], 'decimal': 1.5,
+    }
+
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=encoder)
+
+    with pytest.raises(ValueError):
+        ValueEncoder(fraction_format='unknown')
+
+
+def test_writer_ndjson():
+    record_class = make_record_class('Row', ('id', 'value'))
+    file = io.StringIO()
+    with JsonWriter(file, buffer_size=16) as writer:
+        writer.write({'id': 1})
+        assert writer.write_many([record_class._make((2, Fraction(1, 2))), None]) == 2
+
+    assert writer.count == 3
+    assert [json.loads(i) for i in file.getvalue().splitlines()] == [{'id': 1}, {'id': 2, 'value': 0.5}, None]
+
+    with pytest.raises(ValueError):
+        writer.write({'id': 4})
+
+
+def test_writer_json_array():
+    for rows in ([], [{'id': 1}], [{'id': i} for i in range(100)]):
+        file = io.BytesIO()
+        with JsonWriter(file, output_format='json', buffer_size=64) as writer:
+            writer.write_many(rows)
+        assert json.loads(file.getvalue()) == rows
+
+
+class TextWriter:
+    """ Text writer that isn't `io.TextIOBase` """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, chunk):
+        self.chunks.append(chunk)
+
+
+class BinaryWriter(TextWriter):
+    mode = 'wb'
+
+
+def test_writer_file_types(tmp_path):
+    for file, binary in ((TextWriter(), False), (BinaryWriter(), True), (io.StringIO(), False)):
+        with JsonWriter(file) as writer:
+            writer.write({'id': 1})
+        chunks = getattr(file, 'chunks', None) or [file.getvalue()]
+        assert all(isinstance(i, bytes if binary else str) for i in chunks)
+
+    file = TextWriter()
+    with JsonWriter(file, binary=True) as writer:
+        writer.write({'id': 1})
+    assert file.chunks == [b'{"id":1}\n']
+
+    path = tmp_path / 'rows.ndjson'
+    with open(path, 'wb') as file, JsonWriter(file) as writer:
+        writer.write({'id': 1})
+    assert path.read_bytes() == b'{"id":1}\n'
+
+
+def test_serializer_dump():
+    rows = [{'name': 'first', 'date': '2020-01-02'}, {'name': 'second'}]
+
+    file = io.StringIO()
+    assert EventSerializer(data=rows, as_record=True).dump(file, output_format='json') == 2
+    assert json.loads(file.getvalue()) == [
+        {'name': 'first', 'date': '2020-01-02T00:00:00'},
+        {'name': 'second', 'date': None},
+    ]
+
+    file = io.StringIO()
+    encoder = ValueEncoder(datetime_format='%d.%m.%Y')
+    EventSerializer(as_field_dict=True).dump(file, rows[:1], encoder=encoder)
+    assert json.loads(file.getvalue()) == {'name': 'first', 'date': '02.01.2020'}